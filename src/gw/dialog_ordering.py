@@ -0,0 +1,138 @@
+import asyncio
+import heapq
+import logging
+import threading
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+class DialogSequencer:
+    """Runs work per MSISDN in arrival order while letting different MSISDNs run concurrently.
+
+    A request takes a ticket when it arrives (ticket()), before its MSISDN is known, and submits its work
+    once parsed. The work is parked, holding no thread, until every earlier ticket has been submitted or
+    discarded (any of them may be for the same MSISDN) and every earlier request for its MSISDN has
+    finished. The thread that finishes a request runs the next one for that MSISDN; work unblocked by
+    another ticket goes to dispatch (called inline by default; a worker pool queues it for a worker).
+    """
+
+    def __init__(self, dispatch: Optional[Callable[[Callable[[], None]], None]] = None):
+        self.dispatch = dispatch
+        self._lock = threading.Lock()
+        self._next_ticket = 0
+        self._unsubmitted: Dict[int, None] = {}  # Tickets issued but not yet submitted, oldest first
+        self._parked: Dict[str, List[Tuple[int, Callable[[], None]]]] = {}  # msisdn -> heap of (ticket, work)
+        self._running: Set[str] = set()
+
+    def ticket(self) -> int:
+        """Arrival number of a request whose MSISDN is not known yet; submit() or discard() it later"""
+        with self._lock:
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            self._unsubmitted[ticket] = None
+            return ticket
+
+    def submit(self, ticket: Optional[int], msisdn: str, work: Callable[[], None]):
+        """Run work once it is this request's turn: right away on this thread if it already is, else later.
+        A request without a ticket arrives now."""
+        with self._lock:
+            if ticket is None:
+                ticket = self._next_ticket
+                self._next_ticket += 1
+                waited_for = False
+            else:
+                waited_for = next(iter(self._unsubmitted)) == ticket
+                del self._unsubmitted[ticket]
+            heapq.heappush(self._parked.setdefault(msisdn, []), (ticket, work))
+            # Only the oldest unsubmitted ticket holds work back; submitting it may free other MSISDNs
+            ready = self._ready(list(self._parked) if waited_for else [msisdn])
+        own = None
+        for item in ready:
+            if item[1] is work:
+                own = item
+            else:
+                self._dispatch(*item)
+        if own is not None:
+            self._run(*own)
+
+    def discard(self, ticket: int):
+        """Give up a ticket that will never be submitted (unreadable or rejected request)"""
+        with self._lock:
+            waited_for = next(iter(self._unsubmitted)) == ticket
+            del self._unsubmitted[ticket]
+            ready = self._ready(list(self._parked)) if waited_for else []
+        for item in ready:
+            self._dispatch(*item)
+
+    def _ready(self, msisdns: List[str]) -> List[Tuple[str, Callable[[], None]]]:
+        """Claim the parked work whose turn has come among these MSISDNs; called with the lock held"""
+        oldest_unsubmitted = next(iter(self._unsubmitted), None)
+        ready = []
+        for msisdn in msisdns:
+            parked = self._parked.get(msisdn)
+            if not parked or msisdn in self._running:
+                continue
+            if oldest_unsubmitted is not None and parked[0][0] > oldest_unsubmitted:
+                continue
+            ready.append((msisdn, heapq.heappop(parked)[1]))
+            self._running.add(msisdn)
+            if not parked:
+                del self._parked[msisdn]
+        return ready
+
+    def _dispatch(self, msisdn: str, work: Callable[[], None]):
+        if self.dispatch is None:
+            self._run(msisdn, work)
+        else:
+            self.dispatch(lambda: self._run(msisdn, work))
+
+    def _run(self, msisdn: str, work: Callable[[], None]):
+        while True:
+            try:
+                work()
+            except Exception:
+                logger.exception(f"Request for {msisdn} failed")
+            with self._lock:
+                self._running.discard(msisdn)
+                ready = self._ready([msisdn])
+            if not ready:
+                return
+            msisdn, work = ready[0]  # Hand over to the next request for this MSISDN on this thread
+
+    def pending(self) -> int:
+        """Number of MSISDNs with a request running or waiting."""
+        with self._lock:
+            return len(self._running | self._parked.keys())
+
+class AsyncDialogSequencer:
+    """asyncio counterpart of DialogSequencer for the streams front end; must be used from one event loop."""
+
+    def __init__(self):
+        self._waiters: Dict[str, Deque[asyncio.Future]] = {}
+
+    @asynccontextmanager
+    async def ordered(self, msisdn: str) -> AsyncIterator[None]:
+        """Wait until every earlier request for this MSISDN has finished."""
+        waiters = self._waiters.get(msisdn)
+        if waiters is None:
+            waiters = self._waiters[msisdn] = deque()
+        turn = asyncio.get_running_loop().create_future()
+        waiters.append(turn)
+        if len(waiters) == 1:
+            turn.set_result(None)
+        try:
+            await turn
+            yield
+        finally:
+            was_running = waiters[0] is turn
+            waiters.remove(turn)
+            if not waiters:
+                del self._waiters[msisdn]
+            elif was_running:
+                waiters[0].set_result(None)  # Hand over to the next request for this MSISDN
+
+    def pending(self) -> int:
+        """Number of MSISDNs with a request running or waiting."""
+        return len(self._waiters)
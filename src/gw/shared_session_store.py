@@ -0,0 +1,209 @@
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+from src.gw.ussd_session_utils import SessionStore, USSDSession
+
+# Bump when the record layout changes; records of another version are treated as missing
+SESSION_RECORD_VERSION = 2
+
+def serialize_session(session: USSDSession) -> bytes:
+    """Encode a session as a compact positional JSON record with the packed menu record spliced in as-is"""
+    head = json.dumps([
+        SESSION_RECORD_VERSION,
+        session.session_id,
+        session.service_code,
+        session.start_time,
+        session.last_activity,
+        session.language,
+        session.session_data,
+    ], separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return head[:-1] + b"," + (session.menu_record or b"null") + b"]"
+
+def deserialize_session(msisdn: str, data: bytes) -> Optional[USSDSession]:
+    """Rebuild a session from serialize_session output; the engine is unpacked from menu_record on first use"""
+    record = json.loads(data)
+    if record[0] != SESSION_RECORD_VERSION:
+        return None
+    _, session_id, service_code, start_time, last_activity, language, session_data, menu_record = record
+    session = USSDSession(msisdn, session_id, service_code)
+    session.start_time = start_time
+    session.last_activity = last_activity
+    session.language = language
+    session.session_data = session_data
+    if menu_record is not None:
+        session.menu_record = json.dumps(menu_record, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    session.is_new_session = False
+    return session
+
+class KeyValueBackend(ABC):
+    """Minimal networked key-value contract: versioned blobs with an absolute expiry time."""
+
+    @abstractmethod
+    def get(self, key: str, known_version: Optional[int] = None) -> Optional[Tuple[int, Optional[bytes]]]:
+        """Return (version, value), or None if missing/expired; value is None when version == known_version"""
+
+    @abstractmethod
+    def put(self, key: str, value: bytes, expires_at: float) -> int:
+        """Store the value and return its new version"""
+
+    @abstractmethod
+    def delete(self, key: str):
+        pass
+
+    @abstractmethod
+    def purge_expired(self) -> int:
+        """Drop expired keys; returns how many were removed"""
+
+    def close(self):
+        pass
+
+class SQLiteKeyValueBackend(KeyValueBackend):
+    """KeyValueBackend on a SQLite file: a local stand-in for a shared KV service, usable by several
+    gateway processes on one host. One connection per thread, WAL so readers never block the writer."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        connection = self._connection()
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, version INTEGER NOT NULL, expires_at REAL NOT NULL)"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS sessions_expires_at ON sessions (expires_at)")
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def get(self, key: str, known_version: Optional[int] = None) -> Optional[Tuple[int, Optional[bytes]]]:
+        row = self._connection().execute(
+            "SELECT version, CASE WHEN version = ? THEN NULL ELSE value END FROM sessions "
+            "WHERE key = ? AND expires_at > ?",
+            (known_version, key, time.time()),
+        ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def put(self, key: str, value: bytes, expires_at: float) -> int:
+        return self._connection().execute(
+            "INSERT INTO sessions (key, value, version, expires_at) VALUES (?, ?, 1, ?) "
+            "ON CONFLICT (key) DO UPDATE SET value = excluded.value, version = version + 1, "
+            "expires_at = excluded.expires_at RETURNING version",
+            (key, value, expires_at),
+        ).fetchone()[0]
+
+    def delete(self, key: str):
+        self._connection().execute("DELETE FROM sessions WHERE key = ?", (key,))
+
+    def purge_expired(self) -> int:
+        return self._connection().execute("DELETE FROM sessions WHERE expires_at <= ?", (time.time(),)).rowcount
+
+    def close(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+class SharedSessionManager(SessionStore):
+    """Session store backed by a KeyValueBackend, so any gateway node can serve any dialog.
+
+    Every save writes the serialized session (menu cursor included). Reads go through a local
+    near-cache of live sessions keyed by version: the backend is still asked for the current
+    version, but the blob is only transferred and decoded when another node changed it.
+    """
+
+    def __init__(self, backend: KeyValueBackend, session_timeout: float = 300, near_cache_size: int = 10000,
+                 cleanup_interval: float = 30):
+        self.backend = backend
+        self.session_timeout = session_timeout  # Seconds of inactivity before a session expires
+        self.near_cache_size = near_cache_size
+        self._near_cache: "OrderedDict[str, Tuple[int, USSDSession]]" = OrderedDict()
+        self._lock = threading.Lock()  # Guards the near-cache only; held for dict operations, never for I/O
+        self.near_cache_hits = 0
+        self.near_cache_misses = 0
+        self.cleanup_interval = cleanup_interval
+        self.running = True
+        self.cleanup_thread = threading.Thread(target=self._cleanup_loop, daemon=True)
+        self.cleanup_thread.start()
+
+    def _cache_put(self, msisdn: str, version: int, session: USSDSession):
+        with self._lock:
+            self._near_cache[msisdn] = (version, session)
+            self._near_cache.move_to_end(msisdn)
+            if len(self._near_cache) > self.near_cache_size:
+                self._near_cache.popitem(last=False)
+
+    def _cache_drop(self, msisdn: str):
+        with self._lock:
+            self._near_cache.pop(msisdn, None)
+
+    def _write(self, session: USSDSession):
+        version = self.backend.put(session.msisdn, serialize_session(session), session.last_activity + self.session_timeout)
+        self._cache_put(session.msisdn, version, session)
+
+    def create_session(self, msisdn: str, session_id: str, service_code: str, initial_state: Any) -> USSDSession:
+        session = USSDSession(msisdn, session_id, service_code)
+        session.current_state = initial_state
+        self._write(session)
+        return session
+
+    def get_session(self, msisdn: str) -> Optional[USSDSession]:
+        with self._lock:
+            cached = self._near_cache.get(msisdn)
+        known_version = cached[0] if cached else None
+        entry = self.backend.get(msisdn, known_version)
+        if entry is None:
+            if cached:
+                self._cache_drop(msisdn)
+            return None
+        version, data = entry
+        if data is None:
+            self.near_cache_hits += 1
+            return cached[1]
+        self.near_cache_misses += 1
+        session = deserialize_session(msisdn, data)
+        if session is None:
+            return None
+        self._cache_put(msisdn, version, session)
+        return session
+
+    def get_or_create_session(self, msisdn: str, session_id: str = "", service_code: str = "") -> USSDSession:
+        session = self.get_session(msisdn)
+        if session is None:
+            session = self.create_session(msisdn, session_id, service_code, None)
+        return session
+
+    def save_session(self, session: USSDSession):
+        self._write(session)
+
+    def end_session(self, session: USSDSession):
+        self.backend.delete(session.msisdn)
+        self._cache_drop(session.msisdn)
+
+    def get_active_sessions(self) -> Dict[str, datetime]:
+        """Sessions known to this node's near-cache (the backend is not enumerated)"""
+        with self._lock:
+            return {msisdn: datetime.fromtimestamp(session.last_activity) for msisdn, (_, session) in self._near_cache.items()}
+
+    def _cleanup_loop(self):
+        while self.running:
+            try:
+                self.backend.purge_expired()
+            except Exception as e:
+                print(f"Error in cleanup thread: {e}")
+            time.sleep(self.cleanup_interval)
+
+    def shutdown(self):
+        self.running = False
+        with self._lock:
+            self._near_cache.clear()
+        self.backend.close()
@@ -1,9 +1,44 @@
 import logging
+import threading
 from typing import Dict, Optional, Tuple, List
 from lxml import etree
-import xml.etree.ElementTree as ET
 from functools import lru_cache
-from src.gw.ussd_session_utils import USSDSessionManager, USSDSession
+from src.gw.ussd_session_utils import SessionStore, USSDSessionManager, USSDSession
+from src.gw.xml_escape import escape_attr
+
+# Response message types that carry an <msisdn> child
+_MSISDN_RESPONSE_TYPES = {"processUnstructuredSSRequest_Response", "unstructuredSSRequest_Request"}
+
+def _compile_response_templates(response_type_map: Dict[Tuple[str, str], str]) -> Dict[Tuple[str, str, bool], Tuple[bytes, bool]]:
+    """Precompile every response shape into a bytes %-template.
+
+    Key: (response message type, dialog action, has userObject). Value: (template, has msisdn slot).
+    Slots, in order: localId, remoteId, networkId, [userObject], invokeId, string, [msisdn number].
+    Output is byte-for-byte what the ElementTree builder produced.
+    """
+    templates = {}
+    for response_type in set(response_type_map.values()):
+        for dialog_action in ("Continue", "End"):
+            for with_user_object in ((False,) if dialog_action == "End" else (False, True)):
+                head = (
+                    '<?xml version="1.0" encoding="UTF-8"?>\n'
+                    f'<dialog type="{dialog_action}" localId="%s" remoteId="%s" '
+                    'appCntx="networkUnstructuredSsContext_version2" networkId="%s" '
+                    'mapMessagesSize="1" returnMessageOnError="false"'
+                )
+                if dialog_action == "End":
+                    head += ' prearrangedEnd="false"'
+                elif with_user_object:
+                    head += ' userObject="%s"'
+                body = f'><{response_type} invokeId="%s" dataCodingScheme="15" string="%s"'
+                with_msisdn = response_type in _MSISDN_RESPONSE_TYPES
+                if with_msisdn:
+                    body += f'><msisdn number="%s" nai="international_number" npi="ISDN" /></{response_type}>'
+                else:
+                    body += ' />'
+                templates[(response_type, dialog_action, with_user_object)] = (
+                    (head + body + '</dialog>').encode('utf-8'), with_msisdn)
+    return templates
 
 class USSDParser:
     """Optimized USSD Parser with caching and performance improvements"""
@@ -25,6 +60,9 @@ class USSDParser:
         ("unstructuredSSNotify_Request", "Continue"): "unstructuredSSNotify_Response",
         ("unstructuredSSNotify_Request", "End"): "unstructuredSSNotify_Response",
     }
+
+    # Precompiled byte templates for every response shape
+    RESPONSE_TEMPLATES = _compile_response_templates(RESPONSE_TYPE_MAP)
     
     # Pre-compiled XPath expressions as class attributes
     _XPATH_NETWORK_ID = etree.XPath("./@networkId")
@@ -44,17 +82,11 @@ class USSDParser:
         ./unstructuredSSNotify_Request
     """)
     
-    def __init__(self, session_manager: USSDSessionManager):
+    def __init__(self, session_manager: SessionStore):
         self.session_manager = session_manager or USSDSessionManager()
         
-        # Pre-create XML parser for reuse
-        self._xml_parser = etree.XMLParser(
-            recover=False,
-            strip_cdata=False,
-            resolve_entities=False,  # Security: disable entity resolution
-            huge_tree=False,
-            collect_ids=False
-        )
+        # lxml parsers must not be shared between threads, so keep one per thread
+        self._local = threading.local()
         
         # Cache for MSISDN extraction methods
         self._msisdn_extractors = [
@@ -66,113 +98,214 @@ class USSDParser:
             self._extract_gt_digits_all,
         ]
 
+    @property
+    def _xml_parser(self) -> etree.XMLParser:
+        """Per-thread reusable XML parser"""
+        parser = getattr(self._local, "parser", None)
+        if parser is None:
+            parser = self._local.parser = etree.XMLParser(
+                recover=False,
+                strip_cdata=False,
+                resolve_entities=False,  # Security: disable entity resolution
+                huge_tree=False,
+                collect_ids=False
+            )
+        return parser
+
     def parse_request(self, raw_xml: str) -> Dict:
-        """Parse XML request with optimized error handling and caching"""
+        """Parse XML request and attach it to the subscriber's session"""
+        parsed = self.parse_fields(raw_xml)
+        if parsed.get("error"):
+            return parsed
+        return self.bind_session(parsed)
+
+    def parse_fields(self, raw_xml: str) -> Dict:
+        """Extract request fields without touching session state"""
         try:
             # Fast path: reuse parser instance
             root = etree.fromstring(raw_xml.encode('utf-8'), self._xml_parser)
+
+            # Single walk over the dialog; XPath chain only for documents the walk cannot resolve
+            fields = self._extract_fields_single_pass(root)
+            if fields is None:
+                fields = self._extract_fields_xpath(root)
+            fields["raw_xml"] = raw_xml
+            return fields
             
-            # Extract attributes with minimal XPath calls
-            dialog_type = root.get("type", "Continue")
-            session_id = root.get("localId", "0")
-            network_id = self._get_network_id_fast(root)
-            user_object = root.get("userObject", "")
-            remote_id = root.get("remoteId", "")
-            
-            # Extract MSISDN using optimized method
-            msisdn = self._extract_msisdn_fast(root, dialog_type)
-            
-            # Extract user input and invoke ID
-            user_input = self._get_user_input_fast(root)
-            invoke_id = self._get_invoke_id_fast(root)
-            message_type = self._get_message_type_fast(root)
+        except etree.XMLSyntaxError as e:
+            return self._create_error_dict("XML_SYNTAX_ERROR", str(e))
+        except Exception as e:
+            logging.error(f"Parse error: {e}")
+            return self._create_error_dict("PARSE_FAILURE", str(e))
+
+    def _extract_fields_xpath(self, root) -> Dict:
+        """Extract request fields with the XPath extractor chain"""
+        # Extract attributes with minimal XPath calls
+        dialog_type = root.get("type", "Continue")
+        session_id = root.get("localId", "0")
+        network_id = self._get_network_id_fast(root)
+        user_object = root.get("userObject", "")
+        remote_id = root.get("remoteId", "")
+        
+        # Extract MSISDN using optimized method
+        msisdn = self._extract_msisdn_fast(root, dialog_type)
+        
+        # Extract user input and invoke ID
+        user_input = self._get_user_input_fast(root)
+        invoke_id = self._get_invoke_id_fast(root)
+        message_type = self._get_message_type_fast(root)
+
+        # Return optimized dictionary
+        return {
+            "session_id": session_id,
+            "remote_id": remote_id,
+            "msisdn": msisdn,
+            "network_id": network_id,
+            "user_object": user_object,
+            "invoke_id": invoke_id,
+            "message_type": message_type,
+            "dialog_type": dialog_type,
+            "user_input": user_input,
+        }
+
+    def _extract_fields_single_pass(self, root) -> Optional[Dict]:
+        """Fill every field in one walk of the dialog tree, with the same precedence as the XPath chain.
+
+        Returns None when no MSISDN candidate or message element is found, so the
+        caller falls back to the XPath chain (and its error reporting).
+        """
+        begin_msisdn = origination_ref = remote_gt_digits = destination_ref = None
+        request_input = response_input = request_invoke = response_invoke = None
+        message_type = None
+
+        for child in root:
+            tag = child.tag
+            if tag == "processUnstructuredSSRequest_Request":
+                if request_input is None:
+                    request_input = child.get("string")
+                if request_invoke is None:
+                    request_invoke = child.get("invokeId")
+                if begin_msisdn is None:
+                    for msisdn_elem in child.iterchildren("msisdn"):
+                        begin_msisdn = msisdn_elem.get("number")
+                        if begin_msisdn is not None:
+                            break
+            elif tag == "unstructuredSSRequest_Response":
+                if response_input is None:
+                    response_input = child.get("string")
+                if response_invoke is None:
+                    response_invoke = child.get("invokeId")
+            elif tag == "originationReference":
+                if origination_ref is None:
+                    origination_ref = child.get("number")
+            elif tag == "destinationReference":
+                if destination_ref is None:
+                    destination_ref = child.get("number")
+            elif tag == "remoteAddress":
+                if remote_gt_digits is None:
+                    for gt_elem in child.iterchildren("gt"):
+                        remote_gt_digits = gt_elem.get("digits")
+                        if remote_gt_digits is not None:
+                            break
+
+            if message_type is None and tag in self.MESSAGE_TYPES:
+                message_type = tag
+
+        if message_type is None:
+            return None
+
+        # Same candidate order and "*" rejection as _msisdn_extractors
+        msisdn = None
+        for candidate in (begin_msisdn, origination_ref, remote_gt_digits, destination_ref):
+            if candidate and candidate != "*":
+                msisdn = candidate
+                break
+        if msisdn is None:
+            # Document-order fallbacks (.//msisdn/@number, then .//gt/@digits), only walked when needed
+            for tag, attr in (("msisdn", "number"), ("gt", "digits")):
+                for elem in root.iterdescendants(tag):
+                    candidate = elem.get(attr)
+                    if candidate is not None:
+                        break
+                else:
+                    candidate = None
+                if candidate and candidate != "*":
+                    msisdn = candidate
+                    break
+        if msisdn is None:
+            return None
+
+        return {
+            "session_id": root.get("localId", "0"),
+            "remote_id": root.get("remoteId", ""),
+            "msisdn": msisdn,
+            "network_id": root.get("networkId", "0"),
+            "user_object": root.get("userObject", ""),
+            "invoke_id": request_invoke if request_invoke is not None else response_invoke,
+            "message_type": message_type,
+            "dialog_type": root.get("type", "Continue"),
+            "user_input": request_input if request_input is not None else response_input,
+        }
+
+    def bind_session(self, parsed: Dict) -> Dict:
+        """Create or refresh the session for a parsed request"""
+        try:
+            user_input = parsed["user_input"]
 
             # Handle session efficiently
-            session = self._handle_session(dialog_type, msisdn, session_id, user_input or "")
+            session = self._handle_session(parsed["dialog_type"], parsed["msisdn"], parsed["session_id"], user_input or "")
             
             # Update session with minimal dictionary operations
             session_updates = {
-                'message_type': message_type,
-                'remote_id': remote_id,
-                'network_id': network_id,
-                'user_object': user_object,
-                'invoke_id': invoke_id,
-                'dialog_type': dialog_type,
+                'message_type': parsed["message_type"],
+                'remote_id': parsed["remote_id"],
+                'network_id': parsed["network_id"],
+                'user_object': parsed["user_object"],
+                'invoke_id': parsed["invoke_id"],
+                'dialog_type': parsed["dialog_type"],
             }
             session.session_data.update(session_updates)
             
             if user_input:
                 session.store_response('user_input', user_input)
             session.update_activity()
+            parsed["session"] = session  # Carried through the request so nothing looks it up again
+            return parsed
 
-            # Return optimized dictionary
-            return {
-                "session_id": session_id,
-                "remote_id": remote_id,
-                "msisdn": msisdn,
-                "network_id": network_id,
-                "user_object": user_object,
-                "invoke_id": invoke_id,
-                "message_type": message_type,
-                "dialog_type": dialog_type,
-                "user_input": user_input,
-                "raw_xml": raw_xml
-            }
-            
-        except etree.XMLSyntaxError as e:
-            return self._create_error_dict("XML_SYNTAX_ERROR", str(e))
         except Exception as e:
             logging.error(f"Parse error: {e}")
             return self._create_error_dict("PARSE_FAILURE", str(e))
 
-    def getResponse(self, msisdn: str, text: str, end_or_not: bool) -> str:
-        """Generate XML response with optimized string building"""
+    def render_response(self, msisdn: str, text: str, end_or_not: bool) -> bytes:
+        """Render the XML response as UTF-8 bytes from a precompiled template"""
         session = self.session_manager.get_session(msisdn)
         if session is None:
             raise ValueError(f"No active session found for MSISDN: {msisdn}")
-        
+        return self.render_session_response(session, text, end_or_not)
+
+    def render_session_response(self, session: USSDSession, text: str, end_or_not: bool) -> bytes:
+        """Render the response for an already bound session, skipping the store lookup"""
         # Use fast lookup for response message type
-        message_type = session.session_data.get('message_type', 'processUnstructuredSSRequest_Request')
+        session_data = session.session_data
+        message_type = session_data.get('message_type', 'processUnstructuredSSRequest_Request')
         dialog_action = "End" if end_or_not else "Continue"
         response_message_type = self._get_response_message_type_fast(message_type, dialog_action)
 
-        # Build attributes efficiently
-        dialog_attrs = {
-            "type": dialog_action,
-            "localId": session.session_id,
-            "remoteId": session.session_data.get('remote_id', ''),
-            "appCntx": "networkUnstructuredSsContext_version2",
-            "networkId": session.session_data.get('network_id', '0'),
-            "mapMessagesSize": "1",
-            "returnMessageOnError": "false"
-        }
-
-        if end_or_not:
-            dialog_attrs["prearrangedEnd"] = "false"
-        elif session.session_data.get('user_object'):
-            dialog_attrs["userObject"] = session.session_data['user_object']
-
-        # Build XML efficiently
-        root = ET.Element("dialog", attrib=dialog_attrs)
-        response_attrs = {
-            "invokeId": session.session_data.get('invoke_id', '1'),
-            "dataCodingScheme": "15",
-            "string": text
-        }
+        user_object = None if end_or_not else session_data.get('user_object')
+        template, with_msisdn = self.RESPONSE_TEMPLATES[(response_message_type, dialog_action, bool(user_object))]
 
-        response_elem = ET.SubElement(root, response_message_type, attrib=response_attrs)
-        
-        # Add MSISDN only when required
-        if response_message_type in {"processUnstructuredSSRequest_Response", "unstructuredSSRequest_Request"}:
-            ET.SubElement(response_elem, "msisdn", attrib={
-                "number": session.msisdn,
-                "nai": "international_number",
-                "npi": "ISDN"
-            })
-
-        # Generate response string
-        xml_str = ET.tostring(root, encoding="unicode")
-        response = f'<?xml version="1.0" encoding="UTF-8"?>\n{xml_str}'
+        values = [
+            escape_attr(session.session_id),
+            escape_attr(session_data.get('remote_id', '')),
+            escape_attr(session_data.get('network_id', '0')),
+        ]
+        if user_object:
+            values.append(escape_attr(user_object))
+        values.append(escape_attr(session_data.get('invoke_id', '1')))
+        values.append(escape_attr(text))
+        if with_msisdn:
+            values.append(escape_attr(session.msisdn))
+        response = template % tuple(values)
         
         if end_or_not:
             self.session_manager.end_session(session)
@@ -285,6 +418,10 @@ class USSDParser:
         }
 
     # Maintain backward compatibility
+    def getResponse(self, msisdn: str, text: str, end_or_not: bool) -> str:
+        """Backward compatibility method - prefer render_response, which skips the decode"""
+        return self.render_response(msisdn, text, end_or_not).decode('utf-8')
+
     def get_response_message_type(self, incoming_message_type: str, dialog_type: str = "Continue") -> str:
         """Backward compatibility method"""
         return self._get_response_message_type_fast(incoming_message_type, dialog_type)
@@ -320,4 +457,36 @@ class USSDParser:
 
     def _build_error_dict(self, error_type: str, error_message: str) -> Dict:
         """Backward compatibility method"""
-        return self._create_error_dict(error_type, error_message)
\ No newline at end of file
+        return self._create_error_dict(error_type, error_message)
+
+# Benchmark: per-request field extraction, XPath chain vs single pass
+if __name__ == "__main__":
+    from timeit import timeit
+
+    sample_begin = """<?xml version="1.0" encoding="UTF-8"?>
+<dialog type="Begin" appCntx="networkUnstructuredSsContext_version2" networkId="0" localId="SESSION123" remoteId="REMOTE123" mapMessagesSize="1" returnMessageOnError="false">
+    <localAddress pc="7725" ssn="147"><ai value="19"/><gt type="GlobalTitle0100" tt="0" es="2" np="1" nai="4" digits="9370260024"/></localAddress>
+    <remoteAddress pc="0" ssn="6"><ai value="18"/><gt type="GlobalTitle0100" tt="0" es="1" np="1" nai="4" digits="93702990008"/></remoteAddress>
+    <destinationReference number="412012115087574" nai="international_number" npi="land_mobile"/>
+    <originationReference number="93702990008" nai="international_number" npi="ISDN"/>
+    <processUnstructuredSSRequest_Request invokeId="1" dataCodingScheme="15" string="*222#">
+        <msisdn number="93701234567" nai="international_number" npi="ISDN"/>
+    </processUnstructuredSSRequest_Request>
+</dialog>"""
+    sample_continue = """<?xml version="1.0" encoding="UTF-8"?>
+<dialog type="Continue" localId="SESSION123" remoteId="REMOTE123" appCntx="networkUnstructuredSsContext_version2" networkId="0" mapMessagesSize="1" returnMessageOnError="false">
+    <unstructuredSSRequest_Response invokeId="1" dataCodingScheme="15" string="123456">
+        <msisdn number="93701234567" nai="international_number" npi="ISDN"/>
+    </unstructuredSSRequest_Response>
+</dialog>"""
+
+    parser = USSDParser(USSDSessionManager())
+    runs = 20000
+    for name, sample in (("Begin", sample_begin), ("Continue", sample_continue)):
+        data = sample.encode('utf-8')
+        root = etree.fromstring(data, parser._xml_parser)
+        assert parser._extract_fields_xpath(root) == parser._extract_fields_single_pass(root)
+        xpath = timeit(lambda: parser._extract_fields_xpath(etree.fromstring(data, parser._xml_parser)), number=runs)
+        single = timeit(lambda: parser._extract_fields_single_pass(etree.fromstring(data, parser._xml_parser)), number=runs)
+        print(f"{name:8} xpath chain: {xpath / runs * 1e6:7.2f} us/request   "
+              f"single pass: {single / runs * 1e6:7.2f} us/request   ({xpath / single:.1f}x)")
@@ -1,9 +1,19 @@
+import heapq
+import itertools
+from abc import ABC, abstractmethod
+import logging
 import time
-from threading import Lock
-from typing import Any, Dict, Optional
+from datetime import datetime
+from threading import Lock, Thread
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("USSDSessionManager")
 
 class USSDSession:
     """Represents a USSD session for a specific MSISDN following AWCC specs."""
+
+    __slots__ = ("msisdn", "session_id", "service_code", "start_time", "last_activity", "current_state", "user_data",
+                 "session_data", "is_new_session", "encoding", "language", "menu_record", "menu_graph", "menu_engine")
     
     def __init__(self, msisdn: str, session_id: str, service_code: str):
         """
@@ -23,6 +33,11 @@ class USSDSession:
         self.is_new_session = True
         self.encoding = "gsm-7"  # Default encoding per AWCC
         self.language = "en"  # Default language
+        # Menu half of the dialog; dropped together with the session. Between requests only the
+        # packed record is kept; the engine is rebuilt from it for the request that needs it.
+        self.menu_record: Optional[bytes] = None  # MenuEngine.pack() output
+        self.menu_graph = None  # Shared MenuGraph the record indexes into
+        self.menu_engine = None  # Live MenuEngine, only while a request is being handled
         
     def update_activity(self):
         """Update last activity timestamp"""
@@ -49,14 +64,80 @@ class USSDSession:
         """Get stored response value"""
         return self.user_data.get(key, {}).get("value")
 
-class USSDSessionManager:
-    """Manages USSD sessions with thread safety and AWCC compliance."""
-    
-    def __init__(self, session_timeout=300000000):
+class SessionStore(ABC):
+    """Where dialogs live between requests. Implementations must be safe to call from many threads."""
+
+    @abstractmethod
+    def create_session(self, msisdn: str, session_id: str, service_code: str, initial_state: Any) -> USSDSession:
+        """Start a new dialog, replacing any existing one for the MSISDN"""
+
+    @abstractmethod
+    def get_session(self, msisdn: str) -> Optional[USSDSession]:
+        """Return the live dialog for the MSISDN, or None if there is none or it expired"""
+
+    @abstractmethod
+    def get_or_create_session(self, msisdn: str, session_id: str = "", service_code: str = "") -> USSDSession:
+        pass
+
+    @abstractmethod
+    def save_session(self, session: USSDSession):
+        """Persist the session (menu cursor included) after a request changed it"""
+
+    @abstractmethod
+    def end_session(self, session: USSDSession):
+        pass
+
+    @abstractmethod
+    def shutdown(self):
+        pass
+
+class _SessionShard:
+    """One stripe of the store: its own map, lock and expiry heap."""
+
+    __slots__ = ("sessions", "lock", "expiry_heap", "expired_total")
+
+    def __init__(self):
         self.sessions: Dict[str, USSDSession] = {}
         self.lock = Lock()
-        self.session_timeout = session_timeout  # AWCC standard timeout
-        print(f"**********USSDSessionManager initialized with session timeout: {self.session_timeout} ms")
+        # Min-heap of (deadline, seq, session). Entries are never removed eagerly: a popped entry
+        # whose session was ended/replaced is dropped, one whose session saw activity is re-pushed.
+        self.expiry_heap: List[Tuple[float, int, USSDSession]] = []
+        self.expired_total = 0
+
+class USSDSessionManager(SessionStore):
+    """In-process session store for both halves of a dialog: the USSD metadata and the menu cursor.
+
+    Sessions are striped over shards by MSISDN hash, so requests for different subscribers
+    rarely share a lock. One lookup and one lock acquisition per request; timeouts are in seconds.
+    """
+    
+    EXPIRY_BATCH = 256  # Heap entries handled per lock acquisition, keeps each hold short
+
+    def __init__(self, session_timeout: float = 300, cleanup_interval: float = 1, shard_count: int = 64):
+        if shard_count < 1 or shard_count & (shard_count - 1):
+            raise ValueError(f"shard_count must be a power of two, got {shard_count}")
+        self._shards = [_SessionShard() for _ in range(shard_count)]
+        self._shard_mask = shard_count - 1
+        self.session_timeout = session_timeout  # Seconds of inactivity before a session expires
+        self.cleanup_interval = cleanup_interval
+        self._expiry_seq = itertools.count()  # Heap tie-breaker; next() on it is atomic under the GIL
+        self.expired_last_interval = 0  # Sessions expired by the most recent sweep
+        self.running = True
+        self.cleanup_thread = Thread(target=self._cleanup_loop, daemon=True)
+        self.cleanup_thread.start()
+        print(f"**********USSDSessionManager initialized with session timeout: {self.session_timeout} s, {shard_count} shards")
+
+    def _shard(self, msisdn: str) -> _SessionShard:
+        return self._shards[hash(msisdn) & self._shard_mask]
+
+    @property
+    def expired_total(self) -> int:
+        """Sessions expired since start"""
+        return sum(shard.expired_total for shard in self._shards)
+
+    def active_count(self) -> int:
+        """Live sessions across all shards (not defining __len__ keeps an empty store truthy)"""
+        return sum(len(shard.sessions) for shard in self._shards)
         
     def create_session(
         self,
@@ -66,25 +147,38 @@ class USSDSessionManager:
         initial_state: Any
     ) -> USSDSession:
         """Create a new USSD session per AWCC specifications"""
-        with self.lock:
-            # Terminate any existing session for this MSISDN
-            if msisdn in self.sessions:
-                del self.sessions[msisdn]
-            
-            # Create new session
-            session = USSDSession(msisdn, session_id, service_code)
-            session.current_state = initial_state
-            self.sessions[msisdn] = session
-            return session
+        session = USSDSession(msisdn, session_id, service_code)
+        session.current_state = initial_state
+        shard = self._shard(msisdn)
+        with shard.lock:
+            # Replaces (and so terminates) any existing session for this MSISDN
+            shard.sessions[msisdn] = session
+            heapq.heappush(shard.expiry_heap, (session.last_activity + self.session_timeout, next(self._expiry_seq), session))
+        return session
         
     def get_session(self, msisdn: str) -> Optional[USSDSession]:
-        with self.lock:
-            session = self.sessions.get(msisdn)
+        shard = self._shard(msisdn)
+        with shard.lock:
+            session = shard.sessions.get(msisdn)
             if session and session.is_expired(self.session_timeout):
-                del self.sessions[msisdn]
-                print(" ==========Consider logging expiration here===============")
+                del shard.sessions[msisdn]
+                shard.expired_total += 1  # Its heap entry is dropped when it comes due
                 return None
             return session
+
+    def get_or_create_session(self, msisdn: str, session_id: str = "", service_code: str = "") -> USSDSession:
+        """Return the live session for an MSISDN, creating one under the same lock if there is none"""
+        shard = self._shard(msisdn)
+        with shard.lock:
+            session = shard.sessions.get(msisdn)
+            if session is not None and not session.is_expired(self.session_timeout):
+                return session
+            if session is not None:
+                shard.expired_total += 1
+            session = USSDSession(msisdn, session_id, service_code)
+            shard.sessions[msisdn] = session
+            heapq.heappush(shard.expiry_heap, (session.last_activity + self.session_timeout, next(self._expiry_seq), session))
+            return session
         
     def update_session_state(
         self,
@@ -94,7 +188,7 @@ class USSDSessionManager:
         response_key: Optional[str] = None
     ):
         """Update session state with AWCC-compliant activity tracking"""
-        with self.lock:
+        with self._shard(session.msisdn).lock:
             session.update_activity()
             session.current_state = new_state
             session.is_new_session = False
@@ -102,15 +196,109 @@ class USSDSessionManager:
             if user_input and response_key:
                 session.store_response(response_key, user_input)
     
+    def save_session(self, session: USSDSession):
+        """Nothing to do: the live object is the stored state"""
+        pass
+
     def end_session(self, session: USSDSession):
         """Properly terminate a USSD session per AWCC specs"""
-        with self.lock:
-            if session.msisdn in self.sessions:
-                del self.sessions[session.msisdn]
+        shard = self._shard(session.msisdn)
+        with shard.lock:
+            # Only drop it if a newer dialog has not already replaced it
+            if shard.sessions.get(session.msisdn) is session:
+                del shard.sessions[session.msisdn]
                 
     def cleanup_sessions(self, msisdn: str):
         """Clean up expired session for a given MSISDN"""
-        with self.lock:
-            session = self.sessions.get(msisdn)
+        shard = self._shard(msisdn)
+        with shard.lock:
+            session = shard.sessions.get(msisdn)
             if session and session.is_expired(self.session_timeout):
-                del self.sessions[msisdn]
\ No newline at end of file
+                del shard.sessions[msisdn]
+                shard.expired_total += 1
+
+    def cleanup_expired_sessions(self) -> int:
+        """Expire sessions whose deadline has passed; work is proportional to what is due, not to the store size"""
+        return sum(self._expire_shard(shard) for shard in self._shards)
+
+    def _expire_shard(self, shard: _SessionShard) -> int:
+        expired = 0
+        while True:
+            now = time.time()
+            with shard.lock:
+                heap = shard.expiry_heap
+                for _ in range(self.EXPIRY_BATCH):
+                    if not heap or heap[0][0] > now:
+                        break
+                    _, _, session = heapq.heappop(heap)
+                    if shard.sessions.get(session.msisdn) is not session:
+                        continue  # Already ended, replaced or lazily expired
+                    deadline = session.last_activity + self.session_timeout
+                    if deadline > now:
+                        # Touched since it was scheduled: reschedule rather than expire
+                        heapq.heappush(heap, (deadline, next(self._expiry_seq), session))
+                        continue
+                    del shard.sessions[session.msisdn]
+                    shard.expired_total += 1
+                    expired += 1
+                done = not heap or heap[0][0] > now
+            if done:
+                return expired
+
+    def _cleanup_loop(self):
+        while self.running:
+            try:
+                self.expired_last_interval = self.cleanup_expired_sessions()
+                if self.expired_last_interval:
+                    logger.info(f"Expired {self.expired_last_interval} sessions "
+                                f"(total {self.expired_total}, active {self.active_count()})")
+            except Exception as e:
+                print(f"Error in cleanup thread: {e}")
+            time.sleep(self.cleanup_interval)
+
+    def get_active_sessions(self) -> Dict[str, datetime]:
+        active = {}
+        for shard in self._shards:
+            with shard.lock:
+                active.update((msisdn, datetime.fromtimestamp(session.last_activity)) for msisdn, session in shard.sessions.items())
+        return active
+
+    def shutdown(self):
+        self.running = False
+        for shard in self._shards:
+            with shard.lock:
+                shard.sessions.clear()
+                shard.expiry_heap.clear()
+
+if __name__ == "__main__":
+    import threading
+
+    def contention_benchmark(shard_count: int, threads: int, ops_per_thread: int = 20000) -> float:
+        """Requests/s for a Begin + 3 Continues + End mix over distinct subscribers per thread"""
+        store = USSDSessionManager(session_timeout=300, cleanup_interval=3600, shard_count=shard_count)
+        start = threading.Barrier(threads + 1)
+
+        def worker(tid: int):
+            start.wait()
+            for i in range(ops_per_thread // 5):
+                msisdn = f"9370{tid:03d}{i % 500:04d}"
+                session = store.create_session(msisdn, "s", "*222#", None)
+                for _ in range(3):
+                    store.get_session(msisdn).update_activity()
+                store.end_session(session)
+
+        workers = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+        for w in workers:
+            w.start()
+        start.wait()
+        t0 = time.perf_counter()
+        for w in workers:
+            w.join()
+        elapsed = time.perf_counter() - t0
+        store.shutdown()
+        return threads * ops_per_thread / elapsed
+
+    for threads in (1, 4, 16, 64):
+        single = contention_benchmark(1, threads)
+        sharded = contention_benchmark(64, threads)
+        print(f"{threads:>3} threads: 1 shard {single:>10,.0f} ops/s | 64 shards {sharded:>10,.0f} ops/s")
@@ -0,0 +1,38 @@
+from typing import Dict, Optional
+
+# Attribute escaping identical to xml.etree.ElementTree's serializer
+_ATTR_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    "\"": "&quot;",
+    "\r": "&#13;",
+    "\n": "&#10;",
+    "\t": "&#09;",
+})
+
+# Escaped bytes for texts that never change (prerendered menu prompts), registered at graph build time
+_STATIC_TEXT: Dict[str, bytes] = {}
+
+def escape_attr(value: Optional[str]) -> bytes:
+    """Escape an XML attribute value and encode it as UTF-8"""
+    if value is None:
+        return b""
+    escaped = _STATIC_TEXT.get(value)
+    if escaped is not None:
+        return escaped
+    return value.translate(_ATTR_ESCAPE_TABLE).encode('utf-8')
+
+def register_static_text(text: str) -> str:
+    """Pre-escape a text that will be rendered many times; returns the text for convenient assignment"""
+    if text not in _STATIC_TEXT:
+        _STATIC_TEXT[text] = text.translate(_ATTR_ESCAPE_TABLE).encode('utf-8')
+    return text
+
+def static_texts() -> Dict[str, bytes]:
+    """Every registered text with its escaped bytes (stored in precompiled config artifacts)"""
+    return dict(_STATIC_TEXT)
+
+def preload_static_texts(escaped: Dict[str, bytes]):
+    """Register texts escaped ahead of time, e.g. by a config artifact build"""
+    _STATIC_TEXT.update(escaped)
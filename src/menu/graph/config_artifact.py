@@ -0,0 +1,166 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+import struct
+import time
+from typing import Dict, Any, Optional, List
+from src.gw.xml_escape import register_static_text, static_texts, preload_static_texts
+from src.menu.graph.schemas.schema_utils import (
+    load_config_from_source, get_validated_config, config_hash, register_validated_config
+)
+from src.menu.graph.nodes.menu_engine import NODE_TYPES, compile_transitions, get_menu_graph
+from src.menu.graph.nodes.main_menu import MenuNavigationNode
+from src.menu.graph.nodes.validators import Validator, compile_validator, validator_key, preload_validators
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the payload layout or anything pickled in it (validators, node tables) changes shape
+ARTIFACT_FORMAT_VERSION = 1
+ARTIFACT_MAGIC = b"USSDCFG\0"
+ARTIFACT_SUFFIX = ".ussdc"
+# magic, format version, sha256 of the raw source, sha256 of the validated config (hex, as config_hash returns it)
+_HEADER = struct.Struct(">8sH32s64s")
+
+def source_digest(source: str) -> bytes:
+    """sha256 of the raw source bytes (file contents, or the body served at a URL).
+
+    Only the source itself is hashed: a .py config that imports other modules must be rebuilt when they change.
+    """
+    if source.startswith(("http://", "https://")):
+        import requests
+        try:
+            response = requests.get(source, timeout=5)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            raise ValueError(f"Failed to load config from URL {source}: {str(e)}")
+        return hashlib.sha256(response.content).digest()
+    with open(source, "rb") as f:
+        return hashlib.sha256(f.read()).digest()
+
+def configured_artifact_path(config_path: Optional[str] = None) -> Optional[str]:
+    """The "menu_artifact" path of config.json (path from USSDGW_CONFIG, else the repository root), relative
+    to that file; None when no artifact is configured"""
+    config_path = config_path or os.environ.get("USSDGW_CONFIG") or \
+        os.path.join(os.path.dirname(__file__), "..", "..", "..", "config.json")
+    try:
+        with open(config_path, "r") as f:
+            artifact_path = json.load(f).get("menu_artifact")
+    except FileNotFoundError:
+        return None
+    return os.path.join(os.path.dirname(os.path.abspath(config_path)), artifact_path) if artifact_path else None
+
+def default_artifact_path(source: str) -> str:
+    if source.startswith(("http://", "https://")):
+        raise ValueError(f"An artifact path is required for URL config source {source}")
+    return os.path.splitext(source)[0] + ARTIFACT_SUFFIX
+
+def compile_artifact(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Everything startup would otherwise derive from a validated config:
+    the node table (the validated config, in graph index order), transitions, prerendered (escaped)
+    menu prompts and compiled input validators."""
+    node_ids: List[str] = [node_id for node_id, node_config in config.items() if node_config.get("type") in NODE_TYPES]
+    validators: Dict[str, Validator] = {}
+    prompts: List[str] = []
+    for node_id in node_ids:
+        node_config = config[node_id]
+        specs = [node_config.get("validation", {})] + [step.get("validation", {}) for step in node_config.get("steps", [])]
+        for spec in specs:
+            if spec:
+                validators[validator_key(spec)] = compile_validator(spec)
+        if node_config["type"] == "menu_navigation":
+            prompts.append(register_static_text(MenuNavigationNode.render_prompt(node_config)))
+    escaped = static_texts()
+    return {
+        "config": config,
+        "transitions": compile_transitions(config),
+        "prompts": {text: escaped[text] for text in prompts},
+        "validators": validators,
+    }
+
+def build_artifact(source: str, artifact_path: Optional[str] = None) -> Dict[str, Any]:
+    """Load, validate and compile a config source and write its artifact; returns the validated config.
+
+    An artifact that cannot be written (read-only install, missing directory) is logged and skipped:
+    the config compiled in memory is returned all the same.
+    """
+    artifact_path = artifact_path or default_artifact_path(source)
+    digest = source_digest(source)
+    config = get_validated_config(source, load_config_from_source(source))
+    key = config_hash(config)
+    payload = pickle.dumps(compile_artifact(config), protocol=pickle.HIGHEST_PROTOCOL)
+    # Write to a temporary file first so a concurrently starting server never reads half an artifact
+    temporary_path = f"{artifact_path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary_path, "wb") as f:
+            f.write(_HEADER.pack(ARTIFACT_MAGIC, ARTIFACT_FORMAT_VERSION, digest, key.encode("ascii")))
+            f.write(payload)
+        os.replace(temporary_path, artifact_path)
+    except OSError as e:
+        logger.warning(f"Config artifact {artifact_path} not written ({e}); using the in-memory compile")
+        try:
+            os.remove(temporary_path)
+        except OSError:
+            pass
+        return config
+    logger.info(f"Config artifact for {source} written to {artifact_path}")
+    return config
+
+def load_artifact(source: str, artifact_path: Optional[str] = None, rebuild: bool = False) -> Dict[str, Any]:
+    """Return the validated config for a source, from its artifact when that matches the source.
+
+    The compiled graph, escaped prompts and validators are registered as a side effect, so neither schema
+    validation nor graph compilation runs again. A missing, stale (source hash mismatch) or unreadable
+    artifact falls back to the full compile and, only with rebuild=True, is rewritten; building artifacts
+    is otherwise an explicit step (python -m src.menu.graph.config_artifact).
+    Artifacts are pickles: only load ones this deployment built itself.
+    """
+    artifact_path = artifact_path or default_artifact_path(source)
+    digest = source_digest(source)
+    try:
+        with open(artifact_path, "rb") as f:
+            data = f.read()
+        magic, version, artifact_digest, key = _HEADER.unpack_from(data)
+        if magic != ARTIFACT_MAGIC or version != ARTIFACT_FORMAT_VERSION:
+            raise ValueError(f"unsupported artifact format {magic!r} v{version}")
+        if artifact_digest != digest:
+            raise ValueError("source changed since the artifact was built")
+        artifact = pickle.loads(data[_HEADER.size:])
+    except (OSError, ValueError, struct.error, pickle.UnpicklingError, AttributeError, ImportError, EOFError) as e:
+        logger.info(f"Config artifact {artifact_path} not used ({e}); compiling {source}")
+        if rebuild:
+            return build_artifact(source, artifact_path)
+        return get_validated_config(source, load_config_from_source(source))
+
+    config = artifact["config"]
+    register_validated_config(source, key.decode("ascii"), config)
+    preload_static_texts(artifact["prompts"])
+    preload_validators(artifact["validators"])
+    get_menu_graph(config, source, artifact["transitions"])
+    return config
+
+if __name__ == "__main__":
+    import subprocess
+    import sys
+
+    # python -m src.menu.graph.config_artifact [source] [artifact]: build the artifact, then time
+    # the config step of a cold start (fresh interpreter, modules already imported) both ways
+    source = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(__file__), "demo_menu_config.py")
+    artifact_path = sys.argv[2] if len(sys.argv) > 2 else default_artifact_path(source)
+    start = time.perf_counter()
+    build_artifact(source, artifact_path)
+    print(f"Built {artifact_path} in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    cold_start = (
+        "import time; from src.menu.graph.config_artifact import *; from src.menu.graph.schemas.schema_utils import *; "
+        "from src.menu.graph.nodes.menu_engine import get_menu_graph; start = time.perf_counter(); {}; "
+        "print(f'{{(time.perf_counter() - start) * 1000:.1f}}')"
+    )
+    steps = {
+        "full compile (import, validate, graph)": f"get_menu_graph(get_validated_config({source!r}, load_config_from_source({source!r})))",
+        "artifact load": f"load_artifact({source!r}, {artifact_path!r}, rebuild=False)",
+    }
+    for name, step in steps.items():
+        output = subprocess.run([sys.executable, "-c", cold_start.format(step)], capture_output=True, text=True, check=True)
+        print(f"{name:<40}: {output.stdout.strip().splitlines()[-1]} ms")
@@ -18,7 +18,6 @@ config = {
             {"key": "4", "label": "Bills", "target_menu": "bills_menu"},
             {"key": "5", "label": "Top-up", "target_menu": "topup_menu"},
             {"key": "6", "label": "Approvals", "target_menu": "approvals_menu"}
-            {"key": "6", "label": "Approvals", "target_menu": "approvals_menu"}
         ],
         "transitions": {
             "9": "root_validation_gate",
@@ -122,9 +121,9 @@ config = {
         "type": "menu_navigation",
         "prompt": "Select Language:",
         "options": [
-            {"key": "1", "label": "Dari", "target_menu": "my_money_menu"},
-            {"key": "2", "label": "Pashto", "target_menu": "my_money_menu"},
-            {"key": "3", "label": "English", "target_menu": "my_money_menu"}
+            {"key": "1", "label": "Dari", "target_menu": "my_money_menu", "language": "da"},
+            {"key": "2", "label": "Pashto", "target_menu": "my_money_menu", "language": "ps"},
+            {"key": "3", "label": "English", "target_menu": "my_money_menu", "language": "en"}
         ],
         "transitions": {
             "9": "my_money_menu",
@@ -936,7 +935,7 @@ config = {
             }
         ],
         "confirmation_prompt": "Purchase 280 AFN: 2.5GB bundle? 1: OK, 2: Cancel",
-        "action_url": "src.services.GetBundleListAPI.GetBundleListAPI",
+        "action_url": "src.services.BundleTopupAPI.BundleTopupAPI",
         "params": {"bundle_type": "DATA", "option": 0},
         "success_prompt": "280 AFN: 2.5GB bundle activated\nReceipt: {receipt_number}",
         "transitions": {
@@ -0,0 +1,5 @@
+# Dari texts for the demo menu graph (src/menu/graph/demo_menu_config.py).
+# Keys are dotted paths into the graph; anything not listed falls back to the English text.
+# The former duplicated Dari config still carried the English texts, so nothing is translated yet.
+strings = {
+}
@@ -0,0 +1,277 @@
+# Pashto texts for the demo menu graph (src/menu/graph/demo_menu_config.py).
+# Keys are dotted paths into the graph (system.* keys: the engine's own texts); anything not listed falls back to the English text.
+strings = {
+    "system.service_unavailable": "خدمت په لنډمهاله توګه شتون نه لري، مهرباني وکړئ وروسته بیا هڅه وکړئ",
+    "system.back_or_exit": "د بیرته تګ لپاره 9 او د وتلو لپاره 0 فشار ورکړئ",
+    "root_validation_gate.prompt": "خپل د مای پیسې پټ نوم ولیکئ:\n",
+    "main_menu.prompt": "اصلي مینو: یو انتخاب وټاکئ:",
+    "main_menu.options.0.label": "زما پیسې",
+    "main_menu.options.1.label": "بانکونه",
+    "main_menu.options.2.label": "تادیه",
+    "main_menu.options.3.label": "بلونه",
+    "main_menu.options.4.label": "ټاپ-اپ",
+    "main_menu.options.5.label": "منظورۍ",
+    "my_money_menu.prompt": "زما پیسې: یو انتخاب وټاکئ:",
+    "my_money_menu.options.0.label": "بیلانس",
+    "my_money_menu.options.1.label": "پټ نوم بدل کړئ",
+    "my_money_menu.options.2.label": "معامله",
+    "my_money_menu.options.3.label": "لیږد",
+    "my_money_menu.options.4.label": "ژبه",
+    "balance_check.prompt": "ستاسو بیلانس {balance} افغانۍ دی\nوضعیت: {status}\nد بیرته تګ لپاره 9 او د وتلو لپاره 0 فشار ورکړئ",
+    "change_pin.steps.0.prompt": "خپل زوړ د مای پیسې پټ نوم ولیکئ (6 عددونه):\n",
+    "change_pin.steps.1.prompt": "خپل نوی د مای پیسې پټ نوم ولیکئ (6 عددونه):\n",
+    "change_pin.steps.2.prompt": "خپل نوی پټ نوم تایید کړئ:\n",
+    "change_pin.confirmation_prompt": "پټ نوم {new_pin} ته بدل کړی؟ 1: سمه ده، 2: لغوه",
+    "change_pin.success_prompt": "پټ نوم په بریالیتوب سره بدل شو\nرسید: {receipt_number}",
+    "transaction_menu.prompt": "د معاملاتو تاریخ لیدو لپاره خپل پټ نوم ولیکئ:",
+    "transaction_menu.confirmation_prompt": "د معاملاتو تاریخ وګورئ؟ 1: سمه ده، 2: لغوه",
+    "transaction_menu.success_prompt": "د معاملاتو تاریخ: {transactions}\nوضعیت: {status}",
+    "transfer_menu.steps.0.prompt": "د ترلاسه کونکي د تلیفون شمیره ولیکئ:\n",
+    "transfer_menu.steps.1.prompt": "د لیږد اندازه ولیکئ (افغانۍ):\n",
+    "transfer_menu.confirmation_prompt": "{phone_number} ته {amount} افغانۍ ولیږدول شي؟ 1: سمه ده، 2: لغوه",
+    "transfer_menu.success_prompt": "لیږد بشپړ شو\nرسید: {receipt_number}",
+    "language_menu.prompt": "ژبه وټاکئ:",
+    "language_menu.options.0.label": "دري",
+    "language_menu.options.1.label": "پښتو",
+    "language_menu.options.2.label": "انګلیسي",
+    "banks_menu.prompt": "بانکونه: یو انتخاب وټاکئ:",
+    "banks_menu.options.0.label": "میوند بانک",
+    "banks_menu.options.1.label": "نوی کابل بانک",
+    "banks_menu.options.2.label": "عزیزي بانک",
+    "banks_menu.options.3.label": "نور",
+    "banks_menu.options.6.label": "غضنفر بانک",
+    "maiwand_bank.prompt": "میوند بانک: یو انتخاب وټاکئ:",
+    "maiwand_bank.options.0.label": "د بانک بیلانس",
+    "maiwand_bank.options.1.label": "بانک سره نښلول",
+    "maiwand_bank.options.2.label": "بانک ته لیږد",
+    "maiwand_bank.options.3.label": "د بانک څخه لیږد",
+    "maiwand_balance.prompt": "د میوند بانک بیلانس چک کولو لپاره خپل پټ نوم ولیکئ:",
+    "maiwand_balance.confirmation_prompt": "د میوند بانک بیلانس چک کړی؟ 1: سمه ده، 2: لغوه",
+    "maiwand_balance.success_prompt": "د میوند بانک بیلانس: {balance} افغانۍ\nوضعیت: {status}",
+    "maiwand_link.steps.0.prompt": "خپل د میوند بانک حساب آی ډي ولیکئ:\n",
+    "maiwand_link.steps.1.prompt": "خپل د بانک پټ نوم ولیکئ:\n",
+    "maiwand_link.confirmation_prompt": "د میوند بانک حساب {account_id} سره ونښلول شي؟ 1: سمه ده، 2: لغوه",
+    "maiwand_link.success_prompt": "حساب ونښلول شو\nرسید: {receipt_number}",
+    "maiwand_transfer_to.steps.0.prompt": "د ترلاسه کونکي حساب آی ډي ولیکئ:\n",
+    "maiwand_transfer_to.steps.1.prompt": "د لیږد اندازه ولیکئ (افغانۍ):\n",
+    "maiwand_transfer_to.confirmation_prompt": "د میوند بانک حساب {account_id} ته {amount} افغانۍ ولیږدول شي؟ 1: سمه ده، 2: لغوه",
+    "maiwand_transfer_to.success_prompt": "لیږد بشپړ شو\nرسید: {receipt_number}",
+    "maiwand_transfer_from.steps.0.prompt": "خپل د میوند بانک حساب آی ډي ولیکئ:\n",
+    "maiwand_transfer_from.steps.1.prompt": "د لیږد اندازه ولیکئ (افغانۍ):\n",
+    "maiwand_transfer_from.confirmation_prompt": "د میوند بانک حساب {account_id} څخه {amount} افغانۍ ولیږدول شي؟ 1: سمه ده، 2: لغوه",
+    "maiwand_transfer_from.success_prompt": "لیږد بشپړ شو\nرسید: {receipt_number}",
+    "nkb_bank.prompt": "نوی کابل بانک: یو انتخاب وټاکئ:",
+    "nkb_bank.options.0.label": "د بانک بیلانس",
+    "nkb_bank.options.1.label": "بانک سره نښلول",
+    "nkb_bank.options.2.label": "بانک ته لیږد",
+    "nkb_bank.options.3.label": "د بانک څخه لیږد",
+    "nkb_balance.prompt": "د نوي کابل بانک بیلانس چک کولو لپاره خپل پټ نوم ولیکئ:",
+    "nkb_balance.confirmation_prompt": "د نوي کابل بانک بیلانس چک کړی؟ 1: سمه ده، 2: لغوه",
+    "nkb_balance.success_prompt": "د نوي کابل بانک بیلانس: {balance} افغانۍ\nوضعیت: {status}",
+    "nkb_link.steps.0.prompt": "خپل د نوي کابل بانک حساب آی ډي ولیکئ:\n",
+    "nkb_link.steps.1.prompt": "خپل د بانک پټ نوم ولیکئ:\n",
+    "nkb_link.confirmation_prompt": "د نوي کابل بانک حساب {account_id} سره ونښلول شي؟ 1: سمه ده، 2: لغوه",
+    "nkb_link.success_prompt": "حساب ونښلول شو\nرسید: {receipt_number}",
+    "nkb_transfer_to.steps.0.prompt": "د ترلاسه کونکي حساب آی ډي ولیکئ:\n",
+    "nkb_transfer_to.steps.1.prompt": "د لیږد اندازه ولیکئ (افغانۍ):\n",
+    "nkb_transfer_to.confirmation_prompt": "د نوي کابل بانک حساب {account_id} ته {amount} افغانۍ ولیږدول شي؟ 1: سمه ده، 2: لغوه",
+    "nkb_transfer_to.success_prompt": "لیږد بشپړ شو\nرسید: {receipt_number}",
+    "nkb_transfer_from.steps.0.prompt": "خپل د نوي کابل بانک حساب آی ډي ولیکئ:\n",
+    "nkb_transfer_from.steps.1.prompt": "د لیږد اندازه ولیکئ (افغانۍ):\n",
+    "nkb_transfer_from.confirmation_prompt": "د نوي کابل بانک حساب {account_id} څخه {amount} افغانۍ ولیږدول شي؟ 1: سمه ده، 2: لغوه",
+    "nkb_transfer_from.success_prompt": "لیږد بشپړ شو\nرسید: {receipt_number}",
+    "azizi_bank.prompt": "عزیزي بانک: یو انتخاب وټاکئ:",
+    "azizi_bank.options.0.label": "د بانک بیلانس",
+    "azizi_bank.options.1.label": "بانک سره نښلول",
+    "azizi_bank.options.2.label": "بانک ته لیږد",
+    "azizi_bank.options.3.label": "د بانک څخه لیږد",
+    "azizi_balance.prompt": "د عزیزي بانک بیلانس چک کولو لپاره خپل پټ نوم ولیکئ:",
+    "azizi_balance.confirmation_prompt": "د عزیزي بانک بیلانس چک کړی؟ 1: سمه ده، 2: لغوه",
+    "azizi_balance.success_prompt": "د عزیزي بانک بیلانس: {balance} افغانۍ\nوضعیت: {status}",
+    "azizi_link.steps.0.prompt": "خپل د عزیزي بانک حساب آی ډي ولیکئ:\n",
+    "azizi_link.steps.1.prompt": "خپل د بانک پټ نوم ولیکئ:\n",
+    "azizi_link.confirmation_prompt": "د عزیزي بانک حساب {account_id} سره ونښلول شي؟ 1: سمه ده، 2: لغوه",
+    "azizi_link.success_prompt": "حساب ونښلول شو\nرسید: {receipt_number}",
+    "azizi_transfer_to.steps.0.prompt": "د ترلاسه کونکي حساب آی ډي ولیکئ:\n",
+    "azizi_transfer_to.steps.1.prompt": "د لیږد اندازه ولیکئ (افغانۍ):\n",
+    "azizi_transfer_to.confirmation_prompt": "د عزیزي بانک حساب {account_id} ته {amount} افغانۍ ولیږدول شي؟ 1: سمه ده، 2: لغوه",
+    "azizi_transfer_to.success_prompt": "لیږد بشپړ شو\nرسید: {receipt_number}",
+    "azizi_transfer_from.steps.0.prompt": "خپل د عزیزي بانک حساب آی ډي ولیکئ:\n",
+    "azizi_transfer_from.steps.1.prompt": "د لیږد اندازه ولیکئ (افغانۍ):\n",
+    "azizi_transfer_from.confirmation_prompt": "د عزیزي بانک حساب {account_id} څخه {amount} افغانۍ ولیږدول شي؟ 1: سمه ده، 2: لغوه",
+    "azizi_transfer_from.success_prompt": "لیږد بشپړ شو\nرسید: {receipt_number}",
+    "other_bank.steps.0.prompt": "د بانک نوم ولیکئ:\n",
+    "other_bank.steps.1.prompt": "د حساب آی ډي ولیکئ:\n",
+    "other_bank.confirmation_prompt": "د {bank_name} حساب {account_id} سره ونښلول شي؟ 1: سمه ده، 2: لغوه",
+    "other_bank.success_prompt": "حساب ونښلول شو\nرسید: {receipt_number}",
+    "aub_bank.prompt": "AUB بانک: یو انتخاب وټاکئ:",
+    "aub_bank.options.0.label": "د بانک بیلانس",
+    "aub_bank.options.1.label": "بانک سره نښلول",
+    "aub_bank.options.2.label": "بانک ته لیږد",
+    "aub_bank.options.3.label": "د بانک څخه لیږد",
+    "aub_balance.prompt": "د AUB بانک بیلانس چک کولو لپاره خپل پټ نوم ولیکئ:",
+    "aub_balance.confirmation_prompt": "د AUB بانک بیلانس چک کړی؟ 1: سمه ده، 2: لغوه",
+    "aub_balance.success_prompt": "د AUB بانک بیلانس: {balance} افغانۍ\nوضعیت: {status}",
+    "aub_link.steps.0.prompt": "خپل د AUB بانک حساب آی ډي ولیکئ:\n",
+    "aub_link.steps.1.prompt": "خپل د بانک پټ نوم ولیکئ:\n",
+    "aub_link.confirmation_prompt": "د AUB بانک حساب {account_id} سره ونښلول شي؟ 1: سمه ده، 2: لغوه",
+    "aub_link.success_prompt": "حساب ونښلول شو\nرسید: {receipt_number}",
+    "aub_transfer_to.steps.0.prompt": "د ترلاسه کونکي حساب آی ډي ولیکئ:\n",
+    "aub_transfer_to.steps.1.prompt": "د لیږد اندازه ولیکئ (افغانۍ):\n",
+    "aub_transfer_to.confirmation_prompt": "د AUB بانک حساب {account_id} ته {amount} افغانۍ ولیږدول شي؟ 1: سمه ده، 2: لغوه",
+    "aub_transfer_to.success_prompt": "لیږد بشپړ شو\nرسید: {receipt_number}",
+    "aub_transfer_from.steps.0.prompt": "خپل د AUB بانک حساب آی ډي ولیکئ:\n",
+    "aub_transfer_from.steps.1.prompt": "د لیږد اندازه ولیکئ (افغانۍ):\n",
+    "aub_transfer_from.confirmation_prompt": "د AUB بانک حساب {account_id} څخه {amount} افغانۍ ولیږدول شي؟ 1: سمه ده، 2: لغوه",
+    "aub_transfer_from.success_prompt": "لیږد بشپړ شو\nرسید: {receipt_number}",
+    "bma_bank.prompt": "BMA بانک: یو انتخاب وټاکئ:",
+    "bma_bank.options.0.label": "د بانک بیلانس",
+    "bma_bank.options.1.label": "بانک سره نښلول",
+    "bma_bank.options.2.label": "بانک ته لیږد",
+    "bma_bank.options.3.label": "د بانک څخه لیږد",
+    "bma_balance.prompt": "د BMA بانک بیلانس چک کولو لپاره خپل پټ نوم ولیکئ:",
+    "bma_balance.confirmation_prompt": "د BMA بانک بیلانس چک کړی؟ 1: سمه ده، 2: لغوه",
+    "bma_balance.success_prompt": "د BMA بانک بیلانس: {balance} افغانۍ\nوضعیت: {status}",
+    "bma_link.steps.0.prompt": "خپل د BMA بانک حساب آی ډي ولیکئ:\n",
+    "bma_link.steps.1.prompt": "خپل د بانک پټ نوم ولیکئ:\n",
+    "bma_link.confirmation_prompt": "د BMA بانک حساب {account_id} سره ونښلول شي؟ 1: سمه ده، 2: لغوه",
+    "bma_link.success_prompt": "حساب ونښلول شو\nرسید: {receipt_number}",
+    "bma_transfer_to.steps.0.prompt": "د ترلاسه کونکي حساب آی ډي ولیکئ:\n",
+    "bma_transfer_to.steps.1.prompt": "د لیږد اندازه ولیکئ (افغانۍ):\n",
+    "bma_transfer_to.confirmation_prompt": "د BMA بانک حساب {account_id} ته {amount} افغانۍ ولیږدول شي؟ 1: سمه ده، 2: لغوه",
+    "bma_transfer_to.success_prompt": "لیږد بشپړ شو\nرسید: {receipt_number}",
+    "bma_transfer_from.steps.0.prompt": "خپل د BMA بانک حساب آی ډي ولیکئ:\n",
+    "bma_transfer_from.steps.1.prompt": "د لیږد اندازه ولیکئ (افغانۍ):\n",
+    "bma_transfer_from.confirmation_prompt": "د BMA بانک حساب {account_id} څخه {amount} افغانۍ ولیږدول شي؟ 1: سمه ده، 2: لغوه",
+    "bma_transfer_from.success_prompt": "لیږد بشپړ شو\nرسید: {receipt_number}",
+    "ghazanfar_bank.prompt": "غضنفر بانک: یو انتخاب وټاکئ:",
+    "ghazanfar_bank.options.0.label": "د بانک بیلانس",
+    "ghazanfar_bank.options.1.label": "بانک سره نښلول",
+    "ghazanfar_bank.options.2.label": "بانک ته لیږد",
+    "ghazanfar_bank.options.3.label": "د بانک څخه لیږد",
+    "ghazanfar_balance.prompt": "د غضنفر بانک بیلانس چک کولو لپاره خپل پټ نوم ولیکئ:",
+    "ghazanfar_balance.confirmation_prompt": "د غضنفر بانک بیلانس چک کړی؟ 1: سمه ده، 2: لغوه",
+    "ghazanfar_balance.success_prompt": "د غضنفر بانک بیلانس: {balance} افغانۍ\nوضعیت: {status}",
+    "ghazanfar_link.steps.0.prompt": "خپل د غضنفر بانک حساب آی ډي ولیکئ:\n",
+    "ghazanfar_link.steps.1.prompt": "خپل د بانک پټ نوم ولیکئ:\n",
+    "ghazanfar_link.confirmation_prompt": "د غضنفر بانک حساب {account_id} سره ونښلول شي؟ 1: سمه ده، 2: لغوه",
+    "ghazanfar_link.success_prompt": "حساب ونښلول شو\nرسید: {receipt_number}",
+    "ghazanfar_transfer_to.steps.0.prompt": "د ترلاسه کونکي حساب آی ډي ولیکئ:\n",
+    "ghazanfar_transfer_to.steps.1.prompt": "د لیږد اندازه ولیکئ (افغانۍ):\n",
+    "ghazanfar_transfer_to.confirmation_prompt": "د غضنفر بانک حساب {account_id} ته {amount} افغانۍ ولیږدول شي؟ 1: سمه ده، 2: لغوه",
+    "ghazanfar_transfer_to.success_prompt": "لیږد بشپړ شو\nرسید: {receipt_number}",
+    "ghazanfar_transfer_from.steps.0.prompt": "خپل د غضنفر بانک حساب آی ډي ولیکئ:\n",
+    "ghazanfar_transfer_from.steps.1.prompt": "د لیږد اندازه ولیکئ (افغانۍ):\n",
+    "ghazanfar_transfer_from.confirmation_prompt": "د غضنفر بانک حساب {account_id} څخه {amount} افغانۍ ولیږدول شي؟ 1: سمه ده، 2: لغوه",
+    "ghazanfar_transfer_from.success_prompt": "لیږد بشپړ شو\nرسید: {receipt_number}",
+    "payment_menu.steps.0.prompt": "د تادیه کونکي حساب آی ډي ولیکئ:\n",
+    "payment_menu.steps.1.prompt": "د تادیې وړ اندازه ولیکئ (افغانۍ):\n",
+    "payment_menu.confirmation_prompt": "{account_id} حساب ته {amount} افغانۍ تادیه کړی؟ 1: سمه ده، 2: لغوه",
+    "payment_menu.success_prompt": "تادیه بشپړه شوه\nرسید: {receipt_number}",
+    "bills_menu.prompt": "بلونه: یو انتخاب وټاکئ:",
+    "bills_menu.options.0.label": "برشنا شرکت",
+    "bills_menu.options.1.label": "ډیلایټ",
+    "dabs_bill.steps.0.prompt": "د برشنا شرکت حساب آی ډي ولیکئ:\n",
+    "dabs_bill.steps.1.prompt": "د بل اندازه ولیکئ (افغانۍ):\n",
+    "dabs_bill.confirmation_prompt": "د {account_id} حساب لپاره {amount} افغانۍ تادیه کړی؟ 1: سمه ده، 2: لغوه",
+    "dabs_bill.success_prompt": "تادیه پروسس شوه\nرسید: {receipt_number}",
+    "delight_bill.steps.0.prompt": "د ډیلایټ حساب آی ډي ولیکئ:\n",
+    "delight_bill.steps.1.prompt": "د بل اندازه ولیکئ (افغانۍ):\n",
+    "delight_bill.confirmation_prompt": "د {account_id} حساب لپاره {amount} افغانۍ تادیه کړی؟ 1: سمه ده، 2: لغوه",
+    "delight_bill.success_prompt": "تادیه پروسس شوه\nرسید: {receipt_number}",
+    "topup_menu.prompt": "ټاپ-اپ: یو انتخاب وټاکئ:",
+    "topup_menu.options.0.label": "ځان ته ټاپ-اپ",
+    "topup_menu.options.1.label": "نورو ته ټاپ-اپ",
+    "topup_menu.options.2.label": "د ټاپ-اپ بنډلونه واخلئ",
+    "topup_self.steps.0.prompt": "د ټاپ-اپ اندازه ولیکئ (افغانۍ):\n",
+    "topup_self.confirmation_prompt": "خپل حساب ته {amount} افغانۍ ټاپ-اپ کړی؟ 1: سمه ده، 2: لغوه",
+    "topup_self.success_prompt": "ټاپ-اپ بشپړ شو\nرسید: {receipt_number}",
+    "topup_others.steps.0.prompt": "د منزل شمیره ولیکئ:\n",
+    "topup_others.steps.1.prompt": "د ټاپ-اپ اندازه ولیکئ (افغانۍ):\n",
+    "topup_others.confirmation_prompt": "{phone_number} ته {amount} افغانۍ ټاپ-اپ کړی؟ 1: سمه ده، 2: لغوه",
+    "topup_others.success_prompt": "ټاپ-اپ بشپړ شو\nرسید: {receipt_number}",
+    "bundles_menu.prompt": "بنډلونه: یو انتخاب وټاکئ:",
+    "bundles_menu.options.0.label": "د ځان لپاره بنډل",
+    "bundles_menu.options.1.label": "د نورو لپاره بنډل",
+    "self_bundle.prompt": "د ځان لپاره بنډل: یو انتخاب وټاکئ:",
+    "self_bundle.options.0.label": "د ډیټا بنډل",
+    "self_bundle.options.1.label": "د غږ بنډل",
+    "data_bundle.prompt": "د ډیټا بنډل: یو انتخاب وټاکئ:",
+    "data_bundle.options.0.label": "280 افغانۍ: 2.5 جي بي",
+    "data_bundle.options.1.label": "450 افغانۍ: 6 جي بي",
+    "data_bundle.options.2.label": "670 افغانۍ: 10 جي بي",
+    "data_bundle.options.3.label": "1220 افغانۍ: 22.2 جي بي",
+    "data_280.steps.0.prompt": "د 280 افغانیو په بدل کې د 2.5 جي بي بنډل پیرود تایید کړئ:\n",
+    "data_280.confirmation_prompt": "د 280 افغانیو په بدل کې د 2.5 جي بي بنډل واخلئ؟ 1: سمه ده، 2: لغوه",
+    "data_280.success_prompt": "د 280 افغانیو 2.5 جي بي بنډل فعال شو\nرسید: {receipt_number}",
+    "data_450.steps.0.prompt": "د 450 افغانیو په بدل کې د 6 جي بي بنډل پیرود تایید کړئ:\n",
+    "data_450.confirmation_prompt": "د 450 افغانیو په بدل کې د 6 جي بي بنډل واخلئ؟ 1: سمه ده، 2: لغوه",
+    "data_450.success_prompt": "د 450 افغانیو 6 جي بي بنډل فعال شو\nرسید: {receipt_number}",
+    "data_670.steps.0.prompt": "د 670 افغانیو په بدل کې د 10 جي بي بنډل پیرود تایید کړئ:\n",
+    "data_670.confirmation_prompt": "د 670 افغانیو په بدل کې د 10 جي بي بنډل واخلئ؟ 1: سمه ده، 2: لغوه",
+    "data_670.success_prompt": "د 670 افغانیو 10 جي بي بنډل فعال شو\nرسید: {receipt_number}",
+    "data_1220.steps.0.prompt": "د 1220 افغانیو په بدل کې د 22.2 جي بي بنډل پیرود تایید کړئ:\n",
+    "data_1220.confirmation_prompt": "د 1220 افغانیو په بدل کې د 22.2 جي بي بنډل واخلئ؟ 1: سمه ده، 2: لغوه",
+    "data_1220.success_prompt": "د 1220 افغانیو 22.2 جي بي بنډل فعال شو\nرسید: {receipt_number}",
+    "voice_bundle.prompt": "د غږ بنډل: یو انتخاب وټاکئ:",
+    "voice_bundle.options.0.label": "50 افغانۍ: 200 دقیقې",
+    "voice_bundle.options.1.label": "100 افغانۍ: 550 دقیقې",
+    "voice_bundle.options.2.label": "200 افغانۍ: 1000 دقیقې",
+    "voice_bundle.options.3.label": "550 افغانۍ: 6600 دقیقې",
+    "voice_50.steps.0.prompt": "د 50 افغانیو په بدل کې د 200 دقیقو بنډل پیرود تایید کړئ:\n",
+    "voice_50.confirmation_prompt": "د 50 افغانیو په بدل کې د 200 دقیقو بنډل واخلئ؟ 1: سمه ده، 2: لغوه",
+    "voice_50.success_prompt": "د 50 افغانیو 200 دقیقو بنډل فعال شو\nرسید: {receipt_number}",
+    "voice_100.steps.0.prompt": "د 100 افغانیو په بدل کې د 550 دقیقو بنډل پیرود تایید کړئ:\n",
+    "voice_100.confirmation_prompt": "د 100 افغانیو په بدل کې د 550 دقیقو بنډل واخلئ؟ 1: سمه ده، 2: لغوه",
+    "voice_100.success_prompt": "د 100 افغانیو 550 دقیقو بنډل فعال شو\nرسید: {receipt_number}",
+    "voice_200.steps.0.prompt": "د 200 افغانیو په بدل کې د 1000 دقیقو بنډل پیرود تایید کړئ:\n",
+    "voice_200.confirmation_prompt": "د 200 افغانیو په بدل کې د 1000 دقیقو بنډل واخلئ؟ 1: سمه ده، 2: لغوه",
+    "voice_200.success_prompt": "د 200 افغانیو 1000 دقیقو بنډل فعال شو\nرسید: {receipt_number}",
+    "voice_550.steps.0.prompt": "د 550 افغانیو په بدل کې د 6600 دقیقو بنډل پیرود تایید کړئ:\n",
+    "voice_550.confirmation_prompt": "د 550 افغانیو په بدل کې د 6600 دقیقو بنډل واخلئ؟ 1: سمه ده، 2: لغوه",
+    "voice_550.success_prompt": "د 550 افغانیو 6600 دقیقو بنډل فعال شو\nرسید: {receipt_number}",
+    "others_bundle.steps.0.prompt": "د منزل شمیره ولیکئ:\n",
+    "others_bundle.confirmation_prompt": "{phone_number} ته بنډل واخلئ؟ 1: سمه ده، 2: لغوه",
+    "others_bundle.success_prompt": "په بریالیتوب سره د {phone_number} لپاره بنډل واخیستل شو\nرسید: {receipt_number}",
+    "others_bundle_type.prompt": "د بنډل ډول: یو انتخاب وټاکئ:",
+    "others_bundle_type.options.0.label": "د ډیټا بنډل",
+    "others_bundle_type.options.1.label": "د غږ بنډل",
+    "others_data_bundle.prompt": "د نورو لپاره د ډیټا بنډل: یو انتخاب وټاکئ:",
+    "others_data_bundle.options.0.label": "280 افغانۍ: 2.5 جي بي",
+    "others_data_bundle.options.1.label": "450 افغانۍ: 6 جي بي",
+    "others_data_bundle.options.2.label": "670 افغانۍ: 10 جي بي",
+    "others_data_bundle.options.3.label": "1220 افغانۍ: 22.2 جي بي",
+    "others_data_280.steps.0.prompt": "د ۲۸۰ افغانیو په بدل کې د ۲.۵ جي بي بنډل پیرود تایید کړئ:\n",
+    "others_data_280.confirmation_prompt": "د منزل شمیرې لپاره د 280 افغانیو په بدل کې 2.5 جي بي بنډل واخلئ؟ 1: سمه ده، 2: لغوه",
+    "others_data_280.success_prompt": "د منزل شمیرې لپاره د 280 افغانیو 2.5 جي بي بنډل فعال شو\nرسید: {receipt_number}",
+    "others_data_450.steps.0.prompt": "د ۴۵۰ افغانیو په بدل کې د ۶ جي بي بنډل پیرود تایید کړئ:\n",
+    "others_data_450.confirmation_prompt": "د منزل شمیرې لپاره د 450 افغانیو په بدل کې 6 جي بي بنډل واخلئ؟ 1: سمه ده، 2: لغوه",
+    "others_data_450.success_prompt": "د منزل شمیرې لپاره د 450 افغانیو 6 جي بي بنډل فعال شو\nرسید: {receipt_number}",
+    "others_data_670.steps.0.prompt": "د ۶۷۰ افغانیو په بدل کې د ۱۰ جي بي بنډل پیرود تایید کړئ:\n",
+    "others_data_670.confirmation_prompt": "د منزل شمیرې لپاره د 670 افغانیو په بدل کې 10 جي بي بنډل واخلئ؟ 1: سمه ده، 2: لغوه",
+    "others_data_670.success_prompt": "د منزل شمیرې لپاره د 670 افغانیو 10 جي بي بنډل فعال شو\nرسید: {receipt_number}",
+    "others_data_1220.steps.0.prompt": "د ۱۲۲۰ افغانیو په بدل کې د ۲۲.۲ جي بي بنډل پیرود تایید کړئ:\n",
+    "others_data_1220.confirmation_prompt": "د منزل شمیرې لپاره د 1220 افغانیو په بدل کې 22.2 جي بي بنډل واخلئ؟ 1: سمه ده، 2: لغوه",
+    "others_data_1220.success_prompt": "د منزل شمیرې لپاره د 1220 افغانیو 22.2 جي بي بنډل فعال شو\nرسید: {receipt_number}",
+    "others_voice_bundle.prompt": "د نورو لپاره د غږ بنډل: یو انتخاب وټاکئ:",
+    "others_voice_bundle.options.0.label": "50 افغانۍ: 200 دقیقې",
+    "others_voice_bundle.options.1.label": "100 افغانۍ: 550 دقیقې",
+    "others_voice_bundle.options.2.label": "200 افغانۍ: 1000 دقیقې",
+    "others_voice_bundle.options.3.label": "550 افغانۍ: 6600 دقیقې",
+    "others_voice_50.steps.0.prompt": "د ۵۰ افغانیو په بدل کې د ۲۰۰ دقیقو بنډل پیرود تایید کړئ:\n",
+    "others_voice_50.confirmation_prompt": "د منزل شمیرې لپاره د 50 افغانیو په بدل کې 200 دقیقې بنډل واخلئ؟ 1: سمه ده، 2: لغوه",
+    "others_voice_50.success_prompt": "د منزل شمیرې لپاره د 50 افغانیو 200 دقیقو بنډل فعال شو\nرسید: {receipt_number}",
+    "others_voice_100.steps.0.prompt": "د ۱۰۰ افغانیو په بدل کې د ۵۵۰ دقیقو بنډل پیرود تایید کړئ:\n",
+    "others_voice_100.confirmation_prompt": "د منزل شمیرې لپاره د 100 افغانیو په بدل کې 550 دقیقې بنډل واخلئ؟ 1: سمه ده، 2: لغوه",
+    "others_voice_100.success_prompt": "د منزل شمیرې لپاره د 100 افغانیو 550 دقیقو بنډل فعال شو\nرسید: {receipt_number}",
+    "others_voice_200.steps.0.prompt": "د ۲۰۰ افغانیو په بدل کې د ۱۰۰۰ دقیقو بنډل پیرود تایید کړئ:\n",
+    "others_voice_200.confirmation_prompt": "د منزل شمیرې لپاره د 200 افغانیو په بدل کې 1000 دقیقې بنډل واخلئ؟ 1: سمه ده، 2: لغوه",
+    "others_voice_200.success_prompt": "د منزل شمیرې لپاره د 200 افغانیو 1000 دقیقو بنډل فعال شو\nرسید: {receipt_number}",
+    "others_voice_550.steps.0.prompt": "د ۵۵۰ افغانیو په بدل کې د ۶۶۰۰ دقیقو بنډل پیرود تایید کړئ:\n",
+    "others_voice_550.confirmation_prompt": "د منزل شمیرې لپاره د 550 افغانیو په بدل کې 6600 دقیقې بنډل واخلئ؟ 1: سمه ده، 2: لغوه",
+    "others_voice_550.success_prompt": "د منزل شمیرې لپاره د 550 افغانیو 6600 دقیقو بنډل فعال شو\nرسید: {receipt_number}",
+    "approvals_menu.prompt": "د منظوریو لیدو لپاره خپل پټ نوم ولیکئ:",
+    "approvals_menu.confirmation_prompt": "منظورۍ وګورئ؟ 1: سمه ده، 2: لغوه",
+    "approvals_menu.success_prompt": "منظورۍ: {approvals}\nوضعیت: {status}",
+    "exit_node.prompt": "زموږ د خدمت څخه د کار اخیستو څخه مننه\n",
+}
@@ -0,0 +1,178 @@
+import logging
+from collections import deque
+from typing import Dict, Any, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Nodes every non-exit node can jump to on "0", hard-wired in the node classes
+EXIT_NODE_ID = "exit_node"
+ACTION_NODE_TYPES = ("single_input_action", "multi_input_action", "cache_post")
+
+class GraphReport:
+    """Result of analyze_graph; empty lists mean the graph is sound."""
+    def __init__(self):
+        self.unreachable: List[str] = []  # Nodes no dialog can ever reach from the root
+        self.dangling: List[str] = []  # "node -> target" edges whose target does not exist
+        self.traps: List[List[str]] = []  # Cycles (strongly connected groups) from which no exit node can be reached
+        self.bad_services: List[str] = []  # "node: error" for service paths that cannot be loaded
+        self.round_trips: Dict[str, int] = {}  # Action node -> fewest dialog round trips to reach it (Begin included)
+
+    @property
+    def ok(self) -> bool:
+        return not (self.dangling or self.traps or self.bad_services)
+
+    def log(self, name: str = "menu graph"):
+        for edge in self.dangling:
+            logger.error(f"{name}: transition to missing node {edge}")
+        for trap in self.traps:
+            logger.error(f"{name}: cycle without exit {' -> '.join(trap)}")
+        for problem in self.bad_services:
+            logger.error(f"{name}: {problem}")
+        if self.unreachable:
+            logger.warning(f"{name}: unreachable nodes {', '.join(self.unreachable)}")
+        if self.round_trips:
+            deepest = max(self.round_trips.values())
+            logger.info(f"{name}: {len(self.round_trips)} action nodes, "
+                        f"{min(self.round_trips.values())}-{deepest} round trips to reach")
+
+def graph_edges(config: Dict[str, Any], transitions: Dict[str, Dict[str, str]]) -> Dict[str, List[str]]:
+    """Every node a node can hand the dialog to: options, transitions, gate outcomes and the implicit exit on "0".
+
+    Back ("9") is left out: it only returns along the navigation stack, i.e. to a node that reached this one.
+    """
+    edges = {}
+    for node_id, node_config in config.items():
+        node_type = node_config.get("type")
+        targets = [option["target_menu"] for option in node_config.get("options", []) if "target_menu" in option]
+        targets.extend(transitions.get(node_id, {}).values())
+        if node_type == "validation_gate":
+            if "failure" not in transitions.get(node_id, {}):
+                targets.append(EXIT_NODE_ID)  # Default once attempts run out
+        elif node_type != "exit":
+            targets.append(EXIT_NODE_ID)
+        edges[node_id] = list(dict.fromkeys(targets))
+    return edges
+
+def _strongly_connected(nodes: List[str], edges: Dict[str, List[str]]) -> List[List[str]]:
+    """Tarjan's algorithm, iterative so deep menus cannot hit the recursion limit"""
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    on_stack: Set[str] = set()
+    stack: List[str] = []
+    components = []
+    for start in nodes:
+        if start in index:
+            continue
+        work = [(start, 0)]
+        while work:
+            node_id, position = work.pop()
+            if position == 0:
+                index[node_id] = lowlink[node_id] = len(index)
+                stack.append(node_id)
+                on_stack.add(node_id)
+            targets = [target for target in edges.get(node_id, []) if target in edges]
+            if position < len(targets):
+                work.append((node_id, position + 1))
+                target = targets[position]
+                if target not in index:
+                    work.append((target, 0))
+                elif target in on_stack:
+                    lowlink[node_id] = min(lowlink[node_id], index[target])
+                continue
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node_id])
+            if lowlink[node_id] == index[node_id]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node_id:
+                        break
+                components.append(component)
+    return components
+
+def analyze_graph(config: Dict[str, Any], transitions: Dict[str, Dict[str, str]], root_node_id: Optional[str],
+                  check_services: bool = False) -> GraphReport:
+    """Static checks over a validated menu config, run once when its graph is compiled.
+
+    check_services also imports every service class named by action_url/validation_url; that is what
+    building the nodes lazily would otherwise only do (and fail at) on a subscriber's first visit.
+    """
+    report = GraphReport()
+    edges = graph_edges(config, transitions)
+
+    for node_id, targets in edges.items():
+        for target in targets:
+            if target not in config:
+                report.dangling.append(f"{node_id} -> {target}")
+
+    # Breadth-first from the root: depth + 1 is the round trip (Begin included) that shows the node
+    depth = {}
+    if root_node_id in config:
+        depth[root_node_id] = 1
+        queue = deque([root_node_id])
+        while queue:
+            node_id = queue.popleft()
+            for target in edges[node_id]:
+                if target in config and target not in depth:
+                    depth[target] = depth[node_id] + 1
+                    queue.append(target)
+    report.unreachable = [node_id for node_id in config if node_id not in depth]
+    report.round_trips = {
+        node_id: round_trips for node_id, round_trips in depth.items()
+        if config[node_id].get("type") in ACTION_NODE_TYPES
+    }
+
+    # Nodes that can still end the dialog: exit nodes and everything with a path to one
+    reverse: Dict[str, List[str]] = {node_id: [] for node_id in config}
+    for node_id, targets in edges.items():
+        for target in targets:
+            if target in reverse:
+                reverse[target].append(node_id)
+    can_exit = {node_id for node_id, node_config in config.items() if node_config.get("type") == "exit"}
+    queue = deque(can_exit)
+    while queue:
+        for source in reverse[queue.popleft()]:
+            if source not in can_exit:
+                can_exit.add(source)
+                queue.append(source)
+    for component in _strongly_connected(list(config), edges):
+        if component[0] in can_exit:
+            continue
+        if len(component) > 1 or component[0] in edges[component[0]]:
+            report.traps.append(sorted(component))
+
+    if check_services:
+        from src.services.service_registery import ServiceRegistry
+        for node_id, node_config in config.items():
+            path = node_config.get("validation_url", "") or node_config.get("action_url", "")
+            if path and not path.startswith("http"):
+                try:
+                    ServiceRegistry.resolve(path)
+                except ValueError as e:
+                    report.bad_services.append(f"{node_id}: {e}")
+    return report
+
+if __name__ == "__main__":
+    import sys
+    import time
+    from src.menu.graph.schemas.schema_utils import load_config_from_source, get_validated_config
+    from src.menu.graph.nodes.menu_engine import compile_transitions, NODE_TYPES
+
+    # python -m src.menu.graph.graph_analysis [config source]: full report, service imports included
+    source = sys.argv[1] if len(sys.argv) > 1 else "src/menu/graph/demo_menu_config.py"
+    config = get_validated_config(source, load_config_from_source(source))
+    start = time.perf_counter()
+    root = next((node_id for node_id, node_config in config.items() if node_config.get("type") in NODE_TYPES), None)
+    report = analyze_graph(config, compile_transitions(config), root, check_services=True)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"Dangling transitions : {report.dangling or 'none'}")
+    print(f"Cycles without exit  : {report.traps or 'none'}")
+    print(f"Unloadable services  : {report.bad_services or 'none'}")
+    print(f"Unreachable nodes    : {report.unreachable or 'none'}")
+    print("Round trips to each action node (Begin + inputs; a dial-string shortcut needs 2):")
+    for node_id, round_trips in sorted(report.round_trips.items(), key=lambda item: (item[1], item[0])):
+        print(f"  {round_trips}  {node_id}")
+    print(f"Analysis took {elapsed:.1f} ms including service imports")
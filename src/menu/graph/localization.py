@@ -0,0 +1,71 @@
+import copy
+from typing import Dict, Any, List, Union
+
+# Language of the texts written in the structural config itself (and USSDSession.language's default)
+DEFAULT_LANGUAGE = "en"
+
+# Node config fields holding subscriber-facing text; everything else is structure shared by all languages
+TEXT_FIELDS = ("prompt", "label", "confirmation_prompt", "success_prompt", "error_prompt", "failure_prompt")
+
+# Texts the engine shows itself rather than reads from a node config; string tables translate them under
+# the same keys
+SYSTEM_TEXTS = {
+    "system.service_unavailable": "Service temporarily unavailable, please try again later",
+    "system.back_or_exit": "Press 9 to go back, 0 to exit",  # What to do next after it, on most nodes
+}
+
+def _split_path(path: str) -> List[Union[str, int]]:
+    return [int(part) if part.isdigit() else part for part in path.split(".")]
+
+def localize_config(config: Dict[str, Any], strings: Dict[str, str]) -> Dict[str, Any]:
+    """Overlay a string table onto a structural config.
+
+    Keys are dotted paths into the config, e.g. "main_menu.options.0.label" or "change_pin.steps.1.prompt".
+    SYSTEM_TEXTS keys are skipped (see system_texts). Only nodes with a translated text are copied; every other node config is the very same object as in
+    `config`, which lets graphs share the built node. Unknown or non-text paths raise ValueError so tables
+    cannot silently drift from the graph.
+    """
+    localized = dict(config)
+    copied = set()
+    for path, text in strings.items():
+        if path in SYSTEM_TEXTS:
+            continue
+        parts = _split_path(path)
+        node_id, field = parts[0], parts[-1]
+        if node_id not in config or field not in TEXT_FIELDS:
+            raise ValueError(f"Invalid string table entry {path}: not a text field of the menu graph")
+        if node_id not in copied:
+            localized[node_id] = copy.deepcopy(config[node_id])
+            copied.add(node_id)
+        target = localized[node_id]
+        try:
+            for part in parts[1:-1]:
+                target = target[part]
+            if not isinstance(target[field], str):
+                raise TypeError
+        except (KeyError, IndexError, TypeError):
+            raise ValueError(f"Invalid string table entry {path}: not a text field of the menu graph")
+        target[field] = text
+    return localized
+
+def system_texts(strings: Dict[str, str]) -> Dict[str, str]:
+    """SYSTEM_TEXTS with the translations a string table has for them"""
+    return {key: strings.get(key, text) for key, text in SYSTEM_TEXTS.items()}
+
+def extract_strings(config: Dict[str, Any], translated: Dict[str, Any]) -> Dict[str, str]:
+    """String table holding every text of `translated` that differs from `config` (same structure expected)"""
+    strings = {}
+
+    def walk(base: Any, other: Any, path: str):
+        if isinstance(base, dict):
+            for key, value in base.items():
+                if key in other:
+                    walk(value, other[key], f"{path}.{key}" if path else key)
+        elif isinstance(base, list):
+            for index, (value, other_value) in enumerate(zip(base, other)):
+                walk(value, other_value, f"{path}.{index}")
+        elif path.rsplit(".", 1)[-1] in TEXT_FIELDS and base != other:
+            strings[path] = other
+
+    walk(config, translated, "")
+    return strings
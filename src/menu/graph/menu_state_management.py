@@ -1,65 +1,69 @@
 from typing import Dict, Any, Optional
-import threading
-import time
-from datetime import datetime, timedelta
-from src.menu.graph.nodes.menu_engine import MenuEngine, load_Menu_engine
+from datetime import datetime
+from src.gw.ussd_session_utils import SessionStore, USSDSessionManager, USSDSession
+from src.menu.graph.nodes.menu_engine import MenuEngine, get_menu_graph, load_Menu_engine
 
 class MenuSessionManager:
-    def __init__(self, session_timeout_minutes: int = 500000):
-        self.session_timeout = timedelta(minutes=session_timeout_minutes)
-        self.sessions = {}  # msisdn -> {'engine': MenuEngine, 'config': Dict, 'last_activity': datetime}
-        self.lock = threading.Lock()
-        self.cleanup_thread = None
-        self.running = True
-        self._start_cleanup_thread()
+    """Menu view over the shared session store: the engine lives on the USSDSession itself,
+    so it is looked up, expired and ended together with the dialog metadata."""
+    def __init__(self, session_store: Optional[SessionStore] = None):
+        self.session_store = session_store or USSDSessionManager()
 
-    def _start_cleanup_thread(self):
-        self.cleanup_thread = threading.Thread(target=self._cleanup_expired_sessions, daemon=True)
-        self.cleanup_thread.start()
-        print("Session cleanup thread started")
+    def engine_for(self, session: USSDSession, config: Optional[Dict] = None) -> MenuEngine:
+        """Return the session's menu cursor: the live one, one unpacked from its record, or a new one from config.
 
-    def _cleanup_expired_sessions(self):
-        while self.running:
-            try:
-                with self.lock:
-                    current_time = datetime.now()
-                    expired_msisdns = [
-                        msisdn for msisdn, session_data in self.sessions.items()
-                        if current_time - session_data['last_activity'] > self.session_timeout
-                    ]
-                    for msisdn in expired_msisdns:
-                        self.sessions[msisdn]['engine'] = None
-                        del self.sessions[msisdn]
-                        print(f"Session expired for MSISDN: {msisdn}")
-                time.sleep(30)
-            except Exception as e:
-                print(f"Error in cleanup thread: {e}")
-
-    def get_or_create_session(self, msisdn: str, config: Optional[Dict] = None) -> MenuEngine:
-        with self.lock:
-            current_time = datetime.now()
-            if msisdn in self.sessions:
-                session_data = self.sessions[msisdn]
-                session_data['last_activity'] = current_time
-                return session_data['engine']
-            else:
+        The cursor runs on the graph variant for session.language.
+        No lock: requests for one MSISDN are already serialized by the dialog sequencer.
+        """
+        engine = session.menu_engine
+        if engine is not None:
+            return engine
+        if session.menu_record is not None:
+            graph = session.menu_graph
+            if graph is None:
+                # Loaded from a shared store: resume where the previous request (maybe on another node) left off
                 if config is None:
                     raise ValueError("Config required for new session")
-                engine = load_Menu_engine(msisdn, config, "")
-                self.sessions[msisdn] = {
-                    'engine': engine,
-                    'config': config,
-                    'last_activity': current_time
-                }
-                print(f"New session created for MSISDN: {msisdn}")
-                return engine
+                graph = session.menu_graph = get_menu_graph(config)
+            engine = MenuEngine.unpack(graph.for_language(session.language), session.msisdn, session.menu_record)
+        else:
+            if config is None:
+                raise ValueError("Config required for new session")
+            engine = load_Menu_engine(session.msisdn, config, "")
+            session.menu_graph = engine.graph
+            if session.language != engine.language:
+                engine.set_language(session.language)
+            print(f"New session created for MSISDN: {session.msisdn}")
+        session.menu_engine = engine
+        return engine
+
+    def park_engine(self, session: USSDSession):
+        """Fold the live engine back into the session's compact record once a request is done with it."""
+        engine = session.menu_engine
+        if engine is not None:
+            session.menu_record = engine.pack()
+            session.language = engine.language  # The subscriber may have switched language during the request
+            session.menu_engine = None
+
+    def _session(self, msisdn: str, config: Optional[Dict] = None) -> USSDSession:
+        if config is None:
+            session = self.session_store.get_session(msisdn)
+            if session is None:
+                raise ValueError("Config required for new session")
+        else:
+            session = self.session_store.get_or_create_session(msisdn)
+        session.update_activity()
+        return session
+
+    def get_or_create_session(self, msisdn: str, config: Optional[Dict] = None) -> MenuEngine:
+        """Live engine for an MSISDN; call park_engine on its session when done so changes are kept."""
+        return self.engine_for(self._session(msisdn, config), config)
 
     def process_user_input(self, msisdn: str, user_input: str) -> Dict[str, Any]:
-        engine = self.get_or_create_session(msisdn)
-        with self.lock:
-            if msisdn in self.sessions:
-                self.sessions[msisdn]['last_activity'] = datetime.now()
+        session = self._session(msisdn)
+        engine = self.engine_for(session)
         response = engine.process_user_input(user_input)
+        self.park_engine(session)
         if not engine.session_active:
             print(f"Session ended for MSISDN: {msisdn}")
             self.end_session(msisdn)
@@ -67,23 +71,60 @@ class MenuSessionManager:
         return {'text': response, 'end_session': not engine.session_active or response == "0"}
 
     def get_initial_prompt(self, msisdn: str) -> str:
-        engine = self.get_or_create_session(msisdn)
-        return engine.get_current_prompt()
+        session = self._session(msisdn)
+        prompt = self.engine_for(session).get_current_prompt()
+        self.park_engine(session)
+        return prompt
 
     def end_session(self, msisdn: str):
-        with self.lock:
-            if msisdn in self.sessions:
-                del self.sessions[msisdn]
-                print(f"Session ended for MSISDN: {msisdn}")
+        session = self.session_store.get_session(msisdn)
+        if session is not None:
+            self.session_store.end_session(session)
+            print(f"Session ended for MSISDN: {msisdn}")
 
     def get_active_sessions(self) -> Dict[str, datetime]:
-        with self.lock:
-            return {msisdn: data['last_activity'] for msisdn, data in self.sessions.items()}
+        return self.session_store.get_active_sessions()
 
     def shutdown(self):
-        self.running = False
-        if self.cleanup_thread:
-            self.cleanup_thread.join()
-        with self.lock:
-            self.sessions.clear()
-        print("Session manager shutdown complete")
\ No newline at end of file
+        self.session_store.shutdown()
+        print("Session manager shutdown complete")
+
+if __name__ == "__main__":
+    import copy
+    import gc
+    import tracemalloc
+    from src.menu.graph.demo_menu_config import config as demo_config
+
+    # Memory per live session: engine kept between requests (before) vs packed record (after)
+    config = copy.deepcopy(demo_config)
+    config["root_validation_gate"].pop("validation_url", None)  # Keep the benchmark off the network
+    path = ["123456", "1", "9", "3", "70000000"]  # PIN, My Money, Back, Payment, bad account
+    sessions_per_run = 2000
+
+    def bytes_per_session(park: bool) -> float:
+        manager = MenuSessionManager(USSDSessionManager(cleanup_interval=3600))
+        get_menu_graph(config)  # Shared graph is not per-session memory
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        for i in range(sessions_per_run):
+            session = manager.session_store.create_session(f"9370{i:07d}", "s", "*222#", None)
+            engine = manager.engine_for(session, config)
+            engine.get_current_prompt()
+            for user_input in path:
+                engine.process_user_input(user_input)
+            if park:
+                manager.park_engine(session)
+        gc.collect()
+        used = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        manager.shutdown()
+        return used / sessions_per_run
+
+    import builtins
+    _print = builtins.print
+    builtins.print = lambda *args, **kwargs: None  # Silence per-session logging while measuring
+    live, parked = bytes_per_session(False), bytes_per_session(True)
+    builtins.print = _print
+    print(f"Live MenuEngine per session : {live:,.0f} bytes")
+    print(f"Packed record per session   : {parked:,.0f} bytes")
@@ -6,18 +6,15 @@ class ExitNode(MenuNode):
         super().__init__(node_id, config)
 
     """Node to terminate the session."""
-    def getNext(self) -> str:
+    async def getNext(self, engine: 'MenuEngine') -> str:
         return self.config.get("prompt", "Session ended")
     
-    def getPrevious(self) -> str:
-        if self.engine and self.engine.navigation_stack:
-            previous_node_id = self.engine.navigation_stack[-1]
-            previous_node = self.engine.nodes.get(previous_node_id)
-            if previous_node:
-                return previous_node.getNext()
+    async def getPrevious(self, engine: 'MenuEngine') -> str:
+        previous_node = engine.previous_node()
+        if previous_node:
+            return await previous_node.getNext(engine)
         return "No previous menu"
     
-    def handleUserInput(self, user_input: str) -> str:
-        if self.engine:
-            self.engine.session_active = False
+    async def handleUserInput(self, engine: 'MenuEngine', user_input: str) -> str:
+        engine.session_active = False
         return "Session ended"
@@ -1,5 +1,6 @@
 from typing import Dict, Any
-from src.menu.graph.nodes.node_abc import MenuNode
+from src.menu.graph.nodes.node_abc import MenuNode, NO_TARGET
+from src.gw.xml_escape import register_static_text
 
 class MenuNavigationNode(MenuNode):
     """Node for main menu or sub-menu navigation, linking to other nodes."""
@@ -8,46 +9,58 @@ class MenuNavigationNode(MenuNode):
         self.prompt = config.get("prompt", "Select an option:\n")
         self.options = config.get("options", [])
         self.valid_keys = {option["key"] for option in self.options} | {"9", "0"}
+        # Options that also switch the session's language (e.g. in the language menu)
+        self.languages = {option["key"]: option["language"] for option in self.options if "language" in option}
+        # Prompt, options and footer never change, so render them (and their escaped bytes) once
+        self.rendered_prompt = register_static_text(self.render_prompt(config))
+        self.invalid_selection_error = f"Invalid selection. Choose from {', '.join(sorted(self.valid_keys))}"
 
-    def getNext(self) -> str:
-        """Generate the menu prompt with options and validation error if any."""
-        options_text = "\n".join([f"{opt['key']}. {opt['label']}" for opt in self.options])
+    @staticmethod
+    def render_prompt(config: Dict[str, Any]) -> str:
+        """Full menu text: prompt, numbered options and the Back/Exit footer"""
+        prompt = config.get("prompt", "Select an option:\n")
+        options_text = "\n".join([f"{opt['key']}. {opt['label']}" for opt in config.get("options", [])])
         navigation_text = "\n9. Back\n0. Exit"
-        error_msg = f"\n{self.validation_error}" if self.validation_error else ""
-        return f"{self.prompt}\n{options_text}{navigation_text}{error_msg}"
+        return f"{prompt}\n{options_text}{navigation_text}"
 
-    def getPrevious(self) -> str:
+    async def getNext(self, engine: 'MenuEngine') -> str:
+        """Return the prerendered menu, plus the validation error if any."""
+        validation_error = engine.node_state(self)["validation_error"]
+        if validation_error:
+            return f"{self.rendered_prompt}\n{validation_error}"
+        return self.rendered_prompt
+
+    async def getPrevious(self, engine: 'MenuEngine') -> str:
         """Return the prompt of the previous node or a fallback message."""
-        if self.engine and self.engine.navigation_stack:
-            previous_node_id = self.engine.navigation_stack[-1]
-            previous_node = self.engine.nodes.get(previous_node_id)
-            if previous_node:
-                return previous_node.getNext()
+        previous_node = engine.previous_node()
+        if previous_node:
+            return await previous_node.getNext(engine)
         return "No previous menu\nPress 0 to exit"
 
-    def handleUserInput(self, user_input: str) -> str:
+    async def handleUserInput(self, engine: 'MenuEngine', user_input: str) -> str:
         """Process user input and transition to the selected node."""
-        self.validation_error = ""
+        state = engine.node_state(self)
+        state["validation_error"] = ""
 
         if user_input in self.valid_keys:
             if user_input == "9":
-                if self.engine and self.engine.navigation_stack:
-                    target_node_id = self.engine.navigation_stack.pop()
-                    self.engine.set_current_node(target_node_id)
-                    return self.engine.get_current_prompt()
+                if engine.go_back():
+                    return await engine.current_prompt()
                 return "No previous menu\nPress 0 to exit"
             elif user_input == "0":
-                if self.engine:
-                    self.engine.set_current_node("exit_node")
-                    return self.engine.get_current_prompt()
-                return "Session ended"
+                engine.set_current_node("exit_node")
+                return await engine.current_prompt()
             else:
-                target_node_id = next((opt["target_menu"] for opt in self.options if opt["key"] == user_input), None)
-                if target_node_id and self.engine:
-                    self.engine.navigation_stack.append(self.node_id)
-                    self.engine.set_current_node(target_node_id)
-                    return self.engine.get_current_prompt()
+                # Option targets come precompiled in key_targets (one array index per keypress)
+                target = self.key_target(user_input)
+                if target != NO_TARGET:
+                    language = self.languages.get(user_input)
+                    if language:
+                        engine.set_language(language)
+                    engine.navigation_stack.append(self.index)
+                    engine.set_current_index(target)
+                    return await engine.current_prompt()
         else:
-            self.validation_error = f"Invalid selection. Choose from {', '.join(sorted(self.valid_keys))}"
+            state["validation_error"] = self.invalid_selection_error
 
-        return self.getNext()
\ No newline at end of file
+        return await self.getNext(engine)
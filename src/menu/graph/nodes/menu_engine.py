@@ -1,6 +1,7 @@
-from typing import Dict, Any, Optional, List
-from src.menu.graph.nodes.node_abc import MenuNode
-from src.menu.graph.schemas.schema_utils import validate_node_config
+from typing import Dict, Any, Optional, List, Tuple
+from array import array
+import threading
+from src.menu.graph.nodes.node_abc import MenuNode, run_sync, NO_TARGET
 from src.menu.graph.nodes.multiInpu_action_node import MultiInputActionNode
 from src.menu.graph.nodes.valiadtion_gate import ValidationGateNode
 from src.menu.graph.nodes.main_menu import MenuNavigationNode
@@ -8,84 +9,382 @@ from src.menu.graph.nodes.single_input_action_node import SingleInputActionNode
 from src.menu.graph.nodes.exit_node import ExitNode
 from src.menu.graph.nodes.msisdn_node import Msisdn_Node
 from src.menu.graph.schemas.schema_utils import get_validated_config
+from src.menu.graph.localization import DEFAULT_LANGUAGE, SYSTEM_TEXTS, localize_config, system_texts
+from src.menu.graph.graph_analysis import GraphReport, analyze_graph
 import json
 
+# Node type -> MenuNode subclass
+NODE_TYPES = {
+    "multi_input_action": MultiInputActionNode,
+    "exit": ExitNode,
+    "single_input_action": SingleInputActionNode,
+    "menu_navigation": MenuNavigationNode,
+    "validation_gate": ValidationGateNode,
+    "cache_post": Msisdn_Node,
+}
+
+# Session record encoding: known node-state fields and "state" values are stored as their index
+_STATE_FIELDS = ("validation_error", "state", "current_step", "current_attempts", "input", "inputs", "success_prompt", "response_data",
+                 "shortcut")  # Append only: codes are stored in live session records
+_STATE_FIELD_CODES = {name: code for code, name in enumerate(_STATE_FIELDS)}
+_STATE_VALUES = ("initial", "input", "confirm", "complete")
+_STATE_VALUE_CODES = {name: code for code, name in enumerate(_STATE_VALUES)}
+_STATE_CODE = _STATE_FIELD_CODES["state"]
+_MISSING = object()
+
+def compile_transitions(config: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
+    """node id -> {condition: target node id}, from "transitions" and validation gates' on_success/on_failure"""
+    transitions = {}
+    for node_id, node_config in config.items():
+        node_transitions = dict(node_config.get("transitions", {}))
+        if node_config.get("type") == "validation_gate":
+            if "on_success" in node_config and isinstance(node_config["on_success"], dict) and "target_menu" in node_config["on_success"]:
+                node_transitions["success"] = node_config["on_success"]["target_menu"]
+            if "on_failure" in node_config and isinstance(node_config["on_failure"], dict) and "target_menu" in node_config["on_failure"]:
+                node_transitions["failure"] = node_config["on_failure"]["target_menu"]
+        if node_transitions:
+            transitions[node_id] = node_transitions
+    return transitions
+
+def compile_key_targets(config: Dict[str, Any], node_ids: List[str], node_index: Dict[str, int],
+                        transitions: Dict[str, Dict[str, str]]) -> List[array]:
+    """Per node index, an array('H') of 10 target node indexes addressed by key digit (NO_TARGET where unused).
+
+    Filled from "transitions" digits and menu options, so a keypress resolves with one array index.
+    """
+    key_targets = []
+    for node_id in node_ids:
+        targets = array("H", [NO_TARGET] * 10)
+        edges = list(transitions.get(node_id, {}).items())
+        edges.extend((option["key"], option["target_menu"]) for option in config[node_id].get("options", []))
+        for key, target in edges:
+            if len(key) == 1 and key in "0123456789" and target in node_index:
+                targets[int(key)] = node_index[target]
+        key_targets.append(targets)
+    return key_targets
+
+class MenuGraph:
+    """Compiled, read-only menu graph shared by every session using the same config.
+
+    Nodes (and the services they import) are built on first visit, so startup and memory
+    scale with the paths subscribers actually take rather than with the config size.
+
+    Other languages are variants of the same graph (see add_language): same node indexes and
+    transitions, only the texts differ, and nodes whose texts are not translated are shared.
+    """
+    def __init__(self, config: Dict[str, Any], transitions: Optional[Dict[str, Dict[str, str]]] = None,
+                 base: Optional["MenuGraph"] = None, language: str = DEFAULT_LANGUAGE):
+        self.config = config
+        self.base = base  # Graph in the default language, None for the base graph itself
+        self.language = language
+        self.variants: Dict[str, MenuGraph] = {language: self}  # language -> graph, kept on the base graph
+        self.shortcuts: Dict[Tuple[str, ...], Optional[List[int]]] = {}  # Resolved dial-string shortcuts, kept on the base graph
+        # Outgoing edges per node; precompiled config artifacts supply them ready-made
+        self.transitions = transitions if transitions is not None else compile_transitions(config)
+        self.nodes: Dict[str, MenuNode] = {}  # Nodes instantiated so far
+        self._build_lock = threading.Lock()
+        # Node index -> node id; engines and session records only ever hold these dense indexes
+        if base is not None:
+            # Language variants keep the base graph's node indexes, so packed sessions survive a language switch
+            self.node_ids, self.node_index, self.key_targets = base.node_ids, base.node_index, base.key_targets
+        else:
+            self.node_ids: List[str] = [
+                node_id for node_id, node_config in config.items()
+                if node_config.get("type") in NODE_TYPES  # Skip invalid node types (already validated, so this should not happen)
+            ]
+            self.node_index: Dict[str, int] = {node_id: index for index, node_id in enumerate(self.node_ids)}
+            self.key_targets: List[array] = compile_key_targets(config, self.node_ids, self.node_index, self.transitions)
+        self.nodes_by_index: List[Optional[MenuNode]] = [None] * len(self.node_ids)  # Same nodes, by index
+        self.root_node_id: Optional[str] = self.node_ids[0] if self.node_ids else None
+        self.exit_index: int = self.node_index.get("exit_node", NO_TARGET)  # Target of "0" everywhere
+        self.report: Optional[GraphReport] = None  # Static analysis, filled in by get_menu_graph
+        self.texts: Dict[str, str] = dict(SYSTEM_TEXTS)  # Engine-generated texts in this graph's language
+
+    def _build_node(self, node_id: str) -> MenuNode:
+        node_config = self.config[node_id]
+        node = NODE_TYPES[node_config["type"]](node_id, node_config)
+        node.index = self.node_index[node_id]
+        node.key_targets = self.key_targets[node.index]
+        for condition, target in self.transitions.get(node_id, {}).items():
+            node.add_transition(condition, target)
+        return node
+
+    def find_node(self, node_id: str) -> Optional[MenuNode]:
+        """Return the node, building it on first use; None if the config has no such node."""
+        node = self.nodes.get(node_id)
+        if node is None and node_id in self.node_index:
+            if self.base is not None and self.config[node_id] is self.base.config[node_id]:
+                # Nothing to translate in this node: share the default-language one
+                node = self.base.find_node(node_id)
+                self.nodes[node_id] = node
+                self.nodes_by_index[node.index] = node
+                return node
+            with self._build_lock:
+                node = self.nodes.get(node_id)
+                if node is None:
+                    node = self._build_node(node_id)
+                    self.nodes[node_id] = node
+                    self.nodes_by_index[node.index] = node
+        return node
+
+    def node_at(self, index: int) -> MenuNode:
+        """Node by dense index, building it on first use"""
+        node = self.nodes_by_index[index]
+        if node is None:
+            node = self.get_node(self.node_ids[index])
+        return node
+
+    def get_node(self, node_id: str) -> MenuNode:
+        node = self.find_node(node_id)
+        if node is None:
+            raise ValueError(f"Node {node_id} not found")
+        return node
+
+    def add_language(self, language: str, strings: Dict[str, str]) -> "MenuGraph":
+        """Register a string table (see localize_config) as a language variant of this graph."""
+        base = self.base or self
+        if language == base.language:
+            raise ValueError(f"Language {language} is the graph's own language")
+        variant = MenuGraph(localize_config(base.config, strings), base.transitions, base, language)
+        variant.texts = system_texts(strings)
+        base.variants[language] = variant
+        return variant
+
+    def resolve_shortcut(self, keys: Tuple[str, ...]) -> Optional[List[int]]:
+        """Node ids a subscriber passes through by typing `keys` once past the root (PIN) gate, target last.
+
+        e.g. ("1", "4") -> indexes of [main_menu, my_money_menu, transfer_menu]; None if a key leads nowhere.
+        Resolved from the transition arrays alone, so no node is built, and cached per key sequence.
+        """
+        base = self.base or self
+        route = base.shortcuts.get(keys, _MISSING)
+        if route is _MISSING:
+            route = base._walk_shortcut(keys)
+            if len(base.shortcuts) < 1024:  # Keys come from subscribers: bound what mistyped codes can cost
+                base.shortcuts[keys] = route
+        return route
+
+    def _walk_shortcut(self, keys: Tuple[str, ...]) -> Optional[List[int]]:
+        node_id = self.root_node_id
+        if node_id is None:
+            return None
+        if self.config[node_id]["type"] == "validation_gate":
+            node_id = self.transitions.get(node_id, {}).get("success")
+        if node_id not in self.node_index:
+            return None
+        route = [self.node_index[node_id]]
+        for key in keys:
+            # Only menus are walked; "9"/"0" are Back/Exit there, never a way deeper
+            if self.config[self.node_ids[route[-1]]]["type"] != "menu_navigation" or len(key) != 1 or key not in "12345678":
+                return None
+            target = self.key_targets[route[-1]][int(key)]
+            if target == NO_TARGET:
+                return None
+            route.append(target)
+        return route
+
+    def for_language(self, language: Optional[str]) -> "MenuGraph":
+        """This graph in the given language; languages without a string table get the default texts."""
+        base = self.base or self
+        return base.variants.get(language, base)
+
 class MenuEngine:
-    """Engine to manage nodes and handle user interactions."""
-    def __init__(self):
-        self.nodes: Dict[str, MenuNode] = {}
+    """Per-session cursor over a shared MenuGraph: current node, navigation stack and per-node state.
+
+    Everything is held as dense node indexes. Only lives for the duration of a request;
+    between requests a session keeps pack() bytes.
+    """
+    __slots__ = ("graph", "msisdn", "current_node", "current_index", "session_active", "navigation_stack",
+                 "node_states", "async_backend", "backend_unavailable")
+
+    def __init__(self, graph: MenuGraph, msisdn: str = ""):
+        self.graph = graph
+        self.msisdn = msisdn
         self.current_node: Optional[MenuNode] = None
-        self.current_node_id: Optional[str] = None
+        self.current_index = -1  # -1 until the cursor is placed
         self.session_active = True
-        self.navigation_stack: List[str] = []
-        
-    def add_node(self, node: MenuNode):
-        self.nodes[node.node_id] = node
-        node.set_engine(self)
-    
+        self.navigation_stack = array("H")  # Node indexes, 2 bytes each
+        self.node_states: Dict[int, Dict[str, Any]] = {}  # node index -> inputs/state collected so far
+        self.async_backend = False  # True while driven by the async methods: nodes then await doPostAsync
+        self.backend_unavailable = False  # Set by a node whose backend call failed fast (circuit open)
+
+    @property
+    def nodes(self) -> Dict[str, MenuNode]:
+        """Nodes instantiated so far; use graph.find_node to look one up."""
+        return self.graph.nodes
+
+    @property
+    def current_node_id(self) -> Optional[str]:
+        return self.graph.node_ids[self.current_index] if self.current_index >= 0 else None
+
     def set_current_node(self, node_id: str):
-        if node_id in self.nodes:
-            self.current_node = self.nodes[node_id]
-            self.current_node_id = node_id
-        else:
+        """Move to a node by id (config names such as "exit_node"); set_current_index is the fast path"""
+        index = self.graph.node_index.get(node_id)
+        if index is None:
             raise ValueError(f"Node {node_id} not found")
-    
+        self.set_current_index(index)
+
+    def set_current_index(self, index: int):
+        self.current_node = self.graph.node_at(index)
+        self.current_index = index
+
+    def go_back(self) -> bool:
+        """Return to the node on top of the navigation stack; False if it is empty"""
+        if not self.navigation_stack:
+            return False
+        self.set_current_index(self.navigation_stack.pop())
+        return True
+
+    def previous_node(self) -> Optional[MenuNode]:
+        """Node Back would return to, if any"""
+        return self.graph.node_at(self.navigation_stack[-1]) if self.navigation_stack else None
+
+    def enter_shortcut(self, keys: Tuple[str, ...]) -> bool:
+        """Start the dialog at the node `keys` lead to (from a dial string like *220*1*4#).
+
+        A root PIN gate is still asked first and forwards to the target once passed. Returns False,
+        leaving the engine untouched, when the keys lead nowhere.
+        """
+        route = self.graph.resolve_shortcut(keys)
+        if not route:
+            return False
+        if self.current_node is not None and self.current_index == 0 \
+                and self.graph.config[self.graph.root_node_id]["type"] == "validation_gate":
+            self.node_state(self.current_node)["shortcut"] = route
+        else:
+            self.navigation_stack.extend(route[:-1])
+            self.set_current_index(route[-1])
+        return True
+
+    @property
+    def language(self) -> str:
+        return self.graph.language
+
+    def set_language(self, language: str):
+        """Continue the session in another language; position and collected state are kept."""
+        self.graph = self.graph.for_language(language)
+        if self.current_index >= 0:
+            self.current_node = self.graph.node_at(self.current_index)
+
+    def node_state(self, node: MenuNode) -> Dict[str, Any]:
+        """Return this session's mutable state for a node, creating it on first use."""
+        state = self.node_states.get(node.index)
+        if state is None:
+            state = node.initial_state()
+            self.node_states[node.index] = state
+        return state
+
+    def reset_node_state(self, node: MenuNode):
+        self.node_states.pop(node.index, None)
+
+    def to_record(self) -> List[Any]:
+        """Compact, JSON-friendly snapshot of everything session-specific; the graph is never included.
+
+        [current node index (-1 if none), nav-stack node indexes, active flag,
+         [[node index, field code, value, field code, value, ...], ...]]
+        Node states equal to their initial_state() are left out, as are unchanged fields.
+        """
+        states = []
+        for index, state in self.node_states.items():
+            initial = self.graph.node_at(index).initial_state()
+            packed = [index]
+            for name, value in state.items():
+                if initial.get(name, _MISSING) == value:
+                    continue
+                if name == "state":
+                    value = _STATE_VALUE_CODES.get(value, value)
+                packed.append(_STATE_FIELD_CODES.get(name, name))
+                packed.append(value)
+            if len(packed) > 1:
+                states.append(packed)
+        return [self.current_index, self.navigation_stack.tolist(), int(self.session_active), states]
+
+    def pack(self) -> bytes:
+        """to_record() as compact JSON bytes (typically well under 200 bytes)"""
+        return json.dumps(self.to_record(), separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    @classmethod
+    def from_record(cls, graph: MenuGraph, msisdn: str, record: List[Any]) -> "MenuEngine":
+        current, navigation_stack, session_active, states = record
+        engine = cls(graph, msisdn)
+        if current >= 0:
+            engine.set_current_index(current)
+        engine.navigation_stack = array("H", navigation_stack)
+        engine.session_active = bool(session_active)
+        for packed in states:
+            index = packed[0]
+            state = graph.node_at(index).initial_state()
+            for i in range(1, len(packed), 2):
+                code, value = packed[i], packed[i + 1]
+                if code == _STATE_CODE and isinstance(value, int):
+                    value = _STATE_VALUES[value]
+                state[_STATE_FIELDS[code] if isinstance(code, int) else code] = value
+            engine.node_states[index] = state
+        return engine
+
+    @classmethod
+    def unpack(cls, graph: MenuGraph, msisdn: str, data: bytes) -> "MenuEngine":
+        return cls.from_record(graph, msisdn, json.loads(data))
+
     def process_user_input(self, user_input: str) -> str:
+        self.async_backend = False
+        return self._reply(run_sync(self.handle_input(user_input)))
+
+    async def process_user_input_async(self, user_input: str) -> str:
+        self.async_backend = True
+        return self._reply(await self.handle_input(user_input))
+
+    def get_current_prompt(self) -> str:
+        self.async_backend = False
+        return self._reply(run_sync(self.current_prompt()))
+
+    async def get_current_prompt_async(self) -> str:
+        self.async_backend = True
+        return self._reply(await self.current_prompt())
+
+    async def handle_input(self, user_input: str) -> str:
         if not self.current_node or not self.session_active:
             return "Session ended"
-        return self.current_node.handleUserInput(user_input)
-    
-    def get_current_prompt(self) -> str:
+        return await self.current_node.handleUserInput(self, user_input)
+
+    async def current_prompt(self) -> str:
         if self.current_node:
-            return self.current_node.getNext()
+            return await self.current_node.getNext(self)
         return "Session ended"
 
+    def _reply(self, response: str) -> str:
+        # A backend call failed fast during this request: say so instead of the node's generic failure text
+        if self.backend_unavailable:
+            self.backend_unavailable = False
+            return f"{self.graph.texts['system.service_unavailable']}\n{self.current_node.unavailable_hint(self)}"
+        return response
+
+# Compiled graphs, keyed by id() of the config dict (or by source when loaded from one)
+_GRAPH_CACHE: Dict[Any, Any] = {}
+_GRAPH_CACHE_LOCK = threading.Lock()
+
+def get_menu_graph(config: Dict[str, Any] = None, config_source: str = "",
+                   transitions: Optional[Dict[str, Dict[str, str]]] = None) -> MenuGraph:
+    """Return the shared compiled graph for a config, compiling it on first use."""
+    key = id(config) if config is not None else config_source
+    with _GRAPH_CACHE_LOCK:
+        entry = _GRAPH_CACHE.get(key)
+        if entry is None:
+            graph = MenuGraph(get_validated_config(config_source, config), transitions)
+            # Bad targets would otherwise only surface as "Node ... not found" mid-dialog
+            graph.report = analyze_graph(graph.config, graph.transitions, graph.root_node_id)
+            graph.report.log(config_source or "menu graph")
+            # Keep the config alive alongside its graph so the id() key cannot be reused
+            entry = (config, graph)
+            _GRAPH_CACHE[key] = entry
+        return entry[1]
+
 def load_Menu_engine(msisdn: str, config: Dict[str, Any] = None, config_source: str = "") -> MenuEngine:
-    """Load menu engine with configuration, using cached validated config."""
-    config = get_validated_config(config_source, config)
-    engine = MenuEngine()
-    for node_id, node_config in config.items():
-        node_config = node_config.copy()  # Create a copy to avoid modifying the cached config
-        node_config.update({"msisdn": msisdn})
-        node_type = node_config.get("type")
-        node: MenuNode
-        if node_type == "multi_input_action":
-            node = MultiInputActionNode(node_id, node_config)
-        elif node_type == "exit":
-            node = ExitNode(node_id, node_config)
-        elif node_type == "single_input_action":
-            node = SingleInputActionNode(node_id, node_config)
-        elif node_type == "menu_navigation":
-            node = MenuNavigationNode(node_id, node_config)
-        elif node_type == "validation_gate":
-            node = ValidationGateNode(node_id, node_config)
-        elif node_type == "cache_post":
-            node = Msisdn_Node(node_id, node_config)
-        else:
-            continue  # Skip invalid node types (already validated, so this should not happen)
-            
-        engine.add_node(node)
-    
-    for node_id, node_config in config.items():
-        if node_id not in engine.nodes:
-            continue
-        
-        node = engine.nodes[node_id]
-        
-        if "transitions" in node_config:
-            for key, target in node_config["transitions"].items():
-                node.add_transition(key, target)
-        
-        if node_config.get("type") == "validation_gate":
-            if "on_success" in node_config and isinstance(node_config["on_success"], dict) and "target_menu" in node_config["on_success"]:
-                node.add_transition("success", node_config["on_success"]["target_menu"])
-            if "on_failure" in node_config and isinstance(node_config["on_failure"], dict) and "target_menu" in node_config["on_failure"]:
-                node.add_transition("failure", node_config["on_failure"]["target_menu"])
-    
-    if engine.nodes:
-        first_node_id = next(iter(engine.nodes.keys()))
-        engine.set_current_node(first_node_id)
-    
+    """Create a session cursor positioned at the root of the shared compiled graph."""
+    graph = get_menu_graph(config, config_source)
+    engine = MenuEngine(graph, msisdn)
+    if graph.root_node_id:
+        engine.set_current_node(graph.root_node_id)
     return engine
 
 if __name__ == "__main__":
@@ -93,9 +392,9 @@ if __name__ == "__main__":
     def interactive_console():
         engine = load_Menu_engine("1000", demo_config, "")
         print(engine.get_current_prompt())
-        
+
         while engine.session_active:
             user_input = input("> ")
             print(engine.process_user_input(user_input))
-    
-    interactive_console()
\ No newline at end of file
+
+    interactive_console()
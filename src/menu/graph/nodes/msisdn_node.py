@@ -10,70 +10,63 @@ class Msisdn_Node(MenuNode):
         self.cache_params = config.get("cache_params", {})
         self.action_url = config.get("action_url", "no url configured for Msisdn_Node")
         self.valid_keys = {"9", "0"}
-        self.state = "initial"  # initial -> complete
-        self.response_data = None
 
-    def parseResponse(self, response_data: Any) -> Any:
-        """Parse the JSON response from the POST request."""
-        if response_data and isinstance(response_data, dict):
-            return response_data
-        self.validation_error = "Request failed: Invalid response"
-        return None
+    def initial_state(self) -> Dict[str, Any]:
+        return {"validation_error": "", "state": "initial", "response_data": None}  # initial -> complete
 
-    def getNext(self) -> str:
+    def render(self, response_data: Any) -> str:
+        """Fill the prompt: {response} is the whole result, other fields (e.g. {balance}) come from a dict result"""
+        fields = response_data if isinstance(response_data, dict) else {}
+        return self.prompt.format(**{**fields, "response": str(response_data)})
+
+    async def getNext(self, engine: 'MenuEngine') -> str:
         """Generate the prompt with the server response or error."""
-        if self.state == "initial":
-            cached_data = service_config.get(self.msisdn, {})
+        state = engine.node_state(self)
+        if state["state"] == "initial":
+            cached_data = service_config.get(engine.msisdn, {})
             payload = {display_name: cached_data.get(cache_key, "N/A") 
                        for cache_key, display_name in self.cache_params.items()}
             
-            response_data = self.make_post_request( payload)
+            response_data = await self.make_post_request(engine, payload)
+            state["state"] = "complete"
             if response_data:
-                self.response_data = response_data
-                self.state = "complete"
-                formatted_response = self.prompt.format(response=str(self.response_data))
+                state["response_data"] = response_data
+                formatted_response = self.render(response_data)
             else:
-                self.state = "complete"
-                formatted_response = self.validation_error
+                formatted_response = "Request failed: Invalid response"
             
-            error_msg = f"\n{self.validation_error}" if self.validation_error else ""
+            error_msg = f"\n{state['validation_error']}" if state["validation_error"] else ""
             return f"{formatted_response}{error_msg}"
-        elif self.state == "complete":
-            formatted_response = self.prompt.format(response=str(self.response_data)) if self.response_data else self.validation_error
-            error_msg = f"\n{self.validation_error}" if self.validation_error else ""
+        elif state["state"] == "complete":
+            formatted_response = self.render(state["response_data"]) if state["response_data"] else "Request failed: Invalid response"
+            error_msg = f"\n{state['validation_error']}" if state["validation_error"] else ""
             return f"{formatted_response}{error_msg}"
         return "Service unavailable"
 
-    def getPrevious(self) -> str:
+    async def getPrevious(self, engine: 'MenuEngine') -> str:
         """Return the prompt of the previous node or a fallback message."""
-        if self.engine and self.engine.navigation_stack:
-            previous_node_id = self.engine.navigation_stack[-1]
-            previous_node = self.engine.nodes.get(previous_node_id)
-            if previous_node:
-                return previous_node.getNext()
+        previous_node = engine.previous_node()
+        if previous_node:
+            return await previous_node.getNext(engine)
         return "No previous menu\nPress 0 to exit"
 
-    def handleUserInput(self, user_input: str) -> str:
+    async def handleUserInput(self, engine: 'MenuEngine', user_input: str) -> str:
         """Process user input and transition to the selected node."""
-        self.validation_error = ""
+        state = engine.node_state(self)
+        state["validation_error"] = ""
 
         if user_input in self.valid_keys:
             if user_input == "9":
-                if self.engine and self.engine.navigation_stack:
-                    target_node_id = self.engine.navigation_stack.pop()
-                    self.engine.set_current_node(target_node_id)
-                    self.state = "initial"
-                    self.response_data = None
-                    return self.engine.get_current_prompt()
+                if engine.navigation_stack:
+                    engine.reset_node_state(self)
+                    engine.go_back()
+                    return await engine.current_prompt()
                 return "No previous menu\nPress 0 to exit"
             elif user_input == "0":
-                if self.engine:
-                    self.engine.set_current_node("exit_node")
-                    self.state = "initial"
-                    self.response_data = None
-                    return self.engine.get_current_prompt()
-                return "Session ended"
+                engine.reset_node_state(self)
+                engine.set_current_node("exit_node")
+                return await engine.current_prompt()
         else:
-            self.validation_error = f"Invalid selection. Choose from {', '.join(sorted(self.valid_keys))}"
+            state["validation_error"] = f"Invalid selection. Choose from {', '.join(sorted(self.valid_keys))}"
 
-        return self.getNext()
\ No newline at end of file
+        return await self.getNext(engine)
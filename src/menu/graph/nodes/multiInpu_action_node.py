@@ -1,187 +1,135 @@
 from typing import Dict, Any, List
-from src.menu.graph.nodes.node_abc import MenuNode
-import re
+from src.menu.graph.nodes.node_abc import MenuNode, NO_TARGET
 from src.menu.graph.nodes.global_share import service_config
+from src.menu.graph.nodes.validators import compile_validator
 
 class MultiInputActionNode(MenuNode):
     """Node for multi-step input collection, e.g., wallet-to-wallet transfer."""
     def __init__(self, node_id: str, config: Dict[str, Any]):
         super().__init__(node_id, config)
-        self.state = "input"  # input -> confirm -> complete
-        self.current_step = 0
-        self.inputs: Dict[str, Any] = {}  # Store inputs by input_key
         self.steps: List[Dict[str, Any]] = config.get("steps", [])
+        self.step_validators = [compile_validator(step.get("validation", {})) for step in self.steps]
         self.confirmation_prompt = config.get("confirmation_prompt", "")
         self.action_url = config.get("action_url")
         self.params = config.get("params", {})
         self.success_prompt = config.get("success_prompt", "Action completed\nStatus: {status}\nPress 9 to go back, 0 to exit")
 
-    def parseResponse(self, response_data: Any) -> Any:
-        """Parse the JSON response from the POST request."""
-        if response_data and isinstance(response_data, dict):
-            if response_data.get("status"):
-                return response_data
-            self.validation_error = f"Action failed: {response_data.get('error', 'Unknown error')}"
-        else:
-            self.validation_error = "Action failed: Invalid response"
-        return None
+    def initial_state(self) -> Dict[str, Any]:
+        # input -> confirm -> complete; inputs are stored by input_key
+        return {"validation_error": "", "state": "input", "current_step": 0, "inputs": {}, "success_prompt": self.success_prompt}
 
-    def getNext(self) -> str:
+    async def getNext(self, engine: 'MenuEngine') -> str:
         """Generate the next prompt based on the current state."""
-        if self.state == "input" and self.current_step < len(self.steps):
-            step_config = self.steps[self.current_step]
+        state = engine.node_state(self)
+        if state["state"] == "input" and state["current_step"] < len(self.steps):
+            step_config = self.steps[state["current_step"]]
             prompt = step_config["prompt"]
-            error_msg = f"\n{self.validation_error}" if self.validation_error else ""
+            error_msg = f"\n{state['validation_error']}" if state["validation_error"] else ""
             return f"{prompt}{error_msg}"
-        elif self.state == "confirm":
+        elif state["state"] == "confirm":
             prompt = self.confirmation_prompt
-            for key, value in self.inputs.items():
+            for key, value in state["inputs"].items():
                 if isinstance(value, dict):
                     prompt = prompt.replace(f"{{{key}}}", str(value.get("name", value)))
                 else:
                     prompt = prompt.replace(f"{{{key}}}", str(value))
             return f"{prompt}\n1: OK, 2: Cancel"
-        elif self.state == "complete":
-            return f"{self.success_prompt}\nPress 9 to go back, 0 to exit"
+        elif state["state"] == "complete":
+            return f"{state['success_prompt']}\nPress 9 to go back, 0 to exit"
         return "Service unavailable"
 
-    def getPrevious(self) -> str:
+    async def getPrevious(self, engine: 'MenuEngine') -> str:
         """Return the prompt of the previous node or a fallback message."""
-        if self.engine and self.engine.navigation_stack:
-            previous_node_id = self.engine.navigation_stack[-1]
-            previous_node = self.engine.nodes.get(previous_node_id)
-            if previous_node:
-                return previous_node.getNext()
+        previous_node = engine.previous_node()
+        if previous_node:
+            return await previous_node.getNext(engine)
         return "No previous menu\nPress 9 to go back, 0 to exit"
 
-    def validate(self, user_input: str) -> str:
+    def validate(self, state: Dict[str, Any], user_input: str) -> str:
         """Validate user input based on the current state and step."""
-        self.validation_error = ""
+        state["validation_error"] = ""
+        inputs = state["inputs"]
         
-        if self.state == "input" and self.current_step < len(self.steps):
-            step_config = self.steps[self.current_step]
-            validation = step_config.get("validation", {})
-            input_key = step_config["input_key"]
-            
-            if validation.get("type") == "numeric":
-                try:
-                    value = float(user_input)
-                    if "min" in validation and value < validation["min"]:
-                        self.validation_error = f"Value must be at least {validation['min']}"
-                        return ""
-                    if "max" in validation and value > validation["max"]:
-                        self.validation_error = f"Value must not exceed {validation['max']}"
-                        return ""
-                    self.inputs[input_key] = value
-                    return "valid"
-                except ValueError:
-                    self.validation_error = "Invalid numeric input"
-                    return ""
-            elif "regex" in validation:
-                if re.match(validation["regex"], user_input):
-                    self.inputs[input_key] = user_input
-                    if self.node_id == "change_pin" and input_key == "confirm_pin":
-                        if self.inputs.get("new_pin") != user_input:
-                            self.validation_error = "Confirmation PIN does not match new PIN"
-                            return ""
-                    return "valid"
-                self.validation_error = "Invalid input format"
+        if state["state"] == "input" and state["current_step"] < len(self.steps):
+            input_key = self.steps[state["current_step"]]["input_key"]
+            value, error = self.step_validators[state["current_step"]](user_input)
+            if error:
+                state["validation_error"] = error
                 return ""
-            elif "options" in validation:
-                try:
-                    choice = int(user_input) - 1
-                    options = validation.get("options", [])
-                    if 0 <= choice < len(options):
-                        self.inputs[input_key] = options[choice]
-                        return "valid"
-                    self.validation_error = f"Invalid selection. Choose 1-{len(options)}"
-                    return ""
-                except ValueError:
-                    self.validation_error = "Invalid selection"
+            inputs[input_key] = value
+            if self.node_id == "change_pin" and input_key == "confirm_pin":
+                if inputs.get("new_pin") != user_input:
+                    state["validation_error"] = "Confirmation PIN does not match new PIN"
                     return ""
-            else:
-                self.inputs[input_key] = user_input
-                return "valid"
+            return "valid"
         
-        elif self.state == "confirm":
+        elif state["state"] == "confirm":
             if user_input in ["1", "2"]:
                 return user_input
-            self.validation_error = "Please select 1 or 2"
+            state["validation_error"] = "Please select 1 or 2"
             return ""
         
-        elif self.state == "complete":
-            if user_input in ["9", "0"] or user_input in self.next_nodes:
+        elif state["state"] == "complete":
+            if user_input in ["9", "0"] or self.key_target(user_input) != NO_TARGET:
                 return user_input
-            self.validation_error = "Invalid option. Press 9 to go back, 0 to exit"
+            state["validation_error"] = "Invalid option. Press 9 to go back, 0 to exit"
             return "0"  # Default to exit on invalid input
         
         return ""
 
-    def handleUserInput(self, user_input: str) -> str:
+    async def handleUserInput(self, engine: 'MenuEngine', user_input: str) -> str:
         """Process user input, update state, and return the next prompt."""
-        print(f"DEBUG: state={self.state}, current_step={self.current_step}, input={user_input}")
-        validation_result = self.validate(user_input)
+        state = engine.node_state(self)
+        print(f"DEBUG: state={state['state']}, current_step={state['current_step']}, input={user_input}")
+        validation_result = self.validate(state, user_input)
         
-        if self.state == "input" and validation_result == "valid":
-            self.current_step += 1
-            if self.current_step >= len(self.steps):
-                self.state = "confirm"
-            return self.getNext()
+        if state["state"] == "input" and validation_result == "valid":
+            state["current_step"] += 1
+            if state["current_step"] >= len(self.steps):
+                state["state"] = "confirm"
+            return await self.getNext(engine)
         
-        elif self.state == "confirm":
+        elif state["state"] == "confirm":
             if validation_result == "1":
-                self.state = "complete"
+                state["state"] = "complete"
                 if self.action_url:
                     payload = {
-                        "msisdn": self.msisdn,
-                        **{k: v["id"] if isinstance(v, dict) else v for k, v in self.inputs.items()},
+                        "msisdn": engine.msisdn,
+                        **{k: v["id"] if isinstance(v, dict) else v for k, v in state["inputs"].items()},
                         **self.params
                     }
                     for key, value in payload.items():
                         if isinstance(value, str) and value.startswith("<") and value.endswith(">"):
                             param_key = value[1:-1]
-                            payload[key] = self.inputs.get(param_key, value)
+                            payload[key] = state["inputs"].get(param_key, value)
                     
-                    response_data = self.make_post_request( payload)
+                    response_data = await self.make_post_request(engine, payload)
                     if response_data:
-                        self.success_prompt = self.success_prompt.format(**response_data)
-                        return f"{self.success_prompt}\nPress 9 to go back, 0 to exit"
+                        state["success_prompt"] = self.success_prompt.format(**response_data)
+                        return f"{state['success_prompt']}\nPress 9 to go back, 0 to exit"
                     else:
-                        self.state = "complete"
-                        return f"{self.validation_error}\nPress 9 to go back, 0 to exit"
-                return f"{self.success_prompt}\nPress 9 to go back, 0 to exit"
+                        state["validation_error"] = "Action failed: Invalid response"
+                        return f"{state['validation_error']}\nPress 9 to go back, 0 to exit"
+                return f"{state['success_prompt']}\nPress 9 to go back, 0 to exit"
             elif validation_result == "2":
-                if self.engine:
-                    self.engine.set_current_node("exit_node")
-                    return self.engine.get_current_prompt()
-                return "Session ended"
+                engine.set_current_node("exit_node")
+                return await engine.current_prompt()
         
-        elif self.state == "complete":
+        elif state["state"] == "complete":
             if validation_result == "9":
-                if self.engine and self.engine.navigation_stack:
-                    target_node_id = self.engine.navigation_stack.pop()
-                    self.engine.set_current_node(target_node_id)
-                    self.state = "input"
-                    self.current_step = 0
-                    self.inputs = {}
-                    return self.engine.get_current_prompt()
+                if engine.navigation_stack:
+                    engine.reset_node_state(self)
+                    engine.go_back()
+                    return await engine.current_prompt()
                 return "No previous menu\nPress 9 to go back, 0 to exit"
             elif validation_result == "0":
-                if self.engine:
-                    self.engine.set_current_node("exit_node")
-                    self.state = "input"
-                    self.current_step = 0
-                    self.inputs = {}
-                    return self.engine.get_current_prompt()
-                return "Session ended"
-            elif validation_result in self.next_nodes:
-                target_node_id = self.next_nodes[validation_result]
-                if self.engine and self.engine.current_node_id:
-                    self.engine.navigation_stack.append(self.engine.current_node_id)
-                    self.engine.set_current_node(target_node_id)
-                    self.state = "input"
-                    self.current_step = 0
-                    self.inputs = {}
-                    return self.engine.get_current_prompt()
+                engine.reset_node_state(self)
+                engine.set_current_node("exit_node")
+                return await engine.current_prompt()
+            elif self.key_target(validation_result) != NO_TARGET:
+                engine.navigation_stack.append(self.index)
+                engine.reset_node_state(self)
+                engine.set_current_index(self.key_target(validation_result))
+                return await engine.current_prompt()
         
-        return self.getNext()
\ No newline at end of file
+        return await self.getNext(engine)
@@ -1,12 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from array import array
+from typing import Dict, Any, Optional, Coroutine
 import logging
-import importlib
 from src.menu.graph.nodes.global_share import service_config
-from src.services.service import ServiceABC
+from src.services.service import ServiceABC, MissingRequestField
+from src.services.backend_client import ServiceUnavailable, BACKEND_ERRORS
+from src.services.service_registery import ServiceRegistry
 
 
 # Configure logging
@@ -15,43 +14,35 @@ logger = logging.getLogger(__name__)
 from src.services.ValidationApi import Validate
 
 
+# Empty slot in a node's key_targets array
+NO_TARGET = 0xFFFF
+_KEY_DIGITS = {str(digit): digit for digit in range(10)}
+
+
+def run_sync(coro: Coroutine) -> Any:
+    """Drive a node coroutine to completion on the calling thread.
+
+    Node coroutines only suspend while awaiting an async backend call. With the
+    blocking backend they finish on the first step, so no event loop is needed.
+    """
+    try:
+        coro.send(None)
+    except StopIteration as e:
+        return e.value
+    coro.close()
+    raise RuntimeError("Node coroutine suspended outside an event loop; use the async engine methods")
+
+
 class MenuNode(ABC):
-    """Abstract base class for all menu nodes with renderer logic and optimized HTTP request handling."""
+    """Abstract base class for all menu nodes with renderer logic; backend calls go through self.service."""
     service : ServiceABC
-    # Shared requests Session for connection pooling and Keep-Alive
-    _session = requests.Session()
-    
-    # Configure retries for transient failures
-    _retry_strategy = Retry(
-        total=3,
-        backoff_factor=0.1,
-        status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["POST"]
-    )
-    _adapter = HTTPAdapter(
-        max_retries=_retry_strategy,
-        pool_connections=10,  # Max connections to keep in pool
-        pool_maxsize=10       # Max concurrent connections
-    )
-    _session.mount("http://", _adapter)
-    _session.mount("https://", _adapter)
-    
-    # Configure default headers with compression
-    _session.headers.update({
-        "Content-Type": "application/json",
-        "User-Agent": "Python-Requests/2.32.3",
-        "Accept": "application/json",
-        "Accept-Encoding": "gzip, deflate",  # Enable compression
-        "Connection": "keep-alive"          # Explicitly enable Keep-Alive
-    })
 
     def __init__(self, node_id: str, config: Dict[str, Any]):
         self.node_id = node_id
         self.config = config
-        self.validation_error = ""
+        self.index = -1  # Dense node index, assigned by the MenuGraph that builds the node
+        self.key_targets = array("H", [NO_TARGET] * 10)  # Key digit -> target node index, filled by the graph
         self.next_nodes: Dict[str, str] = {}  # Key: condition, Value: node_id
-        self.engine: Optional['MenuEngine'] = None
-        self.msisdn = config.get("msisdn", "")
         self.service = {}
         # Initialize service
         self.service = None
@@ -60,24 +51,11 @@ class MenuNode(ABC):
         
         path = self.config.get('validation_url', '') or self.config.get('action_url', '')
         if path and not path.startswith("http"):
-            logger.info(f"Loading service from path: {path}")
             try:
-                # Split path to get module and class
-                if '.' not in path:
-                    raise ValueError(f"Invalid service path {path}: must include module and class name (e.g., module.class)")
-                module_path, class_name = path.rsplit(".", 1)
-                logger.debug(f"Module path: {module_path}, Class name: {class_name}")
-                module = importlib.import_module(module_path)
-                klass = getattr(module, class_name)
-                # Check if klass is a class
-                if not isinstance(klass, type):
-                    raise ValueError(f"Expected a class at {path}, got {type(klass).__name__} instead")
-                # Check if klass inherits from ServiceABC
-                if not issubclass(klass, ServiceABC):
-                    raise ValueError(f"Service class {class_name} at {path} must inherit from ServiceABC")
-                self.service = klass()  # Instantiate the service class
-                logger.info(f"Service {class_name} loaded successfully for node {node_id}")
-            except (ValueError, ImportError, AttributeError) as e:
+                # One shared, already-imported instance per service class for the whole process
+                self.service = ServiceRegistry.get_service(path)
+                logger.debug(f"Service {type(self.service).__name__} bound to node {node_id}")
+            except ValueError as e:
                 logger.error(f"Failed to load service from path {path} for node {node_id}: {str(e)}")
                 raise ValueError(f"Invalid service configuration for node {node_id}: {str(e)}")
             except Exception as e:
@@ -86,9 +64,6 @@ class MenuNode(ABC):
         else:
             logger.info(f"No valid service path provided for node {node_id}, proceeding without service")
 
-
-
-
         # Configurable timeout from node config, default to 5 seconds
         self.request_timeout = config.get("request_timeout", 5.0)
 
@@ -97,28 +72,57 @@ class MenuNode(ABC):
         """Add transition to another node."""
         self.next_nodes[condition] = target_node_id
     
-    def set_engine(self, engine: 'MenuEngine'):
-        """Set reference to engine for node transitions."""
-        self.engine = engine
+    def key_target(self, user_input: str) -> int:
+        """Node index a single-digit input leads to, or NO_TARGET"""
+        digit = _KEY_DIGITS.get(user_input)
+        return NO_TARGET if digit is None else self.key_targets[digit]
+
+    def initial_state(self) -> Dict[str, Any]:
+        """Fresh per-session state for this node; nodes are shared, so nothing mutable lives on self."""
+        return {"validation_error": ""}
     
-    def make_post_request(self, payLoad: Dict) -> Any:
-        """Delegate HTTP POST request to the service instance."""
-        return self.service.doPost(payLoad=payLoad) 
+    async def make_post_request(self, engine: 'MenuEngine', payLoad: Dict) -> Any:
+        """Delegate HTTP POST request to the service instance, without blocking when driven by the async engine.
+
+        While the endpoint's circuit breaker is open this returns None at once, like any failed call, and
+        flags the engine so the subscriber gets the "service temporarily unavailable" text instead; so does
+        a call that fails outright (connection refused, timeout), rather than showing its exception.
+        A payload that lacks a field the service's URL needs is logged and fails like a rejected call.
+        """
+        try:
+            if engine.async_backend:
+                return await self.service.doPostAsync(payLoad=payLoad, msisdn=engine.msisdn)
+            return self.service.doPost(payLoad=payLoad, msisdn=engine.msisdn)
+        except ServiceUnavailable as e:
+            logger.warning(f"Node {self.node_id}: {e}")
+            engine.backend_unavailable = True
+            return None
+        except BACKEND_ERRORS as e:
+            logger.error(f"Node {self.node_id}: backend call failed: {e!r}")
+            engine.backend_unavailable = True
+            return None
+        except MissingRequestField as e:
+            logger.error(f"Node {self.node_id}: {e}")
+            return None
     
     def parseResponse(self, response_data: Any) -> Any:
        return self.service.parseResponse(response_data)
+
+    def unavailable_hint(self, engine: 'MenuEngine') -> str:
+        """What the subscriber can do next, shown under "service temporarily unavailable" from this node"""
+        return engine.graph.texts["system.back_or_exit"]
     
     @abstractmethod
-    def getNext(self) -> str:
+    async def getNext(self, engine: 'MenuEngine') -> str:
         """Get the next prompt or response based on the node's state."""
         pass
     
     @abstractmethod
-    def getPrevious(self) -> str:
+    async def getPrevious(self, engine: 'MenuEngine') -> str:
         """Get the prompt of the previous node or a fallback message."""
         pass
     
     @abstractmethod
-    def handleUserInput(self, user_input: str) -> str:
+    async def handleUserInput(self, engine: 'MenuEngine', user_input: str) -> str:
         """Process user input, update state, and return the next prompt or response."""
         pass
\ No newline at end of file
@@ -1,168 +1,122 @@
 from typing import Dict, Any, Optional
-import re
-from src.menu.graph.nodes.node_abc import MenuNode
+from src.menu.graph.nodes.node_abc import MenuNode, NO_TARGET
 from src.menu.graph.nodes.global_share import service_config
+from src.menu.graph.nodes.validators import compile_validator
 
 class SingleInputActionNode(MenuNode):
     """Node for actions requiring a single user input, e.g., balance check."""
     def __init__(self, node_id: str, config: Dict[str, Any]):
         super().__init__(node_id, config)
-        self.state = "input"  # input -> confirm -> complete
-        self.input: Any = None  # Store single input
         self.input_key = config.get("input_key")
         self.prompt = config.get("prompt", "")
         self.validation = config.get("validation", {})
+        self.validator = compile_validator(self.validation)
         self.confirmation_prompt = config.get("confirmation_prompt", "")
         self.action_url = config.get("action_url")
         self.params = config.get("params", {})
         self.success_prompt = config.get("success_prompt", "Action completed\nStatus: {status}\nPress 9 to go back, 0 to exit")
 
-    def parseResponse(self, response_data: Any) -> Any:
-        """Parse the JSON response from the POST request."""
-        if response_data and isinstance(response_data, dict):
-            if response_data.get("status"):
-                return response_data
-            self.validation_error = f"Action failed: {response_data.get('error', 'Unknown error')}"
-        else:
-            self.validation_error = "Action failed: Invalid response"
-        return None
+    def initial_state(self) -> Dict[str, Any]:
+        # input -> confirm -> complete; success_prompt holds the prompt as formatted for this session
+        return {"validation_error": "", "state": "input", "input": None, "success_prompt": self.success_prompt}
 
-    def getNext(self) -> str:
+    async def getNext(self, engine: 'MenuEngine') -> str:
         """Generate the next prompt based on the current state."""
-        if self.state == "input":
-            error_msg = f"\n{self.validation_error}" if self.validation_error else ""
+        state = engine.node_state(self)
+        if state["state"] == "input":
+            error_msg = f"\n{state['validation_error']}" if state["validation_error"] else ""
             return f"{self.prompt}{error_msg}"
-        elif self.state == "confirm":
+        elif state["state"] == "confirm":
             prompt = self.confirmation_prompt
-            prompt = prompt.replace(f"{{{self.input_key}}}", str(self.input))
+            prompt = prompt.replace(f"{{{self.input_key}}}", str(state["input"]))
             return f"{prompt}\n"
-        elif self.state == "complete":
-            return f"{self.success_prompt}\nPress 9 to go back, 0 to exit"
+        elif state["state"] == "complete":
+            return f"{state['success_prompt']}\nPress 9 to go back, 0 to exit"
         return "Service unavailable"
 
-    def getPrevious(self) -> str:
+    async def getPrevious(self, engine: 'MenuEngine') -> str:
         """Return the prompt of the previous node or a fallback message."""
-        if self.engine and self.engine.navigation_stack:
-            previous_node_id = self.engine.navigation_stack[-1]
-            previous_node = self.engine.nodes.get(previous_node_id)
-            if previous_node:
-                return previous_node.getNext()
+        previous_node = engine.previous_node()
+        if previous_node:
+            return await previous_node.getNext(engine)
         return "No previous menu\nPress 9 to go back, 0 to exit"
 
-    def validate(self, user_input: str) -> str:
+    def validate(self, state: Dict[str, Any], user_input: str) -> str:
         """Validate user input based on the current state."""
-        self.validation_error = ""
+        state["validation_error"] = ""
         
-        if self.state == "input":
-            if self.validation.get("type") == "numeric":
-                try:
-                    value = float(user_input)
-                    if "min" in self.validation and value < self.validation["min"]:
-                        self.validation_error = f"Value must be at least {self.validation['min']}"
-                        return ""
-                    if "max" in self.validation and value > self.validation["max"]:
-                        self.validation_error = f"Value must not exceed {self.validation['max']}"
-                        return ""
-                    self.input = value
-                    return "valid"
-                except ValueError:
-                    self.validation_error = "Invalid numeric input"
-                    return ""
-            elif "regex" in self.validation:
-                if re.match(self.validation["regex"], user_input):
-                    self.input = user_input
-                    return "valid"
-                self.validation_error = "Invalid input format"
+        if state["state"] == "input":
+            value, error = self.validator(user_input)
+            if error:
+                state["validation_error"] = error
                 return ""
-            elif "options" in self.validation:
-                try:
-                    choice = int(user_input)
-                    options = self.validation.get("options", [])
-                    if 1 <= choice <= len(options):
-                        self.input = options[choice - 1]
-                        return "valid"
-                    self.validation_error = f"Invalid selection. Choose 1-{len(options)}"
-                    return ""
-                except ValueError:
-                    self.validation_error = "Invalid selection"
-                    return ""
-            else:
-                self.input = user_input
-                return "valid"
+            state["input"] = value
+            return "valid"
         
-        elif self.state == "confirm":
+        elif state["state"] == "confirm":
             if user_input in ["1", "2"]:
                 return user_input
-            self.validation_error = "Please select 1 or 2"
+            state["validation_error"] = "Please select 1 or 2"
             return ""
         
-        elif self.state == "complete":
-            if user_input in ["9", "0"] or user_input in self.next_nodes:
+        elif state["state"] == "complete":
+            if user_input in ["9", "0"] or self.key_target(user_input) != NO_TARGET:
                 return user_input
-            self.validation_error = "Invalid option. Press 9 to go back, 0 to exit"
+            state["validation_error"] = "Invalid option. Press 9 to go back, 0 to exit"
             return "0"  # Default to exit on invalid input
         
         return ""
 
-    def handleUserInput(self, user_input: str) -> str:
+    async def handleUserInput(self, engine: 'MenuEngine', user_input: str) -> str:
         """Process user input, update state, and return the next prompt."""
-        validation_result = self.validate(user_input)
+        state = engine.node_state(self)
+        validation_result = self.validate(state, user_input)
         
-        if self.state == "input" and validation_result == "valid":
-            self.state = "confirm"
-            return self.getNext()
+        if state["state"] == "input" and validation_result == "valid":
+            state["state"] = "confirm"
+            return await self.getNext(engine)
         
-        elif self.state == "confirm":
+        elif state["state"] == "confirm":
             if validation_result == "1":
-                self.state = "complete"
+                state["state"] = "complete"
                 if self.action_url:
                     payload = {
-                        "msisdn": self.msisdn,
-                        self.input_key: self.input,
+                        "msisdn": engine.msisdn,
+                        self.input_key: state["input"],
                         **self.params
                     }
                     for key, value in payload.items():
                         if isinstance(value, str) and value.startswith("<") and value.endswith(">"):
                             param_key = value[1:-1]
-                            payload[key] = self.input if param_key == self.input_key else value
+                            payload[key] = state["input"] if param_key == self.input_key else value
                     
-                    response_data = self.make_post_request(self.action_url, payload)
+                    response_data = await self.make_post_request(engine, payload)
                     if response_data:
-                        self.success_prompt = self.success_prompt.format(**response_data)
-                        return f"{self.success_prompt}\nPress 9 to go back, 0 to exit"
+                        state["success_prompt"] = self.success_prompt.format(**response_data)
+                        return f"{state['success_prompt']}\nPress 9 to go back, 0 to exit"
                     else:
-                        self.state = "complete"
-                        return f"{self.validation_error}\nPress 9 to go back, 0 to exit"
-                return f"{self.success_prompt}\nPress 9 to go back, 0 to exit"
+                        state["validation_error"] = "Action failed: Invalid response"
+                        return f"{state['validation_error']}\nPress 9 to go back, 0 to exit"
+                return f"{state['success_prompt']}\nPress 9 to go back, 0 to exit"
             elif validation_result == "2":
-                if self.engine:
-                    self.engine.set_current_node("exit_node")
-                    return self.engine.get_current_prompt()
-                return "Session ended"
+                engine.set_current_node("exit_node")
+                return await engine.current_prompt()
         
-        elif self.state == "complete":
+        elif state["state"] == "complete":
             if validation_result == "9":
-                if self.engine and self.engine.navigation_stack:
-                    target_node_id = self.engine.navigation_stack.pop()
-                    self.engine.set_current_node(target_node_id)
-                    self.state = "input"
-                    self.input = None
-                    return self.engine.get_current_prompt()
+                if engine.navigation_stack:
+                    engine.reset_node_state(self)
+                    engine.go_back()
+                    return await engine.current_prompt()
                 return "No previous menu\nPress 9 to go back, 0 to exit"
             elif validation_result == "0" or validation_result == "":
-                if self.engine:
-                    self.engine.set_current_node("exit_node")
-                    self.state = "input"
-                    self.input = None
-                    return self.engine.get_current_prompt()
-                return "Session ended"
-            elif validation_result in self.next_nodes:
-                target_node_id = self.next_nodes[validation_result]
-                if self.engine and self.engine.current_node_id:
-                    self.engine.navigation_stack.append(self.engine.current_node_id)
-                    self.engine.set_current_node(target_node_id)
-                    self.state = "input"
-                    self.input = None
-                    return self.engine.get_current_prompt()
+                engine.reset_node_state(self)
+                engine.set_current_node("exit_node")
+                return await engine.current_prompt()
+            elif self.key_target(validation_result) != NO_TARGET:
+                engine.navigation_stack.append(self.index)
+                engine.reset_node_state(self)
+                engine.set_current_index(self.key_target(validation_result))
+                return await engine.current_prompt()
         
-        return self.getNext()
\ No newline at end of file
+        return await self.getNext(engine)
@@ -1,5 +1,5 @@
 from typing import Dict, Any
-from src.menu.graph.nodes.node_abc import MenuNode
+from src.menu.graph.nodes.node_abc import MenuNode, NO_TARGET
 from src.menu.graph.nodes.global_share import service_config
 
 class ValidationGateNode(MenuNode):
@@ -7,73 +7,80 @@ class ValidationGateNode(MenuNode):
     def __init__(self, node_id: str, config: Dict[str, Any]):
         super().__init__(node_id, config)
         self.max_attempts = config.get("max_attempts", 3)
-        self.current_attempts = 0
         self.valid_pin = config.get("valid_pin", "123456")
         self.validation_url = config.get("validation_url")
         self.prompt = config.get("prompt", "Enter your PIN:\n")
 
-    def parseResponse(self, response_data: Any) -> Any:
-        """Parse the JSON response from the POST request."""
-        if response_data and isinstance(response_data, dict):
-            if response_data.get("stat"):
-                return {
-                    "status": response_data.get("status"),
-                    "auth_token": response_data.get("auth_token", "mock_token")
-                }
-            self.validation_error = f"Validation failed: {response_data.get('error', 'Invalid PIN')}"
-        else:
-            self.validation_error = "Validation failed: Invalid response"
-        return None
+    def initial_state(self) -> Dict[str, Any]:
+        return {"validation_error": "", "current_attempts": 0}
 
-    def getNext(self) -> str:
+    async def getNext(self, engine: 'MenuEngine') -> str:
         """Return the PIN prompt with validation error if any."""
-        error_msg = f"\n{self.validation_error}" if self.validation_error else ""
+        validation_error = engine.node_state(self)["validation_error"]
+        error_msg = f"\n{validation_error}" if validation_error else ""
         return f"{self.prompt}{error_msg}"
 
-    def getPrevious(self) -> str:
+    def unavailable_hint(self, engine: 'MenuEngine') -> str:
+        # Here the next input is another PIN attempt, not Back/Exit
+        return self.prompt
+
+    async def getPrevious(self, engine: 'MenuEngine') -> str:
         """No previous node for root; return fallback message."""
         return "No previous menu\nPress 0 to exit"
 
-    def handleUserInput(self, user_input: str) -> str:
+    def _target(self, engine: 'MenuEngine', condition: str, default: str = "") -> int:
+        """Node index the condition's transition leads to, or NO_TARGET when unset or not in the graph"""
+        node_id = self.next_nodes.get(condition, default)
+        return engine.graph.node_index.get(node_id, NO_TARGET) if node_id else NO_TARGET
+
+    async def _enter(self, engine: 'MenuEngine', state: Dict[str, Any]) -> str:
+        """PIN accepted: go to the success node, or straight to the node a dial-string shortcut asked for."""
+        route = state.get("shortcut")
+        target = route[-1] if route else self._target(engine, "success")
+        if target == NO_TARGET:
+            return await self.getNext(engine)
+        engine.navigation_stack.append(self.index)
+        if route:
+            # Same stack as if the subscriber had walked the menus, so Back still works
+            engine.navigation_stack.extend(route[:-1])
+        engine.set_current_index(target)
+        return await engine.current_prompt()
+
+    async def handleUserInput(self, engine: 'MenuEngine', user_input: str) -> str:
         """Validate PIN and transition to success or failure node."""
-        self.current_attempts += 1
-        self.validation_error = ""
+        state = engine.node_state(self)
+        state["current_attempts"] += 1
+        state["validation_error"] = ""
 
         if self.validation_url:
-            payload = {"password": user_input, "phone": self.msisdn}
-            response_data = self.make_post_request( payload)
+            payload = {"password": user_input, "phone": engine.msisdn}
+            response_data = await self.make_post_request(engine, payload)
             if response_data:
-                service_config[self.msisdn] = {
-                    "msisdn": self.msisdn,
+                service_config[engine.msisdn] = {
+                    "msisdn": engine.msisdn,
                     "auth_token": response_data.get("auth_token")
                 }
-                target_node_id = self.next_nodes.get("success")
-                if target_node_id and self.engine:
-                    self.engine.navigation_stack.append(self.node_id)
-                    self.engine.set_current_node(target_node_id)
-                    return self.engine.get_current_prompt()
-                return self.getNext()
+                return await self._enter(engine, state)
+            elif engine.backend_unavailable:
+                state["current_attempts"] -= 1  # An outage is not a wrong PIN
+                return await self.getNext(engine)
             else:
-                self.validation_error = self.validation_error or "Validation failed: Unknown error"
+                state["validation_error"] = "Validation failed: Unknown error"
         else:
             if user_input == self.valid_pin:
-                service_config[self.msisdn] = {
-                    "msisdn": self.msisdn,
+                service_config[engine.msisdn] = {
+                    "msisdn": engine.msisdn,
                     "auth_token": "mock_token"
                 }
-                target_node_id = self.next_nodes.get("success")
-                if target_node_id and self.engine:
-                    self.engine.navigation_stack.append(self.node_id)
-                    self.engine.set_current_node(target_node_id)
-                    return self.engine.get_current_prompt()
+                return await self._enter(engine, state)
             else:
-                self.validation_error = "Invalid PIN"
+                state["validation_error"] = "Invalid PIN"
 
-        if self.current_attempts >= self.max_attempts:
-            target_node_id = self.next_nodes.get("failure", "exit_node")
-            if target_node_id and self.engine:
-                self.engine.navigation_stack.append(self.node_id)
-                self.engine.set_current_node(target_node_id)
-                return self.engine.get_current_prompt()
+        if state["current_attempts"] >= self.max_attempts:
+            target = self._target(engine, "failure", "exit_node")
+            if target != NO_TARGET:
+                engine.navigation_stack.append(self.index)
+                engine.set_current_index(target)
+                return await engine.current_prompt()
 
-        return self.getNext()
\ No newline at end of file
+        return await self.getNext(engine)
@@ -1,9 +1,10 @@
 from typing import Dict, Any, Optional, List
 import threading
-import re
+import hashlib
 import json
 import os
-from jsonschema import validate, ValidationError
+from jsonschema import Draft202012Validator, ValidationError
+from jsonschema.exceptions import best_match
 
 # Schema registry
 schema_utils_SCHEMA_REGISTRY = {
@@ -15,11 +16,11 @@ schema_utils_SCHEMA_REGISTRY = {
     "cache_post":"schemas/msisdn_menu.json"
 }
 
-# Cache for loaded schemas
+# Cache for loaded schemas and their compiled validators, one per node type
 SCHEMA_CACHE = {}
-from functools import lru_cache
+SCHEMA_VALIDATORS: Dict[str, Draft202012Validator] = {}
+SCHEMA_CACHE_LOCK = threading.Lock()
 
-@lru_cache(maxsize=128)
 def load_schema(node_type: str) -> Dict[str, Any]:
     """Load a JSON schema from file and cache it."""
     if node_type not in schema_utils_SCHEMA_REGISTRY:
@@ -31,21 +32,38 @@ def load_schema(node_type: str) -> Dict[str, Any]:
             with open(schema_path, 'r') as f:
                 SCHEMA_CACHE[node_type] = json.load(f)
         except FileNotFoundError:
-            pass  # Consider logging or re-raising here
+            raise ValueError(f"Schema file for node type {node_type} not found: {schema_path}")
     
     return SCHEMA_CACHE[node_type]
 
+def get_schema_validator(node_type: str) -> Draft202012Validator:
+    """Compiled validator for a node type; the schema is checked and compiled once per process."""
+    validator = SCHEMA_VALIDATORS.get(node_type)
+    if validator is None:
+        with SCHEMA_CACHE_LOCK:
+            validator = SCHEMA_VALIDATORS.get(node_type)
+            if validator is None:
+                schema = load_schema(node_type)
+                # All node schemas are written against draft 2020-12
+                Draft202012Validator.check_schema(schema)
+                validator = SCHEMA_VALIDATORS[node_type] = Draft202012Validator(schema)
+    return validator
+
 def validate_node_config(node_id: str, node_config: Dict[str, Any]):
     """Validate a node configuration against its schema."""
     node_type = node_config.get("type")
     if not node_type:
         raise ValueError(f"Node {node_id} is missing 'type' in configuration")
     
-    schema = load_schema(node_type)
-    try:
-        validate(instance=node_config, schema=schema)
-    except ValidationError as e:
-        raise ValueError(f"Validation error for node {node_id}: {str(e)}")
+    # Same error jsonschema.validate would raise, without rebuilding the validator per node
+    error = best_match(get_schema_validator(node_type).iter_errors(node_config))
+    if error is not None:
+        raise ValueError(f"Validation error for node {node_id}: {str(error)}")
+
+def config_hash(config: Dict[str, Any]) -> str:
+    """Content hash of a configuration: equal configs hash equal wherever (and however) they were loaded."""
+    canonical = json.dumps(config, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
     
 
 def load_config_from_source(source: str) -> Dict[str, Any]:
@@ -75,25 +93,37 @@ def load_config_from_source(source: str) -> Dict[str, Any]:
     raise ValueError(f"Unsupported config source: {source}")
 
 
-# Global cache for validated configuration
-CONFIG_CACHE = {}
+# Global cache for validated configuration, keyed by config_hash() so in-memory configs never collide
+CONFIG_CACHE: Dict[str, Dict[str, Any]] = {}
+CONFIG_SOURCE_HASHES: Dict[str, str] = {}  # config_source -> content hash, so a source is only loaded once
 CONFIG_CACHE_LOCK = threading.Lock()  # Thread-safe lock for cache access
 
 def get_validated_config(config_source: str, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    """Retrieve or validate and cache the configuration."""
-    global CONFIG_CACHE
+    """Retrieve or validate and cache the configuration.
+
+    Each distinct config is validated exactly once per process, whichever source or dict it arrives through.
+    """
     with CONFIG_CACHE_LOCK:
-        # Check if config is already cached for the given source
-        if config_source in CONFIG_CACHE:
-            return CONFIG_CACHE[config_source]
+        # Check if config is already cached for the given source (same dict, so no need to hash it again)
+        if config_source in CONFIG_SOURCE_HASHES:
+            cached = CONFIG_CACHE[CONFIG_SOURCE_HASHES[config_source]]
+            if not config or cached is config:
+                return cached
         
-        # Load and validate configuration if not cached
+        # Load configuration if not cached
         if config_source and not config:
             config = load_config_from_source(config_source)
         
         if not config:
             raise ValueError("No configuration provided")
         
+        key = config_hash(config)
+        if config_source:
+            CONFIG_SOURCE_HASHES[config_source] = key
+        cached = CONFIG_CACHE.get(key)
+        if cached is not None:
+            return cached
+        
         # Validate all nodes in the configuration
         for node_id, node_config in config.items():
             try:
@@ -103,5 +133,37 @@ def get_validated_config(config_source: str, config: Optional[Dict[str, Any]] =
                 continue
         
         # Cache the validated configuration
-        CONFIG_CACHE[config_source] = config
-        return config
\ No newline at end of file
+        CONFIG_CACHE[key] = config
+        return config
+
+def register_validated_config(config_source: str, key: str, config: Dict[str, Any]):
+    """Record a config validated elsewhere (e.g. when its artifact was built) under its config_hash()"""
+    with CONFIG_CACHE_LOCK:
+        if config_source:
+            CONFIG_SOURCE_HASHES[config_source] = key
+        CONFIG_CACHE.setdefault(key, config)
+
+if __name__ == "__main__":
+    import time
+    from jsonschema import validate
+    from src.menu.graph.demo_menu_config import config as demo_config
+
+    # Cold validation: jsonschema.validate per node (validator rebuilt every call) vs compiled per-type validators
+    start = time.perf_counter()
+    for node_id, node_config in demo_config.items():
+        try:
+            validate(instance=node_config, schema=load_schema(node_config["type"]))
+        except ValidationError:
+            pass
+    print(f"jsonschema.validate per node : {(time.perf_counter() - start) * 1000:7.1f} ms")
+    start = time.perf_counter()
+    for node_id, node_config in demo_config.items():
+        try:
+            validate_node_config(node_id, node_config)
+        except ValueError:
+            pass
+    print(f"compiled validator per type  : {(time.perf_counter() - start) * 1000:7.1f} ms (includes compiling)")
+    start = time.perf_counter()
+    get_validated_config("", demo_config)
+    get_validated_config("", demo_config)
+    print(f"two lookups of one config    : {(time.perf_counter() - start) * 1000:7.1f} ms (hash + validate once)")
@@ -0,0 +1,118 @@
+import asyncio
+from typing import Dict, Optional, Tuple
+from src.ussd_handler import USSDGatewayHandler
+from src.services.service import ServiceABC
+from src.server_main import config_mapping
+
+class AsyncXMLHTTPServer:
+    """asyncio-streams front end serving the same AWCC XML protocol as XMLHTTPServer.
+
+    Every dialog is a coroutine: while a node waits on a backend service it holds
+    no thread, only its pending await.
+    """
+    MAX_HEADER_LINES = 100
+
+    def __init__(self, port=8080, host='localhost', max_body_size=64 * 1024, session_store=None):
+        self.port = port
+        self.host = host
+        self.max_body_size = max_body_size
+        self.server: Optional[asyncio.base_events.Server] = None
+        # Initialize handler once here
+        self.handler = USSDGatewayHandler(config_mapping, session_store=session_store)
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve requests on one connection until the client closes it or asks to."""
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                method, version, headers, body = request
+                keep_alive = self._keep_alive(version, headers)
+
+                if method != "POST":
+                    await self._write_response(writer, 405, b"", keep_alive)
+                elif body is None:
+                    await self._write_response(writer, 413, b"", False)
+                    break
+                else:
+                    xml_data = body.decode('utf-8')
+                    resp = await self.handler.handle_request_async(xml_data)
+                    print(f"Req --> :\n{xml_data} \n \n Resp --> :\n{resp.decode('utf-8')}")
+                    await self._write_response(writer, 200, resp, keep_alive)
+
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except Exception as e:
+            print(f"Error handling connection: {e}")
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Tuple[str, str, Dict[str, str], Optional[bytes]]]:
+        """Read one HTTP request; body is None when it exceeds max_body_size."""
+        request_line = await reader.readline()
+        if not request_line:
+            return None
+        parts = request_line.decode('latin-1').split()
+        if len(parts) != 3:
+            return None
+        method, _path, version = parts
+
+        headers: Dict[str, str] = {}
+        for _ in range(self.MAX_HEADER_LINES):
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode('latin-1').partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        content_length = int(headers.get("content-length", 0))
+        if content_length > self.max_body_size:
+            return method, version, headers, None
+        body = await reader.readexactly(content_length) if content_length else b""
+        return method, version, headers, body
+
+    @staticmethod
+    def _keep_alive(version: str, headers: Dict[str, str]) -> bool:
+        connection = headers.get("connection", "").lower()
+        if version == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+
+    @staticmethod
+    async def _write_response(writer: asyncio.StreamWriter, status: int, payload: bytes, keep_alive: bool):
+        reason = {200: "OK", 405: "Method Not Allowed", 413: "Payload Too Large"}.get(status, "")
+        head = (
+            f"HTTP/1.1 {status} {reason}\r\n"
+            f"Content-Type: application/xml\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode('latin-1') + payload)
+        await writer.drain()
+
+    async def serve(self):
+        """Start the server and serve until cancelled"""
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        print(f"Async XML HTTP Server started on {self.host}:{self.port}")
+        print(f"Access at: http://{self.host}:{self.port}")
+        print("Press Ctrl+C to stop the server")
+        try:
+            async with self.server:
+                await self.server.serve_forever()
+        finally:
+            await ServiceABC.close_async_session()
+
+    def start(self):
+        """Run the server on a new event loop"""
+        try:
+            asyncio.run(self.serve())
+        except KeyboardInterrupt:
+            print("\nServer stopped")
+
+# Example usage
+if __name__ == "__main__":
+    server = AsyncXMLHTTPServer(port=3214, host='0.0.0.0')  # Listen on all interfaces
+    server.start()
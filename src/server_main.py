@@ -1,9 +1,29 @@
 import http.server
+import queue
 import socketserver
+import threading
 import xml.etree.ElementTree as ET
 from urllib.parse import urlparse, parse_qs
+import os
 from src.ussd_handler import USSDGatewayHandler
-from src.menu.graph.demo_menu_config import config
+from src.menu.graph.config_artifact import load_artifact, configured_artifact_path
+from src.menu.graph.schemas.schema_utils import load_config_from_source, get_validated_config
+from src.menu.graph.nodes.menu_engine import get_menu_graph
+from src.menu.graph.demo_menu_strings_da import strings as strings_da
+from src.menu.graph.demo_menu_strings_ps import strings as strings_ps
+
+# Served from the precompiled artifact named by config.json's "menu_artifact" when it matches the .py;
+# otherwise compiled in memory. Nothing is written here: build it with python -m src.menu.graph.config_artifact
+config_source = os.path.join(os.path.dirname(__file__), "menu", "graph", "demo_menu_config.py")
+artifact_path = configured_artifact_path()
+if artifact_path:
+    config = load_artifact(config_source, artifact_path)
+else:
+    config = get_validated_config(config_source, load_config_from_source(config_source))
+# One structural graph for every language: Dari and Pashto only add string tables over it
+menu_graph = get_menu_graph(config)
+menu_graph.add_language("da", strings_da)
+menu_graph.add_language("ps", strings_ps)
 
 config_mapping = {
     "*220#": config,  # Default config from demo_menu_config.py
@@ -22,15 +42,19 @@ class XMLHTTPRequestHandler(http.server.BaseHTTPRequestHandler):
             
             # Read XML data
             xml_data = self.rfile.read(content_length).decode('utf-8')
+            if isinstance(self.server, PooledTCPServer):
+                # Answered when this MSISDN's turn comes, possibly by another worker
+                self.server.submit_dialog(self.request, xml_data)
+                return
             resp = self.server.handler.handle_request(xml_data)
-            print(f"Req --> :\n{xml_data} \n \n Resp --> :\n{resp}")
+            print(f"Req --> :\n{xml_data} \n \n Resp --> :\n{resp.decode('utf-8')}")
             
-            # Send response
+            # Send response (already UTF-8 bytes, so the length is the byte count)
             self.send_response(200)
             self.send_header('Content-Type', 'application/xml')
             self.send_header('Content-Length', str(len(resp)))
             self.end_headers()
-            self.wfile.write(resp.encode('utf-8'))
+            self.wfile.write(resp)
             
         except ET.ParseError as e:
             self.send_error(400, f"Invalid XML: {e}")
@@ -95,19 +119,118 @@ class XMLHTTPRequestHandler(http.server.BaseHTTPRequestHandler):
         """Override to customize logging"""
         print(f"[{self.address_string()}] {format % args}")
 
+class PooledTCPServer(socketserver.TCPServer):
+    """TCPServer that hands accepted connections to a bounded pool of worker threads.
+
+    Each connection takes its place in the handler's DialogSequencer when accepted, so requests for one
+    MSISDN are answered in arrival order. A request whose turn has not come is parked with its open
+    connection instead of holding a worker; it is queued for a worker again when its turn comes.
+    """
+    allow_reuse_address = True
+
+    # Sent when every worker is busy and the backlog queue is full
+    BUSY_RESPONSE = b"HTTP/1.0 503 Service Unavailable\r\nContent-Length: 0\r\nConnection: close\r\n\r\n"
+    OK_RESPONSE_HEAD = b"HTTP/1.0 200 OK\r\nContent-Type: application/xml\r\nContent-Length: %d\r\nConnection: close\r\n\r\n"
+    READ_TIMEOUT = 10  # Seconds a worker waits for a request's bytes; until then later requests may wait on it
+
+    def __init__(self, server_address, RequestHandlerClass, handler, workers=16, queue_depth=128):
+        super().__init__(server_address, RequestHandlerClass)
+        self.handler = handler
+        self.sequencer = handler.sequencer
+        self.sequencer.dispatch = self._pending_put
+        self.queue_depth = queue_depth
+        # Accepted connections and dialog turns that are ready to run; connections are capped at queue_depth
+        self._pending = queue.Queue()
+        self._local = threading.local()  # The connection a worker is reading: its ticket, and who closes it
+        self._workers = [
+            threading.Thread(target=self._work, name=f"xml-http-worker-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def _pending_put(self, turn):
+        self._pending.put(turn)
+
+    def process_request(self, request, client_address):
+        """Queue the connection for a worker instead of handling it on the accept loop"""
+        if self._pending.qsize() >= self.queue_depth:
+            try:
+                request.sendall(self.BUSY_RESPONSE)
+            except OSError:
+                pass
+            self.shutdown_request(request)
+            return
+        self._pending.put((request, client_address, self.sequencer.ticket()))
+
+    def submit_dialog(self, request, xml_data: str):
+        """Hand the request being read on this worker to the handler; its connection is answered and
+        closed when the request's turn comes"""
+        ticket, self._local.ticket = self._local.ticket, None
+        self._local.deferred = True
+
+        def respond(resp: bytes):
+            print(f"Req --> :\n{xml_data} \n \n Resp --> :\n{resp.decode('utf-8')}")
+            try:
+                request.sendall(self.OK_RESPONSE_HEAD % len(resp) + resp)
+            except OSError:
+                pass
+            finally:
+                self.shutdown_request(request)
+
+        self.handler.submit_request(xml_data, respond, ticket)
+
+    def _work(self):
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+            if callable(item):
+                item()  # A parked dialog turn that has come
+                continue
+            request, client_address, ticket = item
+            self._local.ticket = ticket
+            self._local.deferred = False
+            try:
+                request.settimeout(self.READ_TIMEOUT)
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                if self._local.ticket is not None:
+                    self.sequencer.discard(ticket)  # Not a dialog request (GET, bad request, read timeout)
+                if not self._local.deferred:
+                    self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        for _ in self._workers:
+            self._pending.put(None)
+        for worker in self._workers:
+            worker.join()
+
 class XMLHTTPServer:
     """XML HTTP Server wrapper"""
-    def __init__(self, port=8080, host='localhost'):
+    def __init__(self, port=8080, host='localhost', workers=0, queue_depth=128, session_store=None):
         self.port = port
         self.host = host
         self.server = None
+        # workers=0 keeps the single-threaded TCPServer; otherwise a bounded worker pool is used.
+        # Requests for the same MSISDN stay ordered either way (see USSDGatewayHandler.sequencer).
+        self.workers = workers
+        self.queue_depth = queue_depth
         # Initialize handler once here
-        self.handler = USSDGatewayHandler(config_mapping)
+        self.handler = USSDGatewayHandler(config_mapping, session_store=session_store)
     
     def start(self):
         """Start the server"""
         try:
-            self.server = socketserver.TCPServer((self.host, self.port), XMLHTTPRequestHandler)
+            if self.workers > 0:
+                self.server = PooledTCPServer((self.host, self.port), XMLHTTPRequestHandler, self.handler,
+                                              workers=self.workers, queue_depth=self.queue_depth)
+                print(f"Worker pool: {self.workers} threads, queue depth {self.queue_depth}")
+            else:
+                self.server = socketserver.TCPServer((self.host, self.port), XMLHTTPRequestHandler)
             # Make handler available to request handler instances
             self.server.handler = self.handler
             print(f"XML HTTP Server started on {self.host}:{self.port}")
@@ -130,7 +253,7 @@ class XMLHTTPServer:
 # Example usage
 if __name__ == "__main__":
     # Create and start server on custom port
-    server = XMLHTTPServer(port=3214, host='0.0.0.0')  # Listen on all interfaces
+    server = XMLHTTPServer(port=3214, host='0.0.0.0', workers=32, queue_depth=256)  # Listen on all interfaces
     server.start()
     
     # Alternative: Quick start with default settings
@@ -2,6 +2,9 @@ from src.services.service import ServiceABC
 from typing import Any, Dict
 
 class CheckBankAccountBalanceAPI(ServiceABC):
+    cache_ttl = 5
+    cache_per_subscriber = True  # Keyed by the whole payload, so a wrong PIN never hits a cached balance
+    idempotent = True
     # url = self.baseurl + 'um/bank/account/balance'
     def getUrl(self) -> str:
         """Return the URL for the CheckBankAccountBalanceAPI request."""
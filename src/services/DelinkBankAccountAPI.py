@@ -2,6 +2,7 @@ from src.services.service import ServiceABC
 from typing import Any, Dict
 
 class DelinkBankAccountAPI(ServiceABC):
+    invalidates_subscriber_cache = True
     # url = self.baseurl + 'um/bank/account/remove'
     def getUrl(self) -> str:
         """Return the URL for the DelinkBankAccountAPI request."""
@@ -2,6 +2,11 @@ from src.services.service import ServiceABC
 from typing import Any, Dict
 
 class GetBalanceAPI(ServiceABC):
+    # Re-read within a dialog and on quick re-dials; transfers invalidate it (invalidates_subscriber_cache)
+    cache_ttl = 5
+    cache_per_subscriber = True
+    cache_key_fields = ()  # The node's payload does not identify the subscriber; the MSISDN scope does
+    idempotent = True
     # url = self.baseurl + 'ts/api/transaction-services/CurrentBalance'
     def getUrl(self) -> str:
         """Return the URL for the GetBalanceAPI request."""
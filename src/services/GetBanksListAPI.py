@@ -2,6 +2,7 @@ from src.services.service import ServiceABC
 from typing import Any, Dict
 
 class GetBanksListAPI(ServiceABC):
+    idempotent = True
     # url = self.baseurl + 'um/bank'
     def getUrl(self) -> str:
         """Return the URL for the GetBanksListAPI request."""
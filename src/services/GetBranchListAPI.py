@@ -2,6 +2,7 @@ from src.services.service import ServiceABC
 from typing import Any, Dict
 
 class GetBranchListAPI(ServiceABC):
+    idempotent = True
     # url = self.baseurl + 'um/branch'
     def getUrl(self) -> str:
         """Return the URL for the GetBranchListAPI request."""
@@ -2,10 +2,12 @@ from src.services.service import ServiceABC
 from typing import Any, Dict
 
 class GetBreshnaBillDetails(ServiceABC):
+    idempotent = True
+    url_fields = {"accountNo": "bill_number"}
     # url = self.baseurl + 'ts/api/transaction-services/fetchBill?accountNo={billNumber}'
-    def getUrl(self, billNumber: str) -> str:
-        """Return the URL for the GetBreshnaBillDetails request."""
-        return self.baseurl + f'ts/api/transaction-services/fetchBill?accountNo={billNumber}'
+    def getUrl(self) -> str:
+        """Return the URL for the GetBreshnaBillDetails request (its query string comes from url_fields)."""
+        return self.baseurl + 'ts/api/transaction-services/fetchBill'
 
     def getPayload(self) -> Dict:
         """Create the JSON payload for the GetBreshnaBillDetails request."""
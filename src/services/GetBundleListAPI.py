@@ -2,6 +2,7 @@ from src.services.service import ServiceABC
 from typing import Any, Dict
 
 class GetBundleListAPI(ServiceABC):
+    idempotent = True
     # url = self.baseurl + 'tms/serviceDetail/awcc/bundlePacks'
     def getUrl(self) -> str:
         """Return the URL for the GetBundleListAPI request."""
@@ -2,10 +2,13 @@ from src.services.service import ServiceABC
 from typing import Any, Dict
 
 class GetFinalAmountAPI(ServiceABC):
+    idempotent = True
+    url_fields = {"serviceName": "service_name", "channel": "channel", "amount": "amount", "walletNo": "msisdn"}
+    url_defaults = {"channel": "USSD"}
     # url = self.baseurl + 'ts/api/transaction-services/getFinalAmount?serviceName={serviceType}&channel={channel}&amount={amount}&walletNo={walletNo}'
-    def getUrl(self, serviceType: str, channel: str, amount: str, walletNo: str) -> str:
-        """Return the URL for the GetFinalAmountAPI request."""
-        return self.baseurl + f'ts/api/transaction-services/getFinalAmount?serviceName={serviceType}&channel={channel}&amount={amount}&walletNo={walletNo}'
+    def getUrl(self) -> str:
+        """Return the URL for the GetFinalAmountAPI request (its query string comes from url_fields)."""
+        return self.baseurl + 'ts/api/transaction-services/getFinalAmount'
 
     def getPayload(self) -> Dict:
         """Create the JSON payload for the GetFinalAmountAPI request."""
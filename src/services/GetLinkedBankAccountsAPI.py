@@ -2,6 +2,10 @@ from src.services.service import ServiceABC
 from typing import Any, Dict
 
 class GetLinkedBankAccountsAPI(ServiceABC):
+    cache_ttl = 5
+    cache_per_subscriber = True
+    cache_key_fields = ()
+    idempotent = True
     # url = self.baseurl + 'um/bank/accounts'
     def getUrl(self) -> str:
         """Return the URL for the GetLinkedBankAccountsAPI request."""
@@ -1,11 +1,25 @@
 from src.services.service import ServiceABC
+from datetime import date, timedelta
 from typing import Any, Dict
 
 class GetTransactionHistory(ServiceABC):
+    idempotent = True
+    url_fields = {"walletNo": "msisdn", "trxnType": "transaction_type", "fromDate": "from_date", "toDate": "to_date"}
+    history_days = 30  # Period shown when the node's params give no dates
     # url = self.baseurl + 'ts/api/transaction-services/getFilteredHistory?walletNo={walletNumber}&trxnType={type}&fromDate={from}&toDate={to}'
-    def getUrl(self, walletNumber: str, type: str, from_date: str, to_date: str) -> str:
-        """Return the URL for the GetTransactionHistory request."""
-        return self.baseurl + f'ts/api/transaction-services/getFilteredHistory?walletNo={walletNumber}&trxnType={type}&fromDate={from_date}&toDate={to_date}'
+    @property
+    def url_defaults(self) -> Dict[str, Any]:
+        # Every transaction type over the last history_days, unless the node's params say otherwise
+        today = date.today()
+        return {
+            "transaction_type": "ALL",
+            "from_date": (today - timedelta(days=self.history_days)).isoformat(),
+            "to_date": today.isoformat(),
+        }
+
+    def getUrl(self) -> str:
+        """Return the URL for the GetTransactionHistory request (its query string comes from url_fields)."""
+        return self.baseurl + 'ts/api/transaction-services/getFilteredHistory'
 
     def getPayload(self) -> Dict:
         """Create the JSON payload for the GetTransactionHistory request."""
@@ -2,6 +2,7 @@ from src.services.service import ServiceABC
 from typing import Any, Dict
 
 class LinkBankAccountAPI(ServiceABC):
+    invalidates_subscriber_cache = True
     # url = self.baseurl + 'um/bank/account/balance'
     def getUrl(self) -> str:
         """Return the URL for the CheckBankAccountBalanceAPI request."""
@@ -0,0 +1,459 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import aiohttp
+except ImportError:  # Only needed by the asyncio front end; post_async falls back to a worker thread
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+# Used for every setting config.json does not give
+DEFAULT_BACKEND_SETTINGS: Dict[str, Any] = {
+    "max_connections": 50,      # Backend calls in flight at once, across all hosts; more wait for a free slot
+    "per_host_limit": 50,       # Pooled connections kept per backend host
+    "pool_connections": 10,     # Number of hosts with a pool of their own
+    "keep_alive": True,         # Reuse connections between calls
+    "keepalive_timeout": 30,    # Seconds an idle pooled connection is kept (asyncio front end)
+    "request_timeout": 20,      # Seconds per attempt
+    "retries": 3,
+    "backoff_factor": 0.1,
+    "response_cache_entries": 1024,  # Size bound of the process-wide service response cache
+    "subscriber_cache_entries": 100000,  # Size bound of the per-subscriber (balance, accounts) cache
+    "single_flight": True,      # Identical concurrent calls to idempotent services share one backend call
+    "circuit_breaker": {},      # Per-endpoint breaker settings over DEFAULT_BREAKER_SETTINGS
+}
+
+DEFAULT_BREAKER_SETTINGS: Dict[str, Any] = {
+    "enabled": True,
+    "window": 20,               # Recent calls per endpoint the rates are taken over
+    "min_calls": 10,            # Calls in the window before the breaker may open
+    "failure_rate": 0.5,        # Open at this share of failed calls (errors, 5xx, timeouts)...
+    "slow_call_seconds": 5.0,
+    "slow_call_rate": 0.8,      # ...or at this share of calls slower than slow_call_seconds
+    "open_seconds": 30,         # Fail fast this long before letting a probe call through
+    "half_open_calls": 1,       # Probe calls that must succeed to close the breaker again
+}
+
+def load_backend_settings(path: Optional[str] = None) -> Dict[str, Any]:
+    """The "backend" section of config.json (path from USSDGW_CONFIG, else the repository root) over the defaults"""
+    path = path or os.environ.get("USSDGW_CONFIG") or os.path.join(os.path.dirname(__file__), "..", "..", "config.json")
+    settings = dict(DEFAULT_BACKEND_SETTINGS)
+    try:
+        with open(path, "r") as f:
+            settings.update(json.load(f).get("backend", {}))
+    except FileNotFoundError:
+        logger.info(f"No {path}, using default backend settings")
+    return settings
+
+def payload_digest(payload: Dict) -> str:
+    """Stable hash of a JSON payload (key order does not matter)"""
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+class SingleFlight:
+    """Coalesces identical calls in flight: the first caller for a key runs the call, callers arriving
+    before it finishes wait for it and get the same result (or exception).
+
+    Threads and event loop tasks are coalesced separately; an asyncio flight is only shared within its loop.
+    """
+    def __init__(self):
+        self._flights: Dict[str, _Flight] = {}
+        self._futures: Dict[Tuple[int, str], "asyncio.Future"] = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.shared = 0  # Calls answered by another caller's backend call
+
+    def do(self, key: str, call: Callable[[], Any]) -> Any:
+        with self._lock:
+            self.calls += 1
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.shared += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        try:
+            flight.result = call()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    async def do_async(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """The call runs in a task of its own: a cancelled caller, leader included, stops waiting for it
+        but does not cancel it for the others"""
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        with self._lock:
+            self.calls += 1
+            task = self._futures.get(flight_key)
+            if task is None:
+                task = self._futures[flight_key] = loop.create_task(call())
+                task.add_done_callback(lambda t: self._flight_finished(flight_key, t))
+            else:
+                self.shared += 1
+        return await asyncio.shield(task)
+
+    def _flight_finished(self, flight_key: Tuple[int, str], task: "asyncio.Task"):
+        with self._lock:
+            if self._futures.get(flight_key) is task:
+                del self._futures[flight_key]
+        # Retrieve the outcome even if every caller stopped waiting, so asyncio does not log it as lost
+        task.cancelled() or task.exception()
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "backend_calls": self.calls - self.shared,
+                "shared": self.shared,
+                "dedup_ratio": self.shared / self.calls if self.calls else 0.0,
+            }
+
+class ServiceUnavailable(Exception):
+    """Raised instead of calling an endpoint whose circuit breaker is open"""
+
+# What a failed backend call raises once its retries are spent (refused, reset, timed out, bad HTTP)
+BACKEND_ERRORS: Tuple[type, ...] = (requests.RequestException, OSError, asyncio.TimeoutError) + \
+    ((aiohttp.ClientError,) if aiohttp is not None else ())
+
+class CircuitBreaker:
+    """Closed -> open when the recent failure or slow-call rate of an endpoint crosses its threshold;
+    open -> half-open after open_seconds, letting half_open_calls probes through; closed again once they
+    all succeed, open again as soon as one fails or is slow."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, endpoint: str, settings: Dict[str, Any], clock: Callable[[], float] = time.monotonic):
+        self.endpoint = endpoint
+        self.settings = settings
+        self._clock = clock
+        self.state = self.CLOSED
+        self._outcomes = deque(maxlen=settings["window"])  # (failed, slow) of the most recent calls
+        self._opened_until = 0.0
+        self._probes = 0  # Probes let through while half-open
+        self._probe_successes = 0
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.calls = 0
+        self.failures = 0
+        self.slow_calls = 0
+        self.rejected = 0  # Calls failed fast while open
+        self.trips = 0  # Times the breaker opened
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == self.OPEN:
+                if self._clock() < self._opened_until:
+                    self.rejected += 1
+                    return False
+                self.state = self.HALF_OPEN
+                self._probes = self._probe_successes = 0
+                logger.info(f"Circuit for {self.endpoint} half-open, probing")
+            if self.state == self.HALF_OPEN:
+                if self._probes >= self.settings["half_open_calls"]:
+                    self.rejected += 1
+                    return False
+                self._probes += 1
+            return True
+
+    def record(self, failed: bool, seconds: float):
+        slow = seconds >= self.settings["slow_call_seconds"]
+        with self._lock:
+            self.calls += 1
+            self.failures += failed
+            self.slow_calls += slow
+            if self.state == self.OPEN:
+                return  # Let through before the breaker opened; the open period decides
+            if self.state == self.HALF_OPEN:
+                if failed or slow:
+                    self._open()
+                else:
+                    self._probe_successes += 1
+                    if self._probe_successes >= self.settings["half_open_calls"]:
+                        self.state = self.CLOSED
+                        self._outcomes.clear()
+                        logger.info(f"Circuit for {self.endpoint} closed")
+                return
+            self._outcomes.append((failed, slow))
+            if len(self._outcomes) >= self.settings["min_calls"]:
+                calls = len(self._outcomes)
+                failure_rate = sum(outcome[0] for outcome in self._outcomes) / calls
+                slow_rate = sum(outcome[1] for outcome in self._outcomes) / calls
+                if failure_rate >= self.settings["failure_rate"] or slow_rate >= self.settings["slow_call_rate"]:
+                    self._open()
+
+    def _open(self):
+        self.state = self.OPEN
+        self._opened_until = self._clock() + self.settings["open_seconds"]
+        self._outcomes.clear()
+        self.trips += 1
+        logger.warning(f"Circuit for {self.endpoint} open for {self.settings['open_seconds']} s")
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self.state,
+                "calls": self.calls,
+                "failures": self.failures,
+                "slow_calls": self.slow_calls,
+                "rejected": self.rejected,
+                "trips": self.trips,
+            }
+
+class BackendClient:
+    """HTTP client shared by every service: one pooled, keep-alive connection set for the blocking
+    front end (requests) and one for the asyncio front end (aiohttp), sized from config.json.
+
+    Both count what the pool does, so saturation shows up in metrics() rather than as slow dialogs:
+    a call that finds all max_connections slots busy is counted in `saturated` and waits for one.
+    """
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self, settings: Optional[Dict[str, Any]] = None):
+        self.settings = dict(DEFAULT_BACKEND_SETTINGS, **(settings or {}))
+        self.max_connections = self.settings["max_connections"]
+        self.request_timeout = self.settings["request_timeout"]
+        self.retry = Retry(
+            total=self.settings["retries"],
+            backoff_factor=self.settings["backoff_factor"],
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=["POST"],
+        )
+        self.headers = {
+            "Content-Type": "application/json",
+            "User-Agent": "Python-Requests/2.32.3",
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",  # Enable compression
+            "Connection": "keep-alive" if self.settings["keep_alive"] else "close",
+        }
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            max_retries=self.retry,
+            pool_connections=self.settings["pool_connections"],
+            pool_maxsize=self.settings["per_host_limit"],
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(self.headers)
+        self._slots = threading.BoundedSemaphore(self.max_connections)
+        self.single_flight = SingleFlight() if self.settings["single_flight"] else None
+        self.breaker_settings = dict(DEFAULT_BREAKER_SETTINGS, **self.settings["circuit_breaker"])
+        self.breakers: Dict[str, CircuitBreaker] = {}  # Endpoint ("<caller> <URL without query>") -> its breaker
+        self._async_session: Optional["aiohttp.ClientSession"] = None
+
+        # Metrics
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.saturated = 0  # Calls that found every connection slot busy
+        self.wait_seconds = 0.0  # Time blocking calls spent waiting for a slot
+
+    def _started(self):
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            if self.in_flight > self.peak_in_flight:
+                self.peak_in_flight = self.in_flight
+
+    def _finished(self, failed: bool, breaker: Optional[CircuitBreaker], start: float):
+        with self._lock:
+            self.in_flight -= 1
+            if failed:
+                self.errors += 1
+        if breaker is not None:
+            breaker.record(failed, time.perf_counter() - start)
+
+    def breaker_for(self, url: str, caller: Optional[str] = None) -> Optional[CircuitBreaker]:
+        """The breaker for the caller's (a service's) calls to this URL's endpoint: services sharing a path
+        each get their own, while one service's calls share it whatever their query strings"""
+        if not self.breaker_settings["enabled"]:
+            return None
+        endpoint = url.split("?", 1)[0]
+        if caller:
+            endpoint = f"{caller} {endpoint}"
+        breaker = self.breakers.get(endpoint)
+        if breaker is None:
+            with self._lock:
+                breaker = self.breakers.setdefault(endpoint, CircuitBreaker(endpoint, self.breaker_settings))
+        return breaker
+
+    def _admit(self, url: str, caller: Optional[str]) -> Optional[CircuitBreaker]:
+        breaker = self.breaker_for(url, caller)
+        if breaker is not None and not breaker.allow():
+            raise ServiceUnavailable(f"{breaker.endpoint} is unavailable (circuit open)")
+        return breaker
+
+    def post(self, url: str, payload: Dict, caller: Optional[str] = None) -> Any:
+        """POST JSON and return the decoded JSON body (None if it is not JSON); retries per settings.
+
+        Raises ServiceUnavailable at once, without a backend call, while the breaker of the caller
+        (see breaker_for) at this endpoint is open.
+        """
+        breaker = self._admit(url, caller)
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.saturated += 1
+            start = time.perf_counter()
+            self._slots.acquire()
+            with self._lock:
+                self.wait_seconds += time.perf_counter() - start
+        start = time.perf_counter()  # Backend latency, as the breaker judges it; waiting for a slot is not its fault
+        self._started()
+        failed = True
+        try:
+            response = self.session.post(url, json=payload, timeout=self.request_timeout)
+            failed = response.status_code >= 500
+            try:
+                return response.json()
+            except ValueError:
+                return None
+        finally:
+            self._finished(failed, breaker, start)
+            self._slots.release()
+
+    async def post_async(self, url: str, payload: Dict, caller: Optional[str] = None) -> Any:
+        """Awaitable counterpart of post: same retry policy, but waits on the event loop instead of a thread"""
+        if aiohttp is None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.post, url, payload, caller)
+
+        breaker = self._admit(url, caller)
+        start = time.perf_counter()  # Includes aiohttp's own wait for a free connection
+        session = self._get_async_session()
+        if self.in_flight >= self.max_connections:
+            with self._lock:
+                self.saturated += 1  # aiohttp queues it until a connection frees up
+        self._started()
+        failed = True
+        try:
+            attempt = 0
+            while True:
+                try:
+                    async with session.post(url, json=payload) as response:
+                        if response.status in self.RETRY_STATUSES and attempt < self.retry.total:
+                            attempt += 1
+                            await asyncio.sleep(self.retry.backoff_factor * (2 ** (attempt - 1)))
+                            continue
+                        failed = response.status >= 500
+                        try:
+                            return await response.json(content_type=None)
+                        except ValueError:
+                            return None
+                except aiohttp.ClientConnectionError:
+                    if attempt >= self.retry.total:
+                        raise
+                    attempt += 1
+                    await asyncio.sleep(self.retry.backoff_factor * (2 ** (attempt - 1)))
+        finally:
+            self._finished(failed, breaker, start)
+
+    def _get_async_session(self) -> "aiohttp.ClientSession":
+        # Created lazily inside the running loop
+        session = self._async_session
+        if session is None or session.closed:
+            session = self._async_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_connections,
+                    limit_per_host=self.settings["per_host_limit"],
+                    keepalive_timeout=self.settings["keepalive_timeout"],
+                    force_close=not self.settings["keep_alive"],
+                ),
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+            )
+        return session
+
+    async def close_async_session(self):
+        if self._async_session is not None:
+            await self._async_session.close()
+            self._async_session = None
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "errors": self.errors,
+                "in_flight": self.in_flight,
+                "peak_in_flight": self.peak_in_flight,
+                "max_connections": self.max_connections,
+                "utilization": self.in_flight / self.max_connections,
+                "saturated": self.saturated,
+                "wait_seconds": round(self.wait_seconds, 3),
+                "open_circuits": [endpoint for endpoint, breaker in self.breakers.items() if breaker.state != CircuitBreaker.CLOSED],
+            }
+
+_client: Optional[BackendClient] = None
+_client_lock = threading.Lock()
+
+def get_backend_client() -> BackendClient:
+    """The process-wide client, built from config.json on first use"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = BackendClient(load_backend_settings())
+    return _client
+
+def configure_backend_client(settings: Dict[str, Any]) -> BackendClient:
+    """Replace the process-wide client (e.g. different pool sizes); calls already running finish on the old one"""
+    global _client
+    with _client_lock:
+        _client = BackendClient(settings)
+    return _client
+
+if __name__ == "__main__":
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Pool saturation under load: python -m src.services.backend_client <url> [threads]
+    # Compares the former hard-coded pool of 10 with the configured one
+    import sys
+    url = sys.argv[1] if len(sys.argv) > 1 else "http://localhost:8080/api/bench"
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    for settings in ({"max_connections": 10, "per_host_limit": 10}, load_backend_settings()):
+        client = BackendClient(settings)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(threads) as pool:
+            list(pool.map(lambda i: client.post(url, {"i": i}), range(threads * 2)))
+        elapsed = time.perf_counter() - start
+        print(f"max_connections={client.max_connections:<3} {threads * 2} calls in {elapsed:.2f} s  {client.metrics()}")
+
+    # The same burst of identical calls, coalesced
+    client = BackendClient(load_backend_settings())
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        list(pool.map(lambda i: client.single_flight.do(url, lambda: client.post(url, {})), range(threads * 2)))
+    elapsed = time.perf_counter() - start
+    print(f"single flight     {threads * 2} calls in {elapsed:.2f} s  {client.single_flight.metrics()}")
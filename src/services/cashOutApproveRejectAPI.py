@@ -2,10 +2,12 @@ from src.services.service import ServiceABC
 from typing import Any, Dict
 
 class cashOutApproveRejectAPI(ServiceABC):
+    invalidates_subscriber_cache = True
+    url_fields = {"cashOutId": "cash_out_id", "value": "status", "pin": "pin"}
     # url = self.baseurl + 'ts/api/transaction-services/authorizeByApp?cashOutId={id}&value={status}&pin={pin}'
-    def getUrl(self, id: int, status: str, pin: str) -> str:
-        """Return the URL for the cashOutApproveRejectAPI request."""
-        return self.baseurl + f'ts/api/transaction-services/authorizeByApp?cashOutId={id}&value={status}&pin={pin}'
+    def getUrl(self) -> str:
+        """Return the URL for the cashOutApproveRejectAPI request (its query string comes from url_fields)."""
+        return self.baseurl + 'ts/api/transaction-services/authorizeByApp'
 
     def getPayload(self) -> Dict:
         """Create the JSON payload for the cashOutApproveRejectAPI request."""
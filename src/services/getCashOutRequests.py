@@ -2,6 +2,7 @@ from src.services.service import ServiceABC
 from typing import Any, Dict
 
 class getCashOutRequests(ServiceABC):
+    idempotent = True
     # url = self.baseurl + 'ts/api/transaction-services/findWithdrawalReq'
     def getUrl(self) -> str:
         """Return the URL for the getCashOutRequests request."""
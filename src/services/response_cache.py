@@ -0,0 +1,185 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
+from src.services.backend_client import load_backend_settings
+
+# lookup() outcomes
+MISS = 0
+FRESH = 1
+STALE = 2  # Past its TTL but inside the stale window: served while one caller refreshes it
+
+class ResponseCache:
+    """Process-wide cache of parsed service results, least recently used first out beyond max_entries.
+
+    Entries are shared by every session and thread: callers must treat cached results as read-only.
+    An entry may belong to a group (a subscriber's MSISDN) so that invalidate_group drops all of its
+    entries at once, including results still being fetched when it was called (see token()).
+    """
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        # key -> (result, fresh until, stale until, group)
+        self._entries: "OrderedDict[str, Tuple[Any, float, float, Optional[str]]]" = OrderedDict()
+        self._groups: Dict[str, Set[str]] = {}  # group -> its keys
+        self._invalidations = 0
+        self._invalidated: "OrderedDict[str, int]" = OrderedDict()  # group -> value of _invalidations when last invalidated
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _key(key: str, group: Optional[str]) -> str:
+        return f"{group}|{key}" if group else key
+
+    def _drop(self, key: str):
+        group = self._entries.pop(key)[3]
+        if group:
+            keys = self._groups[group]
+            keys.discard(key)
+            if not keys:
+                del self._groups[group]
+
+    def lookup(self, key: str, group: Optional[str] = None) -> Tuple[Any, int]:
+        """(result, FRESH | STALE) for a usable entry, else (None, MISS)"""
+        key = self._key(key, group)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                result, fresh_until, stale_until, _ = entry
+                if now < fresh_until:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return result, FRESH
+                if now < stale_until:
+                    self._entries.move_to_end(key)
+                    self.stale_hits += 1
+                    return result, STALE
+                self._drop(key)
+            self.misses += 1
+            return None, MISS
+
+    def token(self) -> int:
+        """Taken before fetching a grouped result and handed to store(): a result fetched across an
+        invalidation of its group is then discarded instead of being cached"""
+        with self._lock:
+            return self._invalidations
+
+    def store(self, key: str, result: Any, ttl: float, stale_ttl: float = 0,
+              group: Optional[str] = None, token: Optional[int] = None) -> bool:
+        key = self._key(key, group)
+        now = time.monotonic()
+        with self._lock:
+            if group and token is not None and self._invalidated.get(group, -1) >= token:
+                return False
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (result, now + ttl, now + ttl + stale_ttl, group)
+            if group:
+                self._groups.setdefault(group, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+            return True
+
+    def invalidate_group(self, group: str):
+        """Drop every entry of a group, and any of its results that are fetched right now"""
+        with self._lock:
+            for key in list(self._groups.get(group, ())):
+                self._drop(key)
+            self._invalidated[group] = self._invalidations
+            self._invalidated.move_to_end(group)
+            self._invalidations += 1
+            self.invalidations += 1
+            # Only fetches in flight need the marks; keep as many as there are entries
+            while len(self._invalidated) > self.max_entries:
+                self._invalidated.popitem(last=False)
+
+    def begin_refresh(self, key: str, group: Optional[str] = None) -> bool:
+        """Claim the background refresh of a stale entry; False if another caller already has it"""
+        key = self._key(key, group)
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key: str, group: Optional[str], succeeded: bool):
+        key = self._key(key, group)
+        with self._lock:
+            self._refreshing.discard(key)
+            self.refreshes += 1
+            if not succeeded:
+                self.refresh_failures += 1  # The stale entry stays until its stale window runs out
+
+    def invalidate(self, prefix: str = ""):
+        """Drop every entry whose key starts with prefix (all entries by default)"""
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                self._drop(key)
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.stale_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "hit_ratio": (self.hits + self.stale_hits) / lookups if lookups else 0.0,
+                "refreshes": self.refreshes,
+                "refresh_failures": self.refresh_failures,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+_cache: Optional[ResponseCache] = None
+_subscriber_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+def get_response_cache() -> ResponseCache:
+    """The process-wide cache, sized by backend.response_cache_entries in config.json"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResponseCache(load_backend_settings()["response_cache_entries"])
+    return _cache
+
+def get_subscriber_cache() -> ResponseCache:
+    """The process-wide cache of per-subscriber results (grouped by MSISDN), sized by backend.subscriber_cache_entries"""
+    global _subscriber_cache
+    if _subscriber_cache is None:
+        with _cache_lock:
+            if _subscriber_cache is None:
+                _subscriber_cache = ResponseCache(load_backend_settings()["subscriber_cache_entries"])
+    return _subscriber_cache
+
+if __name__ == "__main__":
+    import sys
+    from src.services.GetBundleListAPI import GetBundleListAPI
+    from src.services import response_cache  # The instance the services use, not this __main__ copy
+
+    class CachedBundleList(GetBundleListAPI):
+        # How a catalog read would be cached: one copy per bundle type, refreshed in the background
+        cache_ttl = 300
+        cache_stale_ttl = 3600
+        cache_key_fields = ("bundle_type",)
+
+    # python -m src.services.response_cache [base url]: bundle catalog for 100 subscribers, cold then cached
+    service = CachedBundleList()
+    service.baseurl = sys.argv[1] if len(sys.argv) > 1 else service.baseurl
+    for attempt in ("first", "cached"):
+        start = time.perf_counter()
+        for i in range(100):
+            service.doPost({"msisdn": f"9370{i:07d}", "bundle_type": "DATA"})
+        print(f"{attempt:<6} 100 lookups: {(time.perf_counter() - start) * 1000:.1f} ms  {response_cache.get_response_cache().metrics()}")
@@ -1,54 +1,199 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict
-import  requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from typing import Any, Dict, Optional, Tuple
+import asyncio
+import contextvars
+import logging
+import threading
+from urllib.parse import urlencode
+from src.services.backend_client import BackendClient, get_backend_client, payload_digest
+from src.services.response_cache import ResponseCache, get_response_cache, get_subscriber_cache, FRESH, STALE
+
+logger = logging.getLogger(__name__)
+
+class MissingRequestField(ValueError):
+    """Raised instead of calling a service whose URL needs a payload field the caller did not send"""
 
 class ServiceABC(ABC):
-    _session = requests.Session()
-    _request_timeout = 20
-    _retry_strategy = Retry(
-        total=3,
-        backoff_factor=0.1,
-        status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["POST"]
-    )
-    _adapter = HTTPAdapter(
-        max_retries=_retry_strategy,
-        pool_connections=10,  # Max connections to keep in pool
-        pool_maxsize=10       # Max concurrent connections
-    )
-    _session.mount("http://", _adapter)
-    _session.mount("https://", _adapter)
-    
-    # Configure default headers with compression
-    _session.headers.update({
-        "Content-Type": "application/json",
-        "User-Agent": "Python-Requests/2.32.3",
-        "Accept": "application/json",
-        "Accept-Encoding": "gzip, deflate",  # Enable compression
-        "Connection": "keep-alive"          # Explicitly enable Keep-Alive
-    })
-
-    def doPost (self, payLoad: Dict)->Any:
-         
-        response = self._session.post(
-                self.getUrl(),
-                json=payLoad,
-                headers=ServiceABC._session.headers,
-                timeout=ServiceABC._request_timeout,
-                
-            )
-        return  self.parseResponse(response)
+    # Seconds a successful parsed result is served from the process-wide response cache; 0 disables caching
+    cache_ttl: float = 0
+    # Seconds past cache_ttl a result is still served while one background call refreshes it
+    cache_stale_ttl: float = 0
+    # Payload fields the result depends on (None: all of them, empty: none, i.e. one entry per URL)
+    cache_key_fields: Optional[Tuple[str, ...]] = None
+    # Cache results per subscriber (MSISDN) instead of process-wide; uncached when the caller gives no MSISDN
+    cache_per_subscriber: bool = False
+    # A success changes the subscriber's balances or accounts: drop their per-subscriber cached results
+    invalidates_subscriber_cache: bool = False
+    # Read-only call: identical calls in flight at the same time may share one backend call (single flight)
+    idempotent: bool = False
+    # Services whose URL carries the request: query parameter -> payload field it is read from
+    url_fields: Dict[str, str] = {}
+    # Values for payload fields the caller may leave out of the query string
+    url_defaults: Dict[str, Any] = {}
+
+    _refresh_tasks = set()  # Keeps background refresh tasks referenced until they finish
+
+    # Every service posts through the one process-wide BackendClient (pool sizes from config.json)
+    @property
+    def backend(self) -> BackendClient:
+        return get_backend_client()
+
+    def request_url(self, payLoad: Dict) -> str:
+        """getUrl() plus the URL-encoded url_fields query string for this payload"""
+        if not self.url_fields:
+            return self.getUrl()
+        query = {}
+        for parameter, field in self.url_fields.items():
+            value = payLoad.get(field)
+            if value is None:
+                value = self.url_defaults.get(field)
+            if value is None:
+                raise MissingRequestField(f"{type(self).__name__} needs payload field {field!r} (query parameter {parameter})")
+            query[parameter] = value
+        return f"{self.getUrl()}?{urlencode(query)}"
+
+    def cache_key(self, payLoad: Dict) -> str:
+        url = self.request_url(payLoad)
+        if self.cache_key_fields is not None:
+            payLoad = {field: payLoad.get(field) for field in self.cache_key_fields}
+        return f"{url}|{payload_digest(payLoad)}"
+
+    def _cache_scope(self, msisdn: Optional[str]) -> Tuple[Optional[ResponseCache], Optional[str]]:
+        """(cache, group) this service's results live in, or (None, None) when they are not cached"""
+        if not self.cache_ttl:
+            return None, None
+        if self.cache_per_subscriber:
+            return (get_subscriber_cache(), msisdn) if msisdn else (None, None)
+        return get_response_cache(), None
+
+    def _flight_key(self, payLoad: Dict, msisdn: Optional[str]) -> str:
+        # Same key as the cache (cache_key_fields decide which payload fields matter); per-subscriber
+        # results are never shared across subscribers, whatever their payloads
+        key = self.cache_key(payLoad)
+        return f"{msisdn}|{key}" if self.cache_per_subscriber else key
+
+    def _call(self, payLoad: Dict, cache: Optional[ResponseCache], key: str, group: Optional[str]) -> Tuple[Any, str]:
+        """One backend call: (parsed result, validation error). The caller making the call also caches the
+        result, under the invalidation token taken before it started."""
+        token = cache.token() if cache is not None else 0
+        result = self.parseResponse(self.backend.post(self.request_url(payLoad), payLoad, type(self).__name__))
+        if cache is not None:
+            self._remember(cache, key, group, token, result)
+        return result, self.validation_error if result is None else ""
+
+    async def _call_async(self, payLoad: Dict, cache: Optional[ResponseCache], key: str, group: Optional[str]) -> Tuple[Any, str]:
+        token = cache.token() if cache is not None else 0
+        result = self.parseResponse(await self.backend.post_async(self.request_url(payLoad), payLoad, type(self).__name__))
+        if cache is not None:
+            self._remember(cache, key, group, token, result)
+        return result, self.validation_error if result is None else ""
+
+    def _fetch(self, payLoad: Dict, msisdn: Optional[str], cache: Optional[ResponseCache] = None,
+               key: str = "", group: Optional[str] = None) -> Any:
+        """_call, joined to an identical call already in flight when the service is idempotent"""
+        flights = self.backend.single_flight
+        if not self.idempotent or flights is None:
+            return self._call(payLoad, cache, key, group)[0]
+        result, error = flights.do(self._flight_key(payLoad, msisdn), lambda: self._call(payLoad, cache, key, group))
+        if result is None:
+            self.validation_error = error  # The leader's error, for callers whose own parseResponse never ran
+        return result
+
+    async def _fetch_async(self, payLoad: Dict, msisdn: Optional[str], cache: Optional[ResponseCache] = None,
+                           key: str = "", group: Optional[str] = None) -> Any:
+        flights = self.backend.single_flight
+        if not self.idempotent or flights is None:
+            return (await self._call_async(payLoad, cache, key, group))[0]
+        result, error = await flights.do_async(
+            self._flight_key(payLoad, msisdn), lambda: self._call_async(payLoad, cache, key, group)
+        )
+        if result is None:
+            self.validation_error = error
+        return result
+
+    def doPost (self, payLoad: Dict, msisdn: Optional[str] = None)->Any:
+        """POST the payload and parse the response; msisdn is the subscriber the call is made for."""
+        cache, group = self._cache_scope(msisdn)
+        if cache is None:
+            return self._settled(self._fetch(payLoad, msisdn), msisdn)
+        key = self.cache_key(payLoad)
+        result, status = cache.lookup(key, group)
+        if status == FRESH:
+            return result
+        if status == STALE:
+            if cache.begin_refresh(key, group):
+                threading.Thread(target=self._refresh, args=(cache, key, group, payLoad), daemon=True).start()
+            return result
+        return self._fetch(payLoad, msisdn, cache, key, group)
+
+    async def doPostAsync(self, payLoad: Dict, msisdn: Optional[str] = None) -> Any:
+        """Awaitable counterpart of doPost: same retry policy, but waits on the event loop instead of a thread."""
+        cache, group = self._cache_scope(msisdn)
+        if cache is None:
+            return self._settled(await self._fetch_async(payLoad, msisdn), msisdn)
+        key = self.cache_key(payLoad)
+        result, status = cache.lookup(key, group)
+        if status == FRESH:
+            return result
+        if status == STALE:
+            if cache.begin_refresh(key, group):
+                task = asyncio.get_running_loop().create_task(self._refresh_async(cache, key, group, payLoad))
+                ServiceABC._refresh_tasks.add(task)
+                task.add_done_callback(ServiceABC._refresh_tasks.discard)
+            return result
+        return await self._fetch_async(payLoad, msisdn, cache, key, group)
+
+    def _settled(self, result: Any, msisdn: Optional[str]) -> Any:
+        if result is not None and msisdn and self.invalidates_subscriber_cache:
+            get_subscriber_cache().invalidate_group(msisdn)
+        return result
+
+    def _remember(self, cache: ResponseCache, key: str, group: Optional[str], token: int, result: Any) -> bool:
+        # Failures (None) are never cached, so the next caller retries the backend
+        if result is None:
+            return False
+        return cache.store(key, result, self.cache_ttl, self.cache_stale_ttl, group, token)
+
+    def _refresh(self, cache: ResponseCache, key: str, group: Optional[str], payLoad: Dict):
+        succeeded = False
+        try:
+            succeeded = self._fetch(payLoad, group, cache, key, group) is not None
+        except Exception as e:
+            logger.warning(f"Background refresh of {type(self).__name__} failed: {e}")
+        finally:
+            cache.end_refresh(key, group, succeeded)
+
+    async def _refresh_async(self, cache: ResponseCache, key: str, group: Optional[str], payLoad: Dict):
+        succeeded = False
+        try:
+            succeeded = await self._fetch_async(payLoad, group, cache, key, group) is not None
+        except Exception as e:
+            logger.warning(f"Background refresh of {type(self).__name__} failed: {e}")
+        finally:
+            cache.end_refresh(key, group, succeeded)
+
+    @classmethod
+    async def close_async_session(cls):
+        await get_backend_client().close_async_session()
 
     """Abstract base class for API services."""
     def __init__(self):
         self.baseurl = "http://localhost:8080/"  # Placeholder base URL
-        self.validation_error = ""
+        # One instance serves every session (see ServiceRegistry), so the last error is kept per
+        # thread / asyncio task rather than on the instance
+        self._validation_error = contextvars.ContextVar(f"{type(self).__name__}.validation_error", default="")
+
+    @property
+    def validation_error(self) -> str:
+        return self._validation_error.get()
+
+    @validation_error.setter
+    def validation_error(self, value: str):
+        self._validation_error.set(value)
 
     @abstractmethod
-    def getUrl(self, *args, **kwargs) -> str:
-        """Return the URL for the API request."""
+    def getUrl(self) -> str:
+        """Return the URL for the API request; request_url adds the url_fields query string."""
         pass
 
     @abstractmethod
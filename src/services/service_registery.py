@@ -1,15 +1,58 @@
-from src.services.services import AuthService, BankingService, TopupService, BillPaymentService, BundleService
-from typing import Union
+import importlib
+import logging
+import threading
+from typing import Dict
+from src.services.service import ServiceABC
+
+logger = logging.getLogger(__name__)
 
 class ServiceRegistry:
-    _services = {
-        "auth": AuthService(),
-        "banking": BankingService(),
-        "topup": TopupService(),
-        "bills": BillPaymentService(),
-        "bundles": BundleService()
-    }
-    
+    """Process-wide service registry: each dotted path (e.g. "src.services.GetBalanceAPI.GetBalanceAPI")
+    is imported once and every node using that class shares a single instance."""
+    _by_path: Dict[str, ServiceABC] = {}
+    _by_class: Dict[type, ServiceABC] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_service(cls, path: str) -> ServiceABC:
+        """Return the shared instance for a service path; raises ValueError for anything that is not a ServiceABC."""
+        service = cls._by_path.get(path)
+        if service is not None:
+            return service
+        with cls._lock:
+            service = cls._by_path.get(path)
+            if service is None:
+                klass = cls.resolve(path)
+                service = cls._by_class.get(klass)
+                if service is None:
+                    service = cls._by_class[klass] = klass()
+                    logger.info(f"Service {klass.__name__} loaded from {path}")
+                cls._by_path[path] = service
+            return service
+
+    @staticmethod
+    def resolve(path: str) -> type:
+        """Import and check the service class at a path without instantiating it"""
+        # Split path to get module and class
+        if '.' not in path:
+            raise ValueError(f"Invalid service path {path}: must include module and class name (e.g., module.class)")
+        module_path, class_name = path.rsplit(".", 1)
+        try:
+            module = importlib.import_module(module_path)
+            klass = getattr(module, class_name)
+        except (ImportError, AttributeError) as e:
+            raise ValueError(f"Cannot load service {path}: {e}")
+        # Check if klass is a class
+        if not isinstance(klass, type):
+            raise ValueError(f"Expected a class at {path}, got {type(klass).__name__} instead")
+        # Check if klass inherits from ServiceABC
+        if not issubclass(klass, ServiceABC):
+            raise ValueError(f"Service class {class_name} at {path} must inherit from ServiceABC")
+        return klass
+
     @classmethod
-    def get_service(cls, service_name: str) -> BundleService | BankingService | TopupService | BillPaymentService | AuthService | None:
-        return cls._services.get(service_name)
\ No newline at end of file
+    def clear(cls):
+        """Forget every resolved service (tests and config reloads)"""
+        with cls._lock:
+            cls._by_path.clear()
+            cls._by_class.clear()
@@ -1,60 +1,164 @@
 import cProfile
 import logging
-from typing import Dict, Any
-from src.gw.ussd_parser import USSDParser
+import threading
+from typing import Callable, Dict, Any, Optional, Tuple
+from src.gw.ussd_parser import USSDParser, escape_attr
 from src.menu.graph.menu_state_management import MenuSessionManager
-from src.gw.ussd_session_utils import USSDSessionManager
+from src.menu.graph.nodes.menu_engine import get_menu_graph
+from src.gw.ussd_session_utils import SessionStore, USSDSessionManager
+from src.gw.dialog_ordering import DialogSequencer, AsyncDialogSequencer
+from src.menu.graph.nodes.menu_engine import MenuEngine
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("USSDHandler")
 
 class USSDGatewayHandler:
-    def __init__(self, config_mapping: Dict[str, Dict], session_timeout: int = 300000, max_pin_attempts: int = 3):
-        self.parser = USSDParser(USSDSessionManager(session_timeout))
-        self.menu_state_machine = MenuSessionManager(session_timeout_minutes=session_timeout // 60000)
+    def __init__(self, config_mapping: Dict[str, Dict], session_timeout: int = 300000, max_pin_attempts: int = 3,
+                 session_store: Optional[SessionStore] = None):
+        # One store holds both halves of every dialog; session_timeout is in milliseconds.
+        # Pass a shared store (e.g. SharedSessionManager) to let several gateway nodes serve the same dialogs.
+        self.session_store = session_store or USSDSessionManager(session_timeout / 1000)
+        self.parser = USSDParser(self.session_store)
+        self.menu_state_machine = MenuSessionManager(self.session_store)
         self.config_mapping = config_mapping  # Dictionary mapping dial strings to configs, e.g., {"*222#": config, "*222#1": config2}
-
-    def handle_request(self, raw_xml: str) -> str:
+        # Compile every mapped config once at startup; sessions only carry a cursor into the shared graph
+        for config in config_mapping.values():
+            get_menu_graph(config)
+        # Keeps requests for the same MSISDN in order when the front end runs them concurrently
+        self.sequencer = DialogSequencer()
+        self.async_sequencer = AsyncDialogSequencer()
+
+    def handle_request(self, raw_xml: str) -> bytes:
+        """Handle one request and return its response, waiting for any earlier request of the same MSISDN."""
+        responses = []
+        done = threading.Event()
+
+        def respond(response: bytes):
+            responses.append(response)
+            done.set()
+
+        self.submit_request(raw_xml, respond)
+        done.wait()
+        return responses[0]
+
+    def submit_request(self, raw_xml: str, respond: Callable[[bytes], None], ticket: Optional[int] = None):
+        """Non-blocking handle_request: respond(response) is called once every earlier request for the same
+        MSISDN has been answered, on this thread or on the one that answered the last of them.
+
+        ticket is the request's arrival number from self.sequencer.ticket(), taken when the front end
+        accepted it; without one the request counts as arriving now.
+        """
         try:
             # Parse incoming XML
-            parsed = self.parser.parse_request(raw_xml)
-            logger.debug(f"Parsed request: {parsed}")
-            dialog_type = parsed['dialog_type']
+            parsed = self.parser.parse_fields(raw_xml)
             msisdn = parsed['msisdn']
-            user_input = parsed['user_input']
-
-            if dialog_type == "Begin":
-                service_code = user_input  # Initial dial string, e.g., "*222#" or "*222#1"
-                if service_code not in self.config_mapping:
-                    return self._generate_error_response("Service not configured yet")
-                # Valid service code, use the corresponding config
-                config = self.config_mapping[service_code]
-                menu_engine = self.menu_state_machine.get_or_create_session(msisdn, config=config)
-                response = menu_engine.get_current_prompt()  # Should be ValidationGateNode's prompt
-                end_session = False
-            else:  # Continue
-                menu_engine = self.menu_state_machine.get_or_create_session(msisdn)
-                response = menu_engine.process_user_input(user_input)
-                end_session = True if user_input == "0" or response == "Session ended" else False
-            response_xml = self.parser.getResponse(msisdn, response, end_session)
-            logger.debug(f"Generated response: {response_xml}")
-            return response_xml
+        except Exception as e:
+            logger.exception("Critical error handling request")
+            if ticket is not None:
+                self.sequencer.discard(ticket)
+            respond(self._generate_error_response(str(e)))
+            return
+
+        def turn():
+            try:
+                bound = parsed if parsed.get('error') else self.parser.bind_session(parsed)
+                response = self._dispatch(bound)
+            except Exception as e:
+                logger.exception("Critical error handling request")
+                response = self._generate_error_response(str(e))
+            respond(response)
+
+        self.sequencer.submit(ticket, msisdn, turn)
+
+    async def handle_request_async(self, raw_xml: str) -> bytes:
+        """Coroutine variant of handle_request for the asyncio front end; backend calls do not block the loop."""
+        try:
+            parsed = self.parser.parse_fields(raw_xml)
+            async with self.async_sequencer.ordered(parsed['msisdn']):
+                if not parsed.get('error'):
+                    parsed = self.parser.bind_session(parsed)
+                menu_engine, error_response = self._resolve_engine(parsed)
+                if error_response:
+                    return error_response
+                if parsed['dialog_type'] == "Begin":
+                    response = await menu_engine.get_current_prompt_async()
+                else:
+                    response = await menu_engine.process_user_input_async(parsed['user_input'])
+                return self._render_response(parsed, response)
 
         except Exception as e:
             logger.exception("Critical error handling request")
             return self._generate_error_response(str(e))
 
-    def _generate_error_response(self, error_msg: str) -> str:
-        error_xml = f"""
+    def _dispatch(self, parsed: Dict[str, Any]) -> bytes:
+        menu_engine, error_response = self._resolve_engine(parsed)
+        if error_response:
+            return error_response
+        if parsed['dialog_type'] == "Begin":
+            response = menu_engine.get_current_prompt()  # Should be ValidationGateNode's prompt
+        else:  # Continue
+            response = menu_engine.process_user_input(parsed['user_input'])
+        return self._render_response(parsed, response)
+
+    def _resolve_engine(self, parsed: Dict[str, Any]) -> Tuple[Optional[MenuEngine], Optional[bytes]]:
+        """Find or create the menu session for a request; returns (engine, error_response)."""
+        logger.debug(f"Parsed request: {parsed}")
+        session = parsed.get('session')
+        if session is None:
+            return None, self._generate_error_response(parsed.get('error_message', "No active session"))
+
+        if parsed['dialog_type'] == "Begin":
+            service_code = parsed['user_input']  # Initial dial string, e.g., "*222#" or "*222#1"
+            shortcut: Tuple[str, ...] = ()
+            if service_code not in self.config_mapping:
+                # Maybe a shortcut into the menus, e.g. "*220*1*4#" = "*220#" then 1, 4
+                service_code, shortcut = self.split_dial_string(service_code)
+                if service_code not in self.config_mapping:
+                    return None, self._generate_error_response("Service not configured yet")
+                session.service_code = service_code  # Continue requests look the config up by it
+            # Valid service code, use the corresponding config
+            config = self.config_mapping[service_code]
+            menu_engine = self.menu_state_machine.engine_for(session, config)
+            if shortcut and not menu_engine.enter_shortcut(shortcut):
+                logger.info(f"Unknown menu shortcut {parsed['user_input']}, starting at the main menu")
+            return menu_engine, None
+        # The config is only needed to resume a cursor loaded from a shared store
+        return self.menu_state_machine.engine_for(session, self.config_mapping.get(session.service_code)), None
+
+    @staticmethod
+    def split_dial_string(dial_string: str) -> Tuple[str, Tuple[str, ...]]:
+        """"*220*1*4#" -> ("*220#", ("1", "4")); anything else is returned unchanged with no keys."""
+        if len(dial_string) > 2 and dial_string[0] == "*" and dial_string[-1] == "#":
+            parts = dial_string[1:-1].split("*")
+            if len(parts) > 1 and all(parts):
+                return f"*{parts[0]}#", tuple(parts[1:])
+        return dial_string, ()
+
+    def _render_response(self, parsed: Dict[str, Any], response: str) -> bytes:
+        user_input = parsed['user_input']
+        if parsed['dialog_type'] == "Begin":
+            end_session = False
+        else:
+            end_session = True if user_input == "0" or response == "Session ended" else False
+        if not end_session:
+            self.menu_state_machine.park_engine(parsed['session'])
+            self.session_store.save_session(parsed['session'])
+        response_xml = self.parser.render_session_response(parsed['session'], response, end_session)
+        logger.debug(f"Generated response: {response_xml}")
+        return response_xml
+
+    ERROR_RESPONSE_TEMPLATE = b"""
         <?xml version="1.0" encoding="UTF-8"?>
         <dialog type="End" mapMessagesSize="1">
             <processUnstructuredSSRequest_Response 
                 dataCodingScheme="15" 
-                string="{error_msg}"/>
+                string="%s"/>
         </dialog>
         """
+
+    def _generate_error_response(self, error_msg: str) -> bytes:
         logger.error(f"Returning error response: {error_msg}")
-        return error_xml
+        return self.ERROR_RESPONSE_TEMPLATE % escape_attr(error_msg)
     
 
 
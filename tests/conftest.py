@@ -0,0 +1,38 @@
+import copy
+import html
+import re
+
+import pytest
+
+from src.menu.graph.demo_menu_config import config as demo_menu_config
+
+BEGIN = """<?xml version="1.0" encoding="UTF-8"?>
+<dialog type="Begin" appCntx="networkUnstructuredSsContext_version2" networkId="0" localId="SESSION123" remoteId="REMOTE123" mapMessagesSize="1" returnMessageOnError="false">
+    <processUnstructuredSSRequest_Request invokeId="1" dataCodingScheme="15" string="{text}">
+        <msisdn number="{msisdn}" nai="international_number" npi="ISDN"/>
+    </processUnstructuredSSRequest_Request>
+</dialog>"""
+
+CONTINUE = """<?xml version="1.0" encoding="UTF-8"?>
+<dialog type="Continue" localId="SESSION123" remoteId="REMOTE123" appCntx="networkUnstructuredSsContext_version2" networkId="0" mapMessagesSize="1" returnMessageOnError="false">
+    <unstructuredSSRequest_Response invokeId="1" dataCodingScheme="15" string="{text}">
+        <msisdn number="{msisdn}" nai="international_number" npi="ISDN"/>
+    </unstructuredSSRequest_Response>
+</dialog>"""
+
+@pytest.fixture(scope="session")
+def demo_config():
+    """The demo menu with the PIN checked against valid_pin instead of the backend"""
+    config = copy.deepcopy(demo_menu_config)
+    del config["root_validation_gate"]["validation_url"]
+    return config
+
+@pytest.fixture
+def dialog():
+    """dialog(handler, dial_string, *inputs, msisdn=...) -> the text of every response, Begin first"""
+    def run(handler, dial_string, *inputs, msisdn="93701234567"):
+        texts = [BEGIN.format(text=dial_string, msisdn=msisdn)]
+        texts += [CONTINUE.format(text=text, msisdn=msisdn) for text in inputs]
+        return [html.unescape(re.search(rb'string="([^"]*)"', handler.handle_request(request)).group(1).decode())
+                for request in texts]
+    return run
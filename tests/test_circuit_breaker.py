@@ -0,0 +1,89 @@
+import pytest
+
+from src.services.backend_client import BackendClient, CircuitBreaker, ServiceUnavailable, DEFAULT_BREAKER_SETTINGS
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+SETTINGS = dict(DEFAULT_BREAKER_SETTINGS, window=5, min_calls=3, failure_rate=0.5, slow_call_seconds=2.0,
+                slow_call_rate=0.8, open_seconds=30, half_open_calls=2)
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker("Service http://backend/path", SETTINGS, clock)
+
+def fail(breaker: CircuitBreaker, times: int):
+    for _ in range(times):
+        assert breaker.allow()
+        breaker.record(True, 0.1)
+
+def test_opens_once_the_failure_rate_crosses_the_threshold(breaker):
+    fail(breaker, 2)
+    assert breaker.state == CircuitBreaker.CLOSED  # Fewer than min_calls: no verdict yet
+    fail(breaker, 1)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+    assert breaker.metrics()["rejected"] == 1
+    assert breaker.metrics()["trips"] == 1
+
+def test_stays_closed_below_the_failure_rate(breaker):
+    for failed in (False, False, True, False, False):
+        assert breaker.allow()
+        breaker.record(failed, 0.1)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+def test_opens_on_slow_calls(breaker):
+    for _ in range(3):
+        assert breaker.allow()
+        breaker.record(False, 2.5)
+    assert breaker.state == CircuitBreaker.OPEN
+
+def test_half_open_after_the_cooldown_then_closed_once_probes_succeed(breaker, clock):
+    fail(breaker, 3)
+    clock.now += 29.9
+    assert not breaker.allow()
+    clock.now += 0.2
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()  # Only half_open_calls probes at a time
+    breaker.record(False, 0.1)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.record(False, 0.1)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+def test_failed_probe_opens_again_for_a_full_cooldown(breaker, clock):
+    fail(breaker, 3)
+    clock.now += 30
+    assert breaker.allow()
+    breaker.record(True, 0.1)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.metrics()["trips"] == 2
+    clock.now += 29
+    assert not breaker.allow()
+
+def test_open_breaker_fails_fast_without_a_backend_call():
+    # Nothing listens on port 1: every call that reaches the network is refused
+    client = BackendClient({"retries": 0, "circuit_breaker": {"window": 5, "min_calls": 3, "open_seconds": 60}})
+    url = "http://127.0.0.1:1/balance"
+    for _ in range(3):
+        with pytest.raises(Exception) as error:
+            client.post(url, {}, "GetBalanceAPI")
+        assert not isinstance(error.value, ServiceUnavailable)
+    requests = client.metrics()["requests"]
+    with pytest.raises(ServiceUnavailable):
+        client.post(url, {}, "GetBalanceAPI")
+    assert client.metrics()["requests"] == requests
+    assert client.metrics()["open_circuits"] == ["GetBalanceAPI http://127.0.0.1:1/balance"]
+    # Another service on the same path has a breaker of its own
+    with pytest.raises(Exception) as error:
+        client.post(url, {}, "ValidationApi")
+    assert not isinstance(error.value, ServiceUnavailable)
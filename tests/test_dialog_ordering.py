@@ -0,0 +1,67 @@
+import random
+import threading
+import time
+
+from src.gw.dialog_ordering import DialogSequencer
+
+def test_work_runs_in_ticket_order_per_msisdn_whatever_the_submit_order():
+    sequencer = DialogSequencer()
+    seen = {"a": [], "b": []}
+    tickets = [(sequencer.ticket(), "ab"[i % 2]) for i in range(100)]
+    random.seed(1)
+    random.shuffle(tickets)  # Workers finish parsing in any order
+
+    def submit(ticket, msisdn):
+        time.sleep(random.random() * 0.005)
+        sequencer.submit(ticket, msisdn, lambda: seen[msisdn].append(ticket))
+
+    threads = [threading.Thread(target=submit, args=item) for item in tickets]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert seen["a"] == sorted(seen["a"]) and len(seen["a"]) == 50
+    assert seen["b"] == sorted(seen["b"]) and len(seen["b"]) == 50
+    assert sequencer.pending() == 0
+
+def test_parked_work_holds_no_thread_and_runs_on_dispatch():
+    dispatched = []
+    sequencer = DialogSequencer(dispatch=dispatched.append)
+    first, second = sequencer.ticket(), sequencer.ticket()
+    ran = []
+    sequencer.submit(second, "x", lambda: ran.append(second))
+    assert ran == [] and dispatched == []  # Ticket `first` may still be for "x"
+    sequencer.submit(first, "y", lambda: ran.append(first))
+    assert ran == [first]  # Its own turn runs on the submitting thread
+    assert len(dispatched) == 1  # "x" was freed by it and handed to the pool
+    dispatched[0]()
+    assert ran == [first, second]
+
+def test_discarded_ticket_releases_later_work():
+    sequencer = DialogSequencer()
+    unread, ticket = sequencer.ticket(), sequencer.ticket()
+    ran = []
+    sequencer.submit(ticket, "x", lambda: ran.append(ticket))
+    assert ran == []
+    sequencer.discard(unread)
+    assert ran == [ticket]
+
+def test_next_request_for_an_msisdn_runs_after_the_current_one():
+    sequencer = DialogSequencer()
+    order = []
+    release = threading.Event()
+
+    def first():
+        order.append("first started")
+        release.wait()
+        order.append("first done")
+
+    thread = threading.Thread(target=sequencer.submit, args=(None, "x", first))
+    thread.start()
+    while not order:
+        time.sleep(0.001)
+    sequencer.submit(None, "x", lambda: order.append("second"))  # Parked: returns at once
+    assert order == ["first started"]
+    release.set()
+    thread.join()
+    assert order == ["first started", "first done", "second"]
@@ -0,0 +1,43 @@
+from datetime import date, timedelta
+from urllib.parse import urlparse, parse_qs
+
+import pytest
+
+from src.services.service import MissingRequestField
+from src.services.GetTransactionHistory import GetTransactionHistory
+from src.services.GetFinalAmountAPI import GetFinalAmountAPI
+from src.services.cashOutApproveRejectAPI import cashOutApproveRejectAPI
+
+def query(url: str):
+    return {parameter: values[0] for parameter, values in parse_qs(urlparse(url).query).items()}
+
+def test_transaction_history_from_the_transaction_menu_payload():
+    # transaction_menu sends the subscriber and their PIN only
+    url = GetTransactionHistory().request_url({"msisdn": "93701234567", "pin": "123456"})
+    assert url.startswith("http://localhost:8080/ts/api/transaction-services/getFilteredHistory?")
+    assert query(url) == {
+        "walletNo": "93701234567",
+        "trxnType": "ALL",
+        "fromDate": (date.today() - timedelta(days=30)).isoformat(),
+        "toDate": date.today().isoformat(),
+    }
+    assert "None" not in url
+
+def test_payload_fields_override_defaults():
+    url = GetTransactionHistory().request_url({"msisdn": "937", "transaction_type": "P2P", "from_date": "2026-01-01"})
+    assert query(url)["trxnType"] == "P2P"
+    assert query(url)["fromDate"] == "2026-01-01"
+
+def test_query_values_are_url_encoded():
+    url = GetFinalAmountAPI().request_url({"service_name": "A&B=C", "amount": "10 0", "msisdn": "+93 70"})
+    assert "A%26B%3DC" in url
+    assert query(url) == {"serviceName": "A&B=C", "channel": "USSD", "amount": "10 0", "walletNo": "+93 70"}
+
+def test_missing_required_field_is_reported_by_name():
+    with pytest.raises(MissingRequestField, match="cash_out_id"):
+        cashOutApproveRejectAPI().request_url({"msisdn": "937", "pin": "123456"})
+
+def test_missing_field_fails_the_node_call_without_a_backend_call():
+    # The service's cache and flight keys are built from request_url, before any backend call
+    with pytest.raises(MissingRequestField):
+        GetFinalAmountAPI().doPost({"msisdn": "937"})
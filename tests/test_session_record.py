@@ -0,0 +1,64 @@
+from src.gw.shared_session_store import SharedSessionManager, SQLiteKeyValueBackend
+from src.menu.graph.demo_menu_strings_ps import strings as strings_ps
+from src.menu.graph.nodes.menu_engine import MenuEngine, get_menu_graph, load_Menu_engine
+from src.ussd_handler import USSDGatewayHandler
+
+def walk(engine: MenuEngine, *inputs: str):
+    for text in inputs:
+        engine.process_user_input(text)
+
+def test_pack_unpack_round_trip_mid_dialog(demo_config):
+    # PIN, My Money, Transfer, then the first of its two steps: state on several nodes and a nav stack
+    engine = load_Menu_engine("93701234567", demo_config)
+    walk(engine, "123456", "1", "4", "0701234567")
+    data = engine.pack()
+    restored = MenuEngine.unpack(engine.graph, "93701234567", data)
+    assert restored.to_record() == engine.to_record()
+    assert restored.current_node.node_id == "transfer_menu"
+    assert [engine.graph.node_at(index).node_id for index in restored.navigation_stack] == \
+        ["root_validation_gate", "main_menu", "my_money_menu"]
+    assert restored.node_state(restored.current_node) == engine.node_state(engine.current_node)
+    # Both carry on the same way
+    assert restored.process_user_input("500") == engine.process_user_input("500")
+    assert restored.pack() == engine.pack()
+
+def test_record_leaves_out_initial_state(demo_config):
+    engine = load_Menu_engine("93701234567", demo_config)
+    current, navigation_stack, active, states = engine.to_record()
+    assert (current, navigation_stack, active, states) == (0, [], 1, [])
+    assert MenuEngine.from_record(engine.graph, "93701234567", engine.to_record()).to_record() == engine.to_record()
+
+def test_record_keeps_language_neutral_indexes(demo_config):
+    graph = get_menu_graph(demo_config)
+    variant = graph.for_language("ps") if "ps" in graph.variants else graph.add_language("ps", strings_ps)
+    engine = load_Menu_engine("93701234567", demo_config)
+    walk(engine, "123456", "1")
+    # A record unpacked on another language variant resumes at the same node, in that language
+    restored = MenuEngine.unpack(variant, "93701234567", engine.pack())
+    assert restored.current_node.node_id == engine.current_node.node_id
+    assert restored.language == "ps"
+    assert restored.get_current_prompt() != engine.get_current_prompt()
+
+def test_dialog_alternating_between_gateway_nodes_on_a_shared_sqlite_store(tmp_path, demo_config, dialog):
+    path = str(tmp_path / "sessions.db")
+    stores = [SharedSessionManager(SQLiteKeyValueBackend(path)) for _ in range(2)]
+    try:
+        nodes = [USSDGatewayHandler({"*222#": demo_config}, session_store=store) for store in stores]
+
+        class Alternating:
+            """Sends each request of the dialog to the next gateway node"""
+            requests = 0
+
+            def handle_request(self, raw_xml):
+                handler = nodes[self.requests % 2]
+                self.requests += 1
+                return handler.handle_request(raw_xml)
+
+        inputs = ("123456", "1", "4", "0701234567")
+        shared = dialog(Alternating(), "*222#", *inputs, msisdn="93700000001")
+        local = dialog(USSDGatewayHandler({"*222#": demo_config}), "*222#", *inputs, msisdn="93700000002")
+        assert shared == local
+        assert shared[-1].startswith("Enter the amount to transfer")
+    finally:
+        for store in stores:
+            store.shutdown()
@@ -0,0 +1,46 @@
+from src.menu.graph.nodes.menu_engine import get_menu_graph
+from src.ussd_handler import USSDGatewayHandler
+
+def test_split_dial_string():
+    split = USSDGatewayHandler.split_dial_string
+    assert split("*220*1*4#") == ("*220#", ("1", "4"))
+    assert split("*220#") == ("*220#", ())
+    assert split("*220**4#") == ("*220**4#", ())  # Empty key: not a shortcut
+    assert split("220*1#") == ("220*1#", ())
+    assert split("*#") == ("*#", ())
+
+def test_resolve_shortcut_walks_the_menus_past_the_pin_gate(demo_config):
+    graph = get_menu_graph(demo_config)
+    route = graph.resolve_shortcut(("1", "4"))
+    assert [graph.node_ids[index] for index in route] == ["main_menu", "my_money_menu", "transfer_menu"]
+    assert graph.resolve_shortcut(("1", "4")) is route  # Cached per key sequence
+
+def test_resolve_shortcut_rejects_keys_that_lead_nowhere(demo_config):
+    graph = get_menu_graph(demo_config)
+    assert graph.resolve_shortcut(("9",)) is None  # Back is never a way deeper
+    assert graph.resolve_shortcut(("1", "4", "1")) is None  # transfer_menu is not a menu
+    assert graph.resolve_shortcut(("12",)) is None
+
+def test_shortcut_cache_is_bounded(demo_config):
+    graph = get_menu_graph(demo_config)
+    for i in range(1100):
+        graph.resolve_shortcut(tuple(str(i)))
+    assert len(graph.shortcuts) == 1024
+    # Past the bound keys are still resolved, just not remembered
+    assert graph.resolve_shortcut(("7", "7", "7", "7", "7")) is None
+    assert ("7", "7", "7", "7", "7") not in graph.shortcuts
+
+def test_dial_string_shortcut_lands_on_the_target_after_the_pin(demo_config, dialog):
+    handler = USSDGatewayHandler({"*220#": demo_config})
+    responses = dialog(handler, "*220*1*4#", "123456")
+    assert responses[0].startswith("Enter Your My Money Pin")
+    assert responses[1].startswith("Enter the recipient's phone number")
+
+def test_unknown_shortcut_starts_at_the_main_menu(demo_config, dialog):
+    handler = USSDGatewayHandler({"*220#": demo_config})
+    responses = dialog(handler, "*220*9*9#", "123456", msisdn="93700000009")
+    assert responses[1].startswith("Main Menu")
+
+def test_unknown_service_code_is_rejected(demo_config, dialog):
+    handler = USSDGatewayHandler({"*220#": demo_config})
+    assert dialog(handler, "*999*1#", msisdn="93700000010") == ["Service not configured yet"]
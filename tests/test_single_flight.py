@@ -0,0 +1,70 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import pytest
+
+from src.services.backend_client import BackendClient
+from src.services.GetFinalAmountAPI import GetFinalAmountAPI
+
+class SlowFinalAmountHandler(BaseHTTPRequestHandler):
+    """getFinalAmount backend that answers after a delay and records every query it receives"""
+    queries = []
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        query = parse_qs(urlparse(self.path).query)
+        self.queries.append(query)
+        time.sleep(0.3)
+        body = json.dumps({"responseCode": 200, "data": {"amount": int(query["amount"][0]) + 50}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def service(monkeypatch):
+    SlowFinalAmountHandler.queries = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowFinalAmountHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = BackendClient({"retries": 0})
+    monkeypatch.setattr("src.services.service.get_backend_client", lambda: client)
+    service = GetFinalAmountAPI()
+    service.baseurl = f"http://127.0.0.1:{server.server_address[1]}/"
+    yield service
+    server.shutdown()
+    server.server_close()
+
+def payload(amount: int = 100):
+    return {"service_name": "TOPUP", "amount": amount, "msisdn": "93700000001"}
+
+def test_concurrent_calls_share_one_backend_call(service):
+    with ThreadPoolExecutor(2) as pool:
+        results = list(pool.map(lambda _: service.doPost(payload()), range(2)))
+    assert results == [{"status": True, "data": {"amount": 150}}] * 2
+    assert len(SlowFinalAmountHandler.queries) == 1
+    assert SlowFinalAmountHandler.queries[0]["walletNo"] == ["93700000001"]
+    assert service.backend.single_flight.metrics()["shared"] == 1
+
+def test_concurrent_async_calls_share_one_backend_call(service):
+    async def main():
+        try:
+            return await asyncio.gather(service.doPostAsync(payload()), service.doPostAsync(payload()))
+        finally:
+            await service.backend.close_async_session()
+    assert asyncio.run(main()) == [{"status": True, "data": {"amount": 150}}] * 2
+    assert len(SlowFinalAmountHandler.queries) == 1
+
+def test_calls_with_different_query_data_are_not_shared(service):
+    with ThreadPoolExecutor(2) as pool:
+        results = list(pool.map(lambda amount: service.doPost(payload(amount)), (100, 200)))
+    assert [result["data"]["amount"] for result in results] == [150, 250]
+    assert len(SlowFinalAmountHandler.queries) == 2